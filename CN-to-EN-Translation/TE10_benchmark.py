@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Translation Engine v10.1 — Wrapper Micro-Benchmarks
+Compares the wrapper's hot paths against the previous reference
+implementations, checking that results are identical before timing them.
+
+Usage:
+    python TE10_benchmark.py                 # all benchmarks
+    python TE10_benchmark.py classifier      # one benchmark
+"""
+
+import random
+import re
+import sys
+import time
+
+import TE10_wrapper_minimal as te
+
+
+def _timeit(fn, *args, repeat: int = 3) -> float:
+    """Best-of-N wall time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _synthetic_payload(paragraphs: int, seed: int = 7) -> str:
+    """Mixed CJK/Latin Markdown with headings, inline code and blank lines."""
+    rng = random.Random(seed)
+    cjk = "部署框架协议端点延迟吞吐合同诉讼条款患者临床剂量论文引用审稿"
+    latin = ["deploy", "latency", "endpoint", "kubernetes", "RFC-7231", "don't", "v2"]
+    out = []
+    for i in range(paragraphs):
+        if i % 25 == 0:
+            out.append(f"## Section {i // 25}\n")
+        words = []
+        for _ in range(rng.randint(20, 60)):
+            r = rng.random()
+            if r < 0.5:
+                words.append("".join(rng.choice(cjk) for _ in range(rng.randint(2, 8))))
+            elif r < 0.9:
+                words.append(rng.choice(latin))
+            else:
+                words.append(f"`{rng.choice(latin)}()`")
+        out.append(" ".join(words) + "。\n")
+    return "\n".join(out)
+
+
+# ---------------------------------------------------------------------------
+# Reference implementations (pre-TextStats) — kept verbatim for comparison
+# ---------------------------------------------------------------------------
+def legacy_count_effective_words(payload: str) -> int:
+    cjk_chars = sum(1 for c in payload if te._is_cjk_ideograph(c))
+    latin_words = len(re.findall(r"[a-zA-Z][a-zA-Z0-9'-]*", payload))
+    return int(cjk_chars * 0.6 + latin_words)
+
+
+def legacy_estimate_tokens(payload: str) -> int:
+    cjk_chars = sum(1 for c in payload if te._is_cjk_ideograph(c))
+    latin_words = len(re.findall(r"[a-zA-Z][a-zA-Z0-9'-]*", payload))
+    inline_code = len(re.findall(r"`[^`]+`", payload))
+    return int(cjk_chars * 1.5 + latin_words * 1.3 + inline_code * 0.5)
+
+
+def legacy_pack(parts: list[str], max_words: int) -> list[str]:
+    segments: list[str] = []
+    current = ""
+    for part in parts:
+        if current and legacy_count_effective_words(current + part) > max_words:
+            segments.append(current.strip())
+            current = part
+        else:
+            current += part
+    if current.strip():
+        segments.append(current.strip())
+    return segments
+
+
+def bench_textstats() -> None:
+    # Differential check on adversarial boundaries (split words, backticks).
+    rng = random.Random(1)
+    alphabet = "ab1'-` \n部署。"
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        cut = sorted(rng.randint(0, len(text)) for _ in range(3))
+        stats = te.TextStats()
+        for a, b in zip([0] + cut, cut + [len(text)]):
+            stats.add(text[a:b])
+        assert stats.effective_words == legacy_count_effective_words(text), repr(text)
+        assert stats.estimated_tokens == legacy_estimate_tokens(text), repr(text)
+
+    print(f"{'payload':>10} {'parts':>6} {'legacy pack':>12} {'TextStats':>10} {'speedup':>8}")
+    for paragraphs in (100, 250, 600):
+        payload = _synthetic_payload(paragraphs)
+        parts = re.split(r"\n\s*\n", payload)
+        # One oversized segment is the quadratic worst case for the old packer.
+        limit = 10 ** 9
+        assert te._pack_segments(parts, 800) == legacy_pack(parts, 800)
+        old = _timeit(legacy_pack, parts, limit, repeat=1)
+        new = _timeit(te._pack_segments, parts, limit)
+        print(
+            f"{len(payload) / 1024:>8.0f}KB {len(parts):>6} "
+            f"{old * 1000:>10.1f}ms {new * 1000:>8.1f}ms {old / new:>7.1f}x"
+        )
+
+    payload = _synthetic_payload(2000)
+    old = _timeit(lambda p: (legacy_count_effective_words(p), legacy_estimate_tokens(p)), payload)
+    new = _timeit(lambda p: (te.TextStats(p).effective_words, te.TextStats(p).estimated_tokens), payload)
+    print(f"estimate_tokens + count_effective_words on {len(payload) // 1024}KB: "
+          f"{old * 1000:.1f}ms -> {new * 1000:.1f}ms")
+
+
+def legacy_classify_scores(text: str, keywords: dict[str, list[str]]) -> dict[str, int]:
+    head = text.lower()
+    return {
+        domain: sum(1 for kw in kws if kw.lower() in head)
+        for domain, kws in keywords.items()
+    }
+
+
+def reference_matches(text: str, keywords: list[str]) -> dict[str, int]:
+    low = text.lower()
+    counts = {}
+    for kw in keywords:
+        n = sum(
+            1 for m in re.finditer(f"(?={re.escape(kw)})", low)
+            if te._starts_word(low, m.start(), kw)
+        )
+        if n:
+            counts[kw] = n
+    return counts
+
+
+def _synthetic_corpus(docs: int, chars: int, seed: int = 11) -> list[str]:
+    """Documents mixing one domain's vocabulary with neutral filler."""
+    rng = random.Random(seed)
+    classifier = te.get_domain_classifier()
+    by_domain: dict[str, list[str]] = {}
+    for kw, per_domain in classifier.weights.items():
+        for domain in per_domain:
+            by_domain.setdefault(domain, []).append(kw)
+    filler = ["的", "我们", "the", "system", "在", "report", "and", "数据", "results", "。"]
+    corpus = []
+    for _ in range(docs):
+        vocab = by_domain[rng.choice(sorted(by_domain))]
+        words, size = [], 0
+        while size < chars:
+            words.append(rng.choice(vocab) if rng.random() < 0.08 else rng.choice(filler))
+            size += len(words[-1]) + 1
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def bench_classifier() -> None:
+    classifier = te.get_domain_classifier()
+    keywords = list(classifier.weights)
+    by_domain: dict[str, list[str]] = {}
+    for kw, per_domain in classifier.weights.items():
+        for domain in per_domain:
+            by_domain.setdefault(domain, []).append(kw)
+
+    corpus = _synthetic_corpus(10_000, 4_000)
+    # Matcher parity: same counts as one overlapping regex scan per keyword,
+    # with and without the automaton.
+    fallback = te.DomainClassifier(classifier.weights)
+    fallback._automaton = None
+    for doc in corpus[:500]:
+        expected = reference_matches(doc, keywords)
+        assert classifier.matches(doc) == expected
+        assert fallback.matches(doc) == expected
+
+    total_kb = sum(len(d) for d in corpus) // 1024
+    engine = "Aho-Corasick" if classifier._automaton is not None else "str.count fallback"
+    print(f"{len(corpus)} documents, {total_kb}KB, {len(keywords)} weighted keywords ({engine})")
+    for label, window in (("first 300 chars", 300), ("whole document", 0)):
+        docs = [d[:window] if window else d for d in corpus]
+        old = _timeit(lambda ds: [legacy_classify_scores(d, by_domain) for d in ds], docs, repeat=1)
+        new = _timeit(lambda ds: [classifier.classify(d) for d in ds], docs, repeat=1)
+        print(f"{label:>16}: per-keyword scan {old:.2f}s -> compiled matcher {new:.2f}s "
+              f"({old / new:.1f}x)")
+
+
+BENCHMARKS = {
+    "textstats": bench_textstats,
+    "classifier": bench_classifier,
+}
+
+
+def main() -> None:
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark '{name}'. Available: {', '.join(BENCHMARKS)}", file=sys.stderr)
+            sys.exit(2)
+        print(f"== {name} ==")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,19 +4,40 @@ Translation Engine v10.1 — Minimal Wrapper
 Implements: scratchpad stripping (§3.2), mode-flag injection (§3.4),
 few-shot injection (§3.5), domain pack injection (§14.4),
 domain pre-classification (§14.4 two-stage protocol),
-size-aware Draft-Lock tier signaling (§4.7), and payload
-segmentation at section/paragraph boundaries for oversized inputs.
+size-aware Draft-Lock tier signaling (§4.7), payload
+segmentation at section/paragraph boundaries for oversized inputs with a
+carry-over glossary between segments (§14.1),
+concurrent segment translation with retry/backoff, a persistent
+content-addressed translation cache (SQLite) for incremental re-runs, and
+a resumable batch mode over a directory or JSONL manifest. --stream
+forwards translated text as it is generated, once the scratchpad closes.
+The static zone (§3.7) is canonicalized and sent byte-identical on every
+call; cached vs. uncached prompt tokens are reported, and a warning is
+logged when a prompt edit breaks prefix reuse since the last run.
 
 Usage:
     python TE10_wrapper_minimal.py --domain=engineering --scratchpad=full < input.md > output.md
+    python TE10_wrapper_minimal.py --concurrency=8 large_manual.md > output.md
+    python TE10_wrapper_minimal.py --batch=docs/ --concurrency=8
+    python TE10_wrapper_minimal.py --stream < input.md
 
 Requires: openai>=1.0 (or any OpenAI-compatible SDK)
+Optional: pyahocorasick (single-pass domain classification)
 """
 
 import argparse
+import hashlib
+import json
+import math
 import os
+import random
 import re
+import sqlite3
 import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -34,6 +55,26 @@ PACK_FILES = {
     "academic": "TE10_Pack_Academic.md",
 }
 
+# Segment pipeline defaults (Segmented Draft-Lock, §4.7)
+DEFAULT_CONCURRENCY = 1   # parallel in-flight segment calls
+DEFAULT_RETRIES = 2       # extra attempts per failed segment
+RETRY_BACKOFF_BASE = 1.0  # seconds; doubled per attempt, plus jitter
+
+# Persistent translation cache (content-addressed, see TranslationCache)
+CACHE_PATH = os.environ.get(
+    "TE10_CACHE_PATH",
+    str(Path.home() / ".cache" / "te10" / "translations.sqlite3"),
+)
+CACHE_MAX_AGE_DAYS = 90   # entries older than this are evicted
+CACHE_MAX_MB = 512        # least-recently-used entries evicted beyond this
+
+# Static-zone (prompt-prefix) hashes from the previous run, per model+domain,
+# used to warn when a prompt edit invalidates provider-side prompt caching.
+PREFIX_STATE_PATH = os.environ.get(
+    "TE10_PREFIX_STATE_PATH",
+    str(Path(CACHE_PATH).parent / "prefix_state.json"),
+)
+
 # Domain keyword heuristic (§14.4 Stage 1)
 DOMAIN_KEYWORDS = {
     "legal": [
@@ -69,26 +110,174 @@ DOMAIN_KEYWORDS = {
 # ---------------------------------------------------------------------------
 # Domain Pre-Classification (§14.4 Stage 1)
 # ---------------------------------------------------------------------------
-def classify_domain(payload_head: str, explicit_domain: str | None = None) -> str:
-    """Classify domain from first 300 chars of payload.
-    If explicit_domain is provided and valid, use it directly.
+CLASSIFY_WINDOW = 300        # chars scored by default; 0 = whole document
+CLASSIFY_MIN_SCORE = 2.0     # distinct-keyword score below this -> engineering
+PACK_TRIGGER_WEIGHT = 1.0    # pack TRIGGER: line terms
+PACK_COLLOCATION_WEIGHT = 0.5  # pack COLLOCATION TABLE source phrases
+
+
+class DomainClassifier:
+    """Weighted multi-keyword domain scorer, compiled once per process.
+
+    With the optional pyahocorasick package, all keywords are compiled into a
+    single Aho-Corasick automaton and the lowercased text is scored in one
+    linear pass, independent of the number of keywords. Without it, each
+    precompiled lowercase keyword is searched with str.find (C-level
+    substring search). Both count overlapping occurrences, and a keyword
+    starting with a Latin letter or digit must start a word, so "trial"
+    does not fire inside "industrial" while "papers" still counts as "paper".
+    """
+
+    def __init__(self, weights: dict[str, dict[str, float]]):
+        # weights: lowercased keyword -> {domain: weight}
+        self.weights = weights
+        self._keywords = list(weights)
+        self._automaton = None
+        try:
+            import ahocorasick
+        except ImportError:
+            return
+        automaton = ahocorasick.Automaton()
+        for kw in self._keywords:
+            automaton.add_word(kw, kw)
+        if self._keywords:
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    @classmethod
+    def from_config(cls, pack_dir: str = PACK_DIR) -> "DomainClassifier":
+        """Build from DOMAIN_KEYWORDS plus each domain pack's TRIGGER line and
+        COLLOCATION TABLE source phrases (missing packs are skipped).
+        """
+        weights: dict[str, dict[str, float]] = {}
+
+        def add(term: str, domain: str, weight: float) -> None:
+            term = term.strip().strip('"“”').lower()
+            if len(term) >= 2:
+                per_kw = weights.setdefault(term, {})
+                per_kw[domain] = max(per_kw.get(domain, 0.0), weight)
+
+        for domain, keywords in DOMAIN_KEYWORDS.items():
+            for kw in keywords:
+                add(kw, domain, 1.0)
+        for domain, filename in PACK_FILES.items():
+            path = Path(pack_dir) / filename
+            if not path.exists():
+                continue
+            in_collocations = False
+            for line in path.read_text(encoding="utf-8").splitlines():
+                if line.startswith("TRIGGER:"):
+                    for term in line[len("TRIGGER:"):].split(","):
+                        add(term, domain, PACK_TRIGGER_WEIGHT)
+                elif line.startswith("## "):
+                    in_collocations = "COLLOCATION TABLE" in line
+                elif in_collocations and line.startswith("|") and not line.startswith("|---"):
+                    cell = line.split("|")[1]
+                    if not cell.strip().startswith("Source"):
+                        # "桌面拒稿 / 秒拒": alternative phrasings
+                        for term in cell.split("/"):
+                            add(term, domain, PACK_COLLOCATION_WEIGHT)
+        return cls(weights)
+
+    def matches(self, text: str) -> dict[str, int]:
+        """Occurrence count per keyword found in text (case-insensitive)."""
+        text = text.lower()
+        counts: dict[str, int] = {}
+        if self._automaton is None:
+            for kw in self._keywords:
+                start = text.find(kw)
+                while start >= 0:
+                    if _starts_word(text, start, kw):
+                        counts[kw] = counts.get(kw, 0) + 1
+                    start = text.find(kw, start + 1)
+        else:
+            for end, kw in self._automaton.iter(text):
+                if _starts_word(text, end - len(kw) + 1, kw):
+                    counts[kw] = counts.get(kw, 0) + 1
+        return counts
+
+    def scores(self, text: str) -> dict[str, float]:
+        """Per-domain score: sum of keyword weights, with diminishing credit
+        (1 + ln count) for repeats so long documents are not dominated by one
+        frequent term.
+        """
+        return self._score(text)[0]
+
+    def _score(self, text: str) -> tuple[dict[str, float], dict[str, float]]:
+        """(scores, distinct): distinct counts each matched keyword once."""
+        scores = {d: 0.0 for d in DOMAIN_KEYWORDS}
+        distinct = dict(scores)
+        for kw, count in self.matches(text).items():
+            for domain, weight in self.weights[kw].items():
+                scores[domain] = scores.get(domain, 0.0) + weight * (1 + math.log(count))
+                distinct[domain] = distinct.get(domain, 0.0) + weight
+        return scores, distinct
+
+    def classify(self, text: str) -> tuple[str, float, dict[str, float]]:
+        """Return (domain, confidence, scores). Confidence is the winning
+        domain's share of the total score (0.0 when nothing matched).
+        The scores rank the domains; the thresholds below count each
+        matched keyword once (by weight), as the original heuristic did,
+        so one keyword repeated cannot classify a document on its own.
+        """
+        scores, distinct = self._score(text)
+        total = sum(scores.values())
+        best = max(scores, key=scores.get)  # type: ignore[arg-type]
+        # Specific domain beats generic engineering fallback:
+        # when academic and engineering both score >= 2, prefer academic.
+        if distinct["academic"] >= CLASSIFY_MIN_SCORE and distinct["engineering"] >= CLASSIFY_MIN_SCORE:
+            best = "academic"
+        elif distinct[best] < CLASSIFY_MIN_SCORE:
+            best = "engineering"  # default
+        return best, (scores[best] / total if total else 0.0), scores
+
+
+def _starts_word(text: str, start: int, kw: str) -> bool:
+    """False if a keyword starting with a Latin letter or digit is found in
+    the middle of a word ("trial" in "industrial"); CJK keywords always match.
+    """
+    return not (
+        start > 0
+        and kw[0].isascii() and kw[0].isalnum()
+        and text[start - 1].isascii() and text[start - 1].isalnum()
+    )
+
+
+_domain_classifier: DomainClassifier | None = None
+_domain_classifier_lock = threading.Lock()
+
+
+def get_domain_classifier() -> DomainClassifier:
+    """Process-wide DomainClassifier, built on first use."""
+    global _domain_classifier
+    with _domain_classifier_lock:
+        if _domain_classifier is None:
+            _domain_classifier = DomainClassifier.from_config()
+        return _domain_classifier
+
+
+def classify_domain_scored(
+    payload: str, explicit_domain: str | None = None, window: int = CLASSIFY_WINDOW
+) -> tuple[str, float]:
+    """Classify domain from the first `window` chars (0 = whole payload).
+    Returns (domain, confidence); an explicit valid domain has confidence 1.0.
     """
     if explicit_domain and explicit_domain in PACK_FILES:
-        return explicit_domain
+        return explicit_domain, 1.0
     if explicit_domain == "general":
-        return "general"
+        return "general", 1.0
+    text = payload[:window] if window else payload
+    domain, confidence, _ = get_domain_classifier().classify(text)
+    return domain, confidence
 
-    head = payload_head[:300].lower()
-    scores = {
-        domain: sum(1 for kw in keywords if kw.lower() in head)
-        for domain, keywords in DOMAIN_KEYWORDS.items()
-    }
-    best = max(scores, key=scores.get)  # type: ignore[arg-type]
-    # Specific domain beats generic engineering fallback:
-    # when academic and engineering both score >= 2, prefer academic.
-    if scores["academic"] >= 2 and scores["engineering"] >= 2:
-        return "academic"
-    return best if scores[best] >= 2 else "engineering"  # default
+
+def classify_domain(
+    payload_head: str, explicit_domain: str | None = None, window: int = CLASSIFY_WINDOW
+) -> str:
+    """Classify domain from first `window` chars of payload (default 300).
+    If explicit_domain is provided and valid, use it directly.
+    """
+    return classify_domain_scored(payload_head, explicit_domain, window)[0]
 
 
 # ---------------------------------------------------------------------------
@@ -113,15 +302,94 @@ def _is_cjk_ideograph(ch: str) -> bool:
     )
 
 
+# One-pass scanner shared by TextStats: runs of CJK ideographs (same ranges
+# as _is_cjk_ideograph), Latin words, and backticks (inline-code delimiters).
+_TEXT_STATS_RE = re.compile(
+    r"(?P<cjk>[\u4E00-\u9FFF\u3400-\u4DBF\uF900-\uFAFF\U00020000-\U0002A6DF]+)"
+    r"|(?P<word>[a-zA-Z][a-zA-Z0-9'-]*)"
+    r"|(?P<tick>`)"
+)
+_WORD_CONTINUATION_RE = re.compile(r"[a-zA-Z0-9'-]*")
+
+
+class TextStats:
+    """Running CJK / Latin-word / inline-code totals over appended text.
+
+    Each appended part is scanned once with a single regex, and state that
+    straddles part boundaries (a Latin word split across parts, an open
+    inline-code backtick) is carried over, so totals always equal those of
+    the concatenated text. Appending is O(len(part)), which keeps
+    segment_payload() linear in payload size.
+    """
+
+    __slots__ = ("cjk_chars", "latin_words", "inline_code", "length", "_in_word", "_tick_at")
+
+    def __init__(self, text: str = ""):
+        self.cjk_chars = 0
+        self.latin_words = 0
+        self.inline_code = 0
+        self.length = 0
+        self._in_word = False          # accumulated text ends inside a Latin word
+        self._tick_at: int | None = None  # offset of an unmatched opening backtick
+        if text:
+            self.add(text)
+
+    def copy(self) -> "TextStats":
+        clone = TextStats()
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+    def add(self, text: str) -> "TextStats":
+        """Append text in place; returns self."""
+        if not text:
+            return self
+        base = self.length
+        # A word in progress absorbs the leading run of word-continuation
+        # characters, so a word starting inside that run is not a new word.
+        lead = _WORD_CONTINUATION_RE.match(text).end() if self._in_word else 0
+        last_word_end = -1
+        for m in _TEXT_STATS_RE.finditer(text):
+            kind = m.lastgroup
+            if kind == "cjk":
+                self.cjk_chars += m.end() - m.start()
+            elif kind == "word":
+                if m.start() >= lead:
+                    self.latin_words += 1
+                last_word_end = m.end()
+            else:
+                # `[^`]+` pairing: a backtick closes an open span only when
+                # something lies between them; otherwise it reopens.
+                pos = base + m.start()
+                if self._tick_at is not None and pos > self._tick_at + 1:
+                    self.inline_code += 1
+                    self._tick_at = None
+                else:
+                    self._tick_at = pos
+        self._in_word = last_word_end == len(text) or (self._in_word and lead == len(text))
+        self.length = base + len(text)
+        return self
+
+    def appended(self, text: str) -> "TextStats":
+        """Stats for self + text, leaving self unchanged."""
+        return self.copy().add(text)
+
+    @property
+    def effective_words(self) -> int:
+        return int(self.cjk_chars * 0.6 + self.latin_words)
+
+    @property
+    def estimated_tokens(self) -> int:
+        return int(self.cjk_chars * 1.5 + self.latin_words * 1.3 + self.inline_code * 0.5)
+
+
 def count_effective_words(payload: str) -> int:
     """Count 'words' for the segmentation threshold, accounting for CJK.
     Unspaced CJK text is undercounted by str.split(), so each CJK ideograph
     is weighted ~0.6 'words' (one char roughly carries one word of meaning).
     Full-width CJK punctuation is not counted (see _is_cjk_ideograph).
     """
-    cjk_chars = sum(1 for c in payload if _is_cjk_ideograph(c))
-    latin_words = len(re.findall(r"[a-zA-Z][a-zA-Z0-9'-]*", payload))
-    return int(cjk_chars * 0.6 + latin_words)
+    return TextStats(payload).effective_words
 
 
 def estimate_tokens(payload: str) -> int:
@@ -129,10 +397,7 @@ def estimate_tokens(payload: str) -> int:
     CJK ideographs: ~1.5 tokens/char; Latin: ~1.3 tokens/word; inline
     code span: ~0.5 tokens/pair. Full-width punctuation excluded.
     """
-    cjk_chars = sum(1 for c in payload if _is_cjk_ideograph(c))
-    latin_words = len(re.findall(r"[a-zA-Z][a-zA-Z0-9'-]*", payload))
-    inline_code = len(re.findall(r"`[^`]+`", payload))
-    return int(cjk_chars * 1.5 + latin_words * 1.3 + inline_code * 0.5)
+    return TextStats(payload).estimated_tokens
 
 
 def should_segment(payload: str) -> bool:
@@ -140,6 +405,30 @@ def should_segment(payload: str) -> bool:
     return count_effective_words(payload) > SEGMENT_WORD_THRESHOLD
 
 
+def _pack_segments(parts: list[str], max_words: int) -> list[str]:
+    """Greedily join consecutive parts into stripped segments of at most
+    max_words effective words (a single larger part stays on its own).
+    """
+    # Running TextStats: each part is scanned once (twice when it opens a
+    # new segment) instead of rescanning the growing accumulator.
+    segments: list[str] = []
+    current: list[str] = []
+    stats = TextStats()
+    for part in parts:
+        grown = stats.appended(part)
+        if stats.length and grown.effective_words > max_words:
+            segments.append("".join(current).strip())
+            current = [part]
+            stats = TextStats(part)
+        else:
+            current.append(part)
+            stats = grown
+    tail = "".join(current).strip()
+    if tail:
+        segments.append(tail)
+    return segments
+
+
 def segment_payload(payload: str, max_words: int = SEGMENT_WORD_THRESHOLD) -> list[str]:
     """Segment payload at section/paragraph/sentence boundaries for Draft-Lock.
     Three-pass progressive fallback:
@@ -153,17 +442,7 @@ def segment_payload(payload: str, max_words: int = SEGMENT_WORD_THRESHOLD) -> li
         return [payload]
 
     def _pack(parts: list[str]) -> list[str]:
-        segments: list[str] = []
-        current = ""
-        for part in parts:
-            if current and count_effective_words(current + part) > max_words:
-                segments.append(current.strip())
-                current = part
-            else:
-                current += part
-        if current.strip():
-            segments.append(current.strip())
-        return segments or [payload.strip()]
+        return _pack_segments(parts, max_words) or [payload.strip()]
 
     # Pass 1: split at H1/H2 headings and horizontal rules
     parts = re.split(r"\n(?=#{1,2}\s)|\n(?=---\s*\n)", payload)
@@ -355,6 +634,268 @@ def strip_scratchpad(raw_output: str) -> tuple[str, str]:
         return "", raw_output.strip()
 
 
+class ScratchpadStreamParser:
+    """Incremental counterpart of strip_scratchpad() for streamed output.
+
+    feed() accepts raw completion deltas as they arrive and returns the
+    payload text that is safe to emit: nothing up to and inside
+    <engine_logs> (strip_scratchpad() drops text before the tag too), then
+    everything after </engine_logs> with the same leading-whitespace,
+    leading '---' rule and trailing-whitespace handling as strip_scratchpad().
+    Output without the tag (the --scratchpad=none shape) or with an unclosed
+    one is held back until the stream ends, when finish() returns the rest
+    of the final payload. Tags split across deltas are handled.
+    """
+
+    OPEN = "<engine_logs>"
+    CLOSE = "</engine_logs>"
+
+    def __init__(self):
+        self._raw: list[str] = []
+        self._state = "start"  # start -> logs -> head -> body
+        self._buf = ""
+        self._pending_ws = ""
+        self._out: list[str] = []
+
+    @property
+    def raw(self) -> str:
+        return "".join(self._raw)
+
+    @property
+    def streamed(self) -> str:
+        """Payload text returned by feed() and finish() so far."""
+        return "".join(self._out)
+
+    @property
+    def emitted(self) -> bool:
+        return bool(self._out)
+
+    def feed(self, chunk: str) -> str:
+        self._raw.append(chunk)
+        self._buf += chunk
+        out = self._advance()
+        if out:
+            self._out.append(out)
+        return out
+
+    def finish(self, payload: str) -> str:
+        """Return what is left to emit of the final payload once the stream ends.
+
+        payload is the completed result (see _finish_translation()). If it
+        replaces text already streamed (the truncation notice), it is
+        returned whole, on a new line.
+        """
+        streamed = self.streamed
+        if payload.startswith(streamed):
+            rest = payload[len(streamed):]
+        else:
+            rest = "\n" + payload
+        if rest:
+            self._out.append(rest)
+        return rest
+
+    def _advance(self) -> str:
+        if self._state == "start":
+            if not self._skip_to(self.OPEN):
+                return ""
+            self._state = "logs"
+        if self._state == "logs":
+            if not self._skip_to(self.CLOSE):
+                return ""
+            self._state = "head"
+        if self._state == "head":
+            head = self._buf.lstrip()
+            if not head or "---".startswith(head):
+                return ""
+            if head.startswith("---"):
+                # Mirror re.sub(r"^---\s*\n", ...): drop '---' through the
+                # last newline of the whitespace run that follows it.
+                m = re.match(r"---(\s*)", head)
+                if m.end() == len(head):
+                    return ""  # whitespace run may continue in the next delta
+                ws = m.group(1)
+                if "\n" in ws:
+                    head = head[3 + ws.rindex("\n") + 1:]
+            self._state = "body"
+            self._buf = head
+        # body: forward everything except trailing whitespace, which is held
+        # back until more text follows (payload is .strip()'d on completion).
+        text = self._pending_ws + self._buf
+        self._buf = ""
+        out = text.rstrip()
+        self._pending_ws = text[len(out):]
+        return out
+
+    def _skip_to(self, tag: str) -> bool:
+        """Drop buffered text through tag; False (keeping a tail) if not seen yet."""
+        idx = self._buf.find(tag)
+        if idx < 0:
+            # Only the tail can still hold the start of a split tag.
+            self._buf = self._buf[max(0, len(self._buf) - len(tag) + 1):]
+            return False
+        self._buf = self._buf[idx + len(tag):]
+        return True
+
+
+# ---------------------------------------------------------------------------
+# Carry-Over Glossary (§14.1) — extracted from scratchpads, bounded
+# ---------------------------------------------------------------------------
+GLOSSARY_MAX_ENTRIES = 120      # carry-over block size bound (entries)
+GLOSSARY_MAX_TERM_CHARS = 80    # longer "terms" are sentences, not glossary items
+GLOSSARY_CERTAINTIES = ("locked-standard", "locked-context", "candidate")  # strongest first
+CARRY_OVER_MODES = ("chapter", "chain", "off")
+
+# A scratchpad mapping line: `src → "target" (note)`. Label lines such as
+# `IU-1: "x" → y` or `Register match: a → b` are rejected by the ':'-free source.
+_GLOSSARY_ITEM_RE = re.compile(
+    r'^[-*]?\s*["“「]?(?P<src>[^"”」:：→]+?)["”」]?\s*(?:→|->|=>)\s*'
+    r'["“「]?(?P<tgt>[^"”」(（]+)["”」]?(?P<rest>.*)$'
+)
+_GLOSSARY_LABEL_RE = re.compile(
+    r"^[-*]?\s*(?:Terminology choices|(?:Carry-over |Locked )?Glossary)\s*:\s*(.*)$",
+    re.IGNORECASE,
+)
+
+
+def extract_glossary(scratchpad: str) -> list[tuple[str, str, str]]:
+    """Extract (source, target, certainty) term mappings from a scratchpad.
+    Reads `src → target` lines under a Phase 3 or Glossary heading, and the
+    items of (and bullets after) a `Terminology choices:` / `Glossary:` field. Certainty comes from a
+    locked-standard/locked-context/candidate tag when present, otherwise
+    locked-context (the engine's own prior rendering, §12.3 rung 2).
+    """
+    entries: list[tuple[str, str, str]] = []
+    in_section = False
+    for line in scratchpad.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            in_section = bool(re.search(r"Phase 3|Glossary", stripped, re.IGNORECASE))
+            continue
+        label = _GLOSSARY_LABEL_RE.match(stripped)
+        if label:
+            # Inline items, then any bullet lines that follow the field.
+            items = re.split(r"[;；]", label.group(1))
+            in_section = True
+        elif in_section:
+            items = [stripped]
+        else:
+            continue
+        for item in items:
+            m = _GLOSSARY_ITEM_RE.match(item.strip())
+            if not m:
+                continue
+            src, tgt = m.group("src").strip(), m.group("tgt").strip().rstrip(".,;")
+            if not src or not tgt or max(len(src), len(tgt)) > GLOSSARY_MAX_TERM_CHARS:
+                continue
+            certainty = next(
+                (c for c in GLOSSARY_CERTAINTIES if c in m.group("rest")), "locked-context"
+            )
+            entries.append((src, tgt, certainty))
+    return entries
+
+
+class Glossary:
+    """Carry-over glossary state: source term -> (rendering, certainty).
+
+    Entries keep first-occurrence order (§14.1). A term is only re-rendered
+    by a strictly stronger certainty, so the first locked choice sticks.
+    Past max_entries the weakest, oldest entry is dropped, which bounds the
+    carry-over block pasted into every following segment.
+    """
+
+    def __init__(
+        self,
+        entries: list[tuple[str, str, str]] | None = None,
+        max_entries: int = GLOSSARY_MAX_ENTRIES,
+    ):
+        self.max_entries = max_entries
+        self.entries: dict[str, tuple[str, str]] = {}
+        for src, tgt, certainty in entries or []:
+            self.add(src, tgt, certainty)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, source: str, target: str, certainty: str = "locked-context") -> None:
+        if certainty not in GLOSSARY_CERTAINTIES:
+            certainty = "candidate"
+        existing = self.entries.get(source)
+        if existing and GLOSSARY_CERTAINTIES.index(certainty) >= GLOSSARY_CERTAINTIES.index(existing[1]):
+            return
+        self.entries[source] = (target, certainty)
+        while len(self.entries) > self.max_entries:
+            weakest = max(self.entries.values(), key=lambda e: GLOSSARY_CERTAINTIES.index(e[1]))[1]
+            del self.entries[next(k for k, e in self.entries.items() if e[1] == weakest)]
+
+    def copy(self) -> "Glossary":
+        return Glossary(self.items(), self.max_entries)
+
+    def items(self) -> list[tuple[str, str, str]]:
+        return [(src, tgt, c) for src, (tgt, c) in self.entries.items()]
+
+    def merge_scratchpad(self, scratchpad: str) -> "Glossary":
+        """Adopt the term mappings a finished segment recorded; returns self."""
+        for src, tgt, certainty in extract_glossary(scratchpad):
+            self.add(src, tgt, certainty)
+        return self
+
+    def render(self, text: str | None = None) -> str:
+        """The carry-over block pasted at the head of the next segment.
+        With text, only the entries whose source term occurs in it are
+        listed, so the block (and the segment's cache key) does not change
+        when an earlier segment adds terms this one never uses.
+        """
+        lines = [
+            f"- {src} → {tgt} ({c})" for src, tgt, c in self.items()
+            if text is None or src in text
+        ]
+        if not lines:
+            return ""
+        return "[Carry-over glossary (§14.1)]\n" + "\n".join(lines)
+
+    @classmethod
+    def load(cls, path: str, entries: bool = False) -> "Glossary":
+        """Load the seed glossary from a JSON file written by save() (or a
+        plain [[source, target, certainty], ...] list). With entries=True the
+        merged glossary of the previous run is loaded after the seed instead,
+        so its terms carry over. Missing file -> empty.
+        """
+        p = Path(path)
+        if not p.exists():
+            return cls()
+        data = json.loads(p.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            return cls([tuple(e) for e in data])
+        stored = data.get("seed", []) + (data.get("entries", []) if entries else [])
+        return cls([tuple(e) for e in stored])
+
+    def save(self, path: str, seed: "Glossary") -> None:
+        """Atomically write {seed, entries}. The seed is kept separate so a
+        re-run starts from the same glossary (and hits the same cache keys).
+        """
+        data = {"seed": seed.items(), "entries": self.items()}
+        tmp = Path(f"{path}.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def plan_carry_over(segments: list[str], mode: str = "chapter") -> list[int | None]:
+    """Return each segment's glossary predecessor (None = starts a chain).
+    chain: every segment waits for the previous one (fully sequential).
+    chapter: a segment opening with an H1 or H2 heading starts an independent
+    chain, so sections translate in parallel while sharing a glossary within
+    (a document with a single H1 title still parallelises by its H2s).
+    off: no carry-over; all segments are independent.
+    """
+    preds: list[int | None] = []
+    for i, segment in enumerate(segments):
+        if i == 0 or mode == "off" or (mode == "chapter" and re.match(r"#{1,2}\s", segment)):
+            preds.append(None)
+        else:
+            preds.append(i - 1)
+    return preds
+
+
 # ---------------------------------------------------------------------------
 # System Prompt Assembly
 # ---------------------------------------------------------------------------
@@ -380,37 +921,33 @@ def assemble_system_prompt(domain: str) -> str:
 # ---------------------------------------------------------------------------
 # Main Translation Call
 # ---------------------------------------------------------------------------
-def translate(
+class TranslationError(RuntimeError):
+    """Raised when a translation API call fails (retryable by the caller).
+    partial_output is set when a streamed call had already emitted payload
+    text; retrying it would duplicate that text, so callers must not.
+    """
+
+    def __init__(self, message: str, partial_output: bool = False):
+        super().__init__(message)
+        self.partial_output = partial_output
+
+
+def build_user_message(
     payload: str,
     domain: str,
     scratchpad_tier: str = "full",
     mode_flags: list[str] | None = None,
-    model: str = "gpt-4o",
-    api_base: str | None = None,
-) -> tuple[str, str]:
-    """Execute a single translation call.
-    Returns (scratchpad, translated_payload).
+    glossary: str = "",
+) -> str:
+    """Build the per-call user turn: carry-over glossary, mode rules,
+    advisories, token budget, payload.
     """
-    try:
-        from openai import OpenAI
-    except ImportError:
-        print("ERROR: pip install openai", file=sys.stderr)
-        sys.exit(1)
-
-    client = OpenAI(
-        api_key=os.environ.get("OPENAI_API_KEY", ""),
-        base_url=api_base,
-    )
-
-    system_prompt = assemble_system_prompt(domain)
-
-    # Build message list: system, few-shot prior turns (§3.5), user request.
-    messages: list[dict] = [{"role": "system", "content": system_prompt}]
-    messages.extend(load_fewshot_messages(domain))
-
-    # Build user message with mode flags, domain advisory, and token budget
     user_parts = []
 
+    # Carry-over glossary (§14.1): pasted at the head of the segment.
+    if glossary:
+        user_parts.append(glossary)
+
     # Mode-flag rules block (§3.4): real rules, not just flag names.
     if mode_flags:
         rules = inject_mode_rules(mode_flags)
@@ -427,8 +964,9 @@ def translate(
     user_parts.append(f"[Domain pre-classification: {domain}]")
 
     # Token budget & Draft-Lock tier (§4.7, CJK-aware)
-    estimated_tokens = estimate_tokens(payload)
-    eff_words = count_effective_words(payload)
+    stats = TextStats(payload)
+    estimated_tokens = stats.estimated_tokens
+    eff_words = stats.effective_words
     draft_lock_tier = "Full" if eff_words < SEGMENT_WORD_THRESHOLD else "Segmented"
     user_parts.append(
         f"[Token budget: ~{estimated_tokens} tokens. "
@@ -439,23 +977,257 @@ def translate(
     # Source payload
     user_parts.append(payload)
 
-    user_message = "\n\n".join(user_parts)
-    messages.append({"role": "user", "content": user_message})
+    return "\n\n".join(user_parts)
 
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            temperature=0,
-            top_p=0.1,
-            messages=messages,
+
+def canonicalize_static(text: str) -> str:
+    """Byte-stable form of static-zone text: LF newlines, no trailing
+    whitespace on any line, no leading/trailing blank lines. Keeps editor
+    noise in the prompt files from breaking provider-side prefix caching.
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n")).strip("\n")
+
+
+class TranslatorSession:
+    """Long-lived translation context shared by every segment and document.
+
+    Builds the API client once — the OpenAI SDK client owns a keep-alive
+    HTTP connection pool, so reusing it avoids a TLS handshake per call —
+    and assembles each domain's static zone (§3.7: core prompt + domain pack
+    + few-shot turns) once, canonicalized, so every call sends a
+    byte-identical prefix that provider-side prompt caching can reuse.
+    Prompt/cached/completion token usage is accumulated from each response.
+    With prefix_state_path, static-zone hashes are compared with the
+    previous run's and a warning names the first message that changed.
+    Safe to share across the segment pipeline's worker threads.
+    """
+
+    def __init__(
+        self,
+        model: str = "gpt-4o",
+        api_base: str | None = None,
+        prefix_state_path: str | None = None,
+    ):
+        self.model = model
+        self.api_base = api_base
+        self._client = None
+        self._lock = threading.RLock()
+        self._system_prompts: dict[str, str] = {}
+        self._fewshots: dict[str, list[dict]] = {}
+        self._static: dict[str, list[dict]] = {}
+        self._prefix_hashes: dict[str, str] = {}
+        self._prefix_state_path = prefix_state_path
+        self._prefix_state: dict[str, list[str]] = {}
+        self._prefix_state_dirty = False
+        if prefix_state_path and Path(prefix_state_path).exists():
+            try:
+                self._prefix_state = json.loads(Path(prefix_state_path).read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                self._prefix_state = {}
+        self.usage = {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0}
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                try:
+                    from openai import OpenAI
+                except ImportError:
+                    print("ERROR: pip install openai", file=sys.stderr)
+                    sys.exit(1)
+                self._client = OpenAI(
+                    api_key=os.environ.get("OPENAI_API_KEY", ""),
+                    base_url=self.api_base,
+                )
+            return self._client
+
+    def system_prompt(self, domain: str) -> str:
+        with self._lock:
+            if domain not in self._system_prompts:
+                self._system_prompts[domain] = canonicalize_static(assemble_system_prompt(domain))
+            return self._system_prompts[domain]
+
+    def fewshot_messages(self, domain: str) -> list[dict]:
+        with self._lock:
+            if domain not in self._fewshots:
+                self._fewshots[domain] = [
+                    {"role": m["role"], "content": canonicalize_static(m["content"])}
+                    for m in load_fewshot_messages(domain)
+                ]
+            return self._fewshots[domain]
+
+    def static_messages(self, domain: str) -> list[dict]:
+        """The static zone for a domain: system prompt then few-shot turns.
+        Built once; every call for the domain reuses the same messages.
+        """
+        with self._lock:
+            if domain not in self._static:
+                messages = [{"role": "system", "content": self.system_prompt(domain)}]
+                messages.extend(self.fewshot_messages(domain))
+                hashes = [
+                    hashlib.sha256(
+                        json.dumps(m, ensure_ascii=False, sort_keys=True).encode("utf-8")
+                    ).hexdigest()[:16]
+                    for m in messages
+                ]
+                self._static[domain] = messages
+                self._prefix_hashes[domain] = hashlib.sha256("".join(hashes).encode()).hexdigest()
+                self._check_prefix(domain, messages, hashes)
+            return self._static[domain]
+
+    def prefix_hash(self, domain: str) -> str:
+        """Hash of the domain's canonical static zone."""
+        self.static_messages(domain)
+        return self._prefix_hashes[domain]
+
+    def _check_prefix(self, domain: str, messages: list[dict], hashes: list[str]) -> None:
+        key = f"{self.model}|{domain}"
+        previous = self._prefix_state.get(key)
+        if previous and previous != hashes:
+            changed = next(
+                (i for i, (a, b) in enumerate(zip(previous, hashes)) if a != b),
+                min(len(previous), len(hashes)),
+            )
+            where = (
+                f"message {changed} ({messages[changed]['role']})"
+                if changed < len(messages) else "the end of the few-shot turns"
+            )
+            print(
+                f"[WARNING] Static prompt prefix for '{domain}' changed at {where} "
+                f"since the last run; provider-side prompt caching restarts cold "
+                f"from that point.",
+                file=sys.stderr,
+            )
+        if previous != hashes:
+            self._prefix_state[key] = hashes
+            self._prefix_state_dirty = True
+
+    def _record_usage(self, usage) -> None:
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        with self._lock:
+            self.usage["calls"] += 1
+            self.usage["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+            self.usage["cached_tokens"] += getattr(details, "cached_tokens", 0) or 0
+            self.usage["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+
+    def usage_summary(self) -> str:
+        u = self.usage
+        reuse = 100.0 * u["cached_tokens"] / u["prompt_tokens"] if u["prompt_tokens"] else 0.0
+        return (
+            f"Tokens: {u['calls']} calls, prompt {u['prompt_tokens']} "
+            f"(cached {u['cached_tokens']}, uncached {u['prompt_tokens'] - u['cached_tokens']}; "
+            f"{reuse:.0f}% prefix reuse), completion {u['completion_tokens']}"
         )
-    except Exception as e:
-        print(f"[ERROR] API call failed: {e}", file=sys.stderr)
-        sys.exit(1)
 
+    def translate(
+        self,
+        payload: str,
+        domain: str,
+        scratchpad_tier: str = "full",
+        mode_flags: list[str] | None = None,
+        on_text: Callable[[str], None] | None = None,
+        glossary: str = "",
+    ) -> tuple[str, str]:
+        """Execute a single translation call.
+        With on_text, the completion is streamed and payload text is passed
+        to on_text as soon as the scratchpad closes (see
+        ScratchpadStreamParser); the return value is unchanged.
+        Returns (scratchpad, translated_payload).
+        Raises TranslationError if the API call fails.
+        """
+        # Build message list: static zone (system + few-shot prior turns,
+        # §3.5/§3.7) first and byte-identical across calls, then the
+        # variable user request.
+        messages: list[dict] = list(self.static_messages(domain))
+        messages.append({
+            "role": "user",
+            "content": build_user_message(payload, domain, scratchpad_tier, mode_flags, glossary),
+        })
+
+        if on_text is not None:
+            return self._translate_streaming(messages, on_text)
+
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                temperature=0,
+                top_p=0.1,
+                messages=messages,
+            )
+        except Exception as e:
+            raise TranslationError(f"API call failed: {e}") from e
+
+        self._record_usage(getattr(response, "usage", None))
+        return _finish_translation(
+            response.choices[0].message.content or "",
+            response.choices[0].finish_reason,
+        )
+
+    def _translate_streaming(
+        self, messages: list[dict], on_text: Callable[[str], None]
+    ) -> tuple[str, str]:
+        parser = ScratchpadStreamParser()
+        finish_reason = None
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                temperature=0,
+                top_p=0.1,
+                messages=messages,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            for chunk in stream:
+                # The usage block arrives on a final chunk with no choices.
+                if getattr(chunk, "usage", None):
+                    self._record_usage(chunk.usage)
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.delta.content:
+                    text = parser.feed(choice.delta.content)
+                    if text:
+                        on_text(text)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+        except Exception as e:
+            raise TranslationError(
+                f"API call failed: {e}", partial_output=parser.emitted
+            ) from e
+
+        scratchpad, translated = _finish_translation(parser.raw, finish_reason)
+        # Write what the parser held back (no or an unclosed scratchpad,
+        # trailing text) or the truncation notice, so the streamed output
+        # ends as the non-streaming path's result.
+        text = parser.finish(translated)
+        if text:
+            on_text(text)
+        return scratchpad, translated
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            if self._prefix_state_path and self._prefix_state_dirty:
+                path = Path(self._prefix_state_path)
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = path.with_name(path.name + ".tmp")
+                    tmp.write_text(json.dumps(self._prefix_state), encoding="utf-8")
+                    os.replace(tmp, path)
+                    self._prefix_state_dirty = False
+                except OSError as e:
+                    print(f"[WARNING] Could not save prefix state: {e}", file=sys.stderr)
+
+
+def _finish_translation(raw: str, finish_reason: str | None) -> tuple[str, str]:
+    """Strip the scratchpad from raw output, applying truncation safety."""
     # Detect truncation: an incomplete <engine_logs> block would make
     # strip_scratchpad() return the whole raw output as 'payload'.
-    finish_reason = response.choices[0].finish_reason
     if finish_reason == "length":
         print(
             "[WARNING] Output truncated (finish_reason=length). "
@@ -463,7 +1235,6 @@ def translate(
             file=sys.stderr,
         )
 
-    raw = response.choices[0].message.content or ""
     scratchpad, translated = strip_scratchpad(raw)
 
     # Truncation safety: if the model hit its output token limit, the closing
@@ -486,6 +1257,616 @@ def translate(
     return scratchpad, translated
 
 
+def translate(
+    payload: str,
+    domain: str,
+    scratchpad_tier: str = "full",
+    mode_flags: list[str] | None = None,
+    model: str = "gpt-4o",
+    api_base: str | None = None,
+) -> tuple[str, str]:
+    """Execute a single translation call on a one-off TranslatorSession.
+    Prefer a shared TranslatorSession when translating more than once.
+    Returns (scratchpad, translated_payload).
+    Raises TranslationError if the API call fails.
+    """
+    session = TranslatorSession(model=model, api_base=api_base)
+    try:
+        return session.translate(payload, domain, scratchpad_tier, mode_flags)
+    finally:
+        session.close()
+
+
+# ---------------------------------------------------------------------------
+# Persistent Translation Cache — content-addressed, SQLite-backed
+# ---------------------------------------------------------------------------
+def prompt_fingerprint(
+    system_prompt: str,
+    fewshot_messages: list[dict],
+    mode_flags: list[str] | None,
+    scratchpad_tier: str,
+    model: str,
+) -> str:
+    """Hash everything except the segment that determines a translation.
+    Any change to the core prompt, domain pack, few-shots, flags or model
+    yields a new fingerprint, so stale translations can never be served.
+    """
+    h = hashlib.sha256()
+    for part in (
+        system_prompt,
+        json.dumps(fewshot_messages, ensure_ascii=False, sort_keys=True),
+        json.dumps(sorted(mode_flags or [])),
+        scratchpad_tier,
+        model,
+    ):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def segment_cache_key(prompt_fp: str, segment: str, glossary: str = "") -> str:
+    """Cache key for one segment (and its carry-over glossary block, which
+    only lists the terms the segment uses) under a given prompt fingerprint.
+    """
+    return hashlib.sha256(
+        f"{prompt_fp}\x00{glossary}\x00{segment}".encode("utf-8")
+    ).hexdigest()
+
+
+class TranslationCache:
+    """On-disk cache of (scratchpad, translation) keyed on segment_cache_key().
+    Safe to share across the segment pipeline's worker threads. Entries are
+    evicted by age (max_age_days) and then least-recently-used until the
+    stored text fits in max_mb; eviction runs once, on close().
+    """
+
+    def __init__(
+        self,
+        path: str = CACHE_PATH,
+        max_age_days: float = CACHE_MAX_AGE_DAYS,
+        max_mb: float = CACHE_MAX_MB,
+    ):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_age_days = max_age_days
+        self.max_mb = max_mb
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " key TEXT PRIMARY KEY, scratchpad TEXT NOT NULL,"
+            " translated TEXT NOT NULL, size INTEGER NOT NULL,"
+            " created REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> tuple[str, str] | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT scratchpad, translated FROM translations WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._db.execute(
+                "UPDATE translations SET last_used = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._db.commit()
+            return row[0], row[1]
+
+    def put(self, key: str, scratchpad: str, translated: str) -> None:
+        size = len(scratchpad.encode("utf-8")) + len(translated.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                (key, scratchpad, translated, size, now, now),
+            )
+            self._db.commit()
+
+    def evict(self) -> int:
+        """Apply age- then size-based eviction. Returns entries removed."""
+        with self._lock:
+            cutoff = time.time() - self.max_age_days * 86400
+            removed = self._db.execute(
+                "DELETE FROM translations WHERE created < ?", (cutoff,)
+            ).rowcount
+            budget = int(self.max_mb * 1024 * 1024)
+            total = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM translations"
+            ).fetchone()[0]
+            if total > budget:
+                doomed = []
+                for key, size in self._db.execute(
+                    "SELECT key, size FROM translations ORDER BY last_used"
+                ):
+                    if total <= budget:
+                        break
+                    doomed.append((key,))
+                    total -= size
+                self._db.executemany("DELETE FROM translations WHERE key = ?", doomed)
+                removed += len(doomed)
+            self._db.commit()
+            return removed
+
+    def stats(self) -> str:
+        lookups = self.hits + self.misses
+        rate = 100.0 * self.hits / lookups if lookups else 0.0
+        return f"{self.hits} hits / {self.misses} misses ({rate:.0f}% hit rate)"
+
+    def close(self) -> None:
+        removed = self.evict()
+        if removed:
+            print(f"[INFO] Cache: evicted {removed} stale entries", file=sys.stderr)
+        self._db.close()
+
+
+# ---------------------------------------------------------------------------
+# Segment Pipeline (§4.7 Segmented Draft-Lock) — concurrent, ordered, retried
+# ---------------------------------------------------------------------------
+class OrderedStreamWriter:
+    """Writes concurrently streamed segments to one output in input order.
+    Text for the segment currently at the head of the document goes straight
+    out; later segments are buffered until every earlier one has finished.
+    """
+
+    def __init__(self, out=None, separator: str = "\n\n"):
+        self._out = out or sys.stdout
+        self._separator = separator
+        self._lock = threading.Lock()
+        self._next = 0
+        self._buffers: dict[int, list[str]] = {}
+        self._finished: set[int] = set()
+        self._started = False     # anything written yet
+        self._head_fresh = True   # head segment has written nothing yet
+
+    def _emit(self, text: str) -> None:
+        if self._head_fresh and self._started:
+            self._out.write(self._separator)
+        self._head_fresh = False
+        self._started = True
+        self._out.write(text)
+        self._out.flush()
+
+    def write(self, index: int, text: str) -> None:
+        with self._lock:
+            if index == self._next:
+                self._emit(text)
+            else:
+                self._buffers.setdefault(index, []).append(text)
+
+    def finish(self, index: int) -> None:
+        with self._lock:
+            self._finished.add(index)
+            while self._next in self._finished:
+                self._next += 1
+                self._head_fresh = True
+                pending = "".join(self._buffers.pop(self._next, []))
+                if pending:
+                    self._emit(pending)
+
+
+def translate_with_retry(
+    session: TranslatorSession,
+    payload: str,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = RETRY_BACKOFF_BASE,
+    **translate_kwargs,
+) -> tuple[str, str, int]:
+    """Call session.translate() with exponential backoff on TranslationError.
+    Returns (scratchpad, translated_payload, attempts_used). Re-raises the
+    last TranslationError once all 1 + retries attempts are exhausted.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            scratchpad, translated = session.translate(payload, **translate_kwargs)
+            return scratchpad, translated, attempt
+        except TranslationError as e:
+            if attempt > retries or e.partial_output:
+                raise
+            delay = backoff * (2 ** (attempt - 1)) * random.uniform(0.8, 1.2)
+            print(
+                f"[WARNING] {e} — retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{retries + 1})",
+                file=sys.stderr,
+            )
+            time.sleep(delay)
+
+
+def translate_segments(
+    session: TranslatorSession,
+    segments: list[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = DEFAULT_RETRIES,
+    cache: TranslationCache | None = None,
+    prompt_fp: str = "",
+    writer: OrderedStreamWriter | None = None,
+    glossary: Glossary | None = None,
+    carry_over: str = "off",
+    **translate_kwargs,
+) -> list[tuple[str, str]]:
+    """Translate segments on a bounded thread pool, preserving input order.
+    Segments are scheduled by plan_carry_over(): a segment waiting on a
+    predecessor starts once it finishes, with the entries of the glossary
+    extracted from every earlier scratchpad in its chain whose terms occur in
+    it pasted at its head; chain heads (seeded with glossary) run in parallel. With carry_over="off" wall-clock
+    time tracks the slowest segment rather than the sum of all of them.
+    Per-segment latency is reported on stderr. When a cache is given,
+    segments already translated under prompt_fp and the same carry-over
+    entries are served from it, so editing one segment only re-translates
+    later ones in its chain whose terms it changes; cached scratchpads rebuild the glossary,
+    so a resumed run never re-translates earlier segments for it. With a
+    writer, payload text is streamed to it in order while segments run.
+    Returns [(scratchpad, translated_payload), ...] in input order;
+    raises TranslationError if any segment fails after all retries.
+    """
+    total = len(segments)
+    results: list[tuple[str, str] | None] = [None] * total
+    seed = glossary or Glossary()
+    preds = plan_carry_over(segments, carry_over)
+    successor = {p: i for i, p in enumerate(preds) if p is not None}
+    carried: dict[int, Glossary] = {}
+    hits = 0
+
+    def _run(index: int) -> tuple[int, str, str, int, float, bool]:
+        start = time.perf_counter()
+        block = carried[index].render(segments[index])
+        key = segment_cache_key(prompt_fp, segments[index], block)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            (sp, translated), attempts = cached, 0
+            if writer is not None:
+                writer.write(index, translated)
+        else:
+            kwargs = dict(translate_kwargs, glossary=block)
+            if writer is not None:
+                kwargs["on_text"] = lambda text: writer.write(index, text)
+            sp, translated, attempts = translate_with_retry(
+                session, segments[index], retries=retries, **kwargs
+            )
+            # Truncation notices are not translations — never cache them.
+            if cache is not None and not translated.startswith("[NOTICE]"):
+                cache.put(key, sp, translated)
+        if writer is not None:
+            writer.finish(index)
+        return index, sp, translated, attempts, time.perf_counter() - start, cached is not None
+
+    workers = max(1, min(concurrency, total))
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        running = set()
+        for i, pred in enumerate(preds):
+            if pred is None:
+                carried[i] = seed
+                running.add(pool.submit(_run, i))
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, sp, translated, attempts, elapsed, hit = future.result()
+                results[index] = (sp, translated)
+                hits += hit
+                nxt = successor.get(index)
+                if nxt is not None:
+                    carried[nxt] = carried[index].copy().merge_scratchpad(sp)
+                    running.add(pool.submit(_run, nxt))
+                if total > 1 and not hit:
+                    retry_note = f", {attempts} attempts" if attempts > 1 else ""
+                    print(
+                        f"[INFO] Segment {index + 1}/{total} done in {elapsed:.2f}s{retry_note}",
+                        file=sys.stderr,
+                    )
+    finally:
+        # On failure, drop queued segments instead of paying for them.
+        pool.shutdown(wait=True, cancel_futures=True)
+    if total > 1 and hits:
+        print(f"[INFO] Cache: {hits}/{total} segments reused", file=sys.stderr)
+    return [r for r in results if r is not None]
+
+
+# ---------------------------------------------------------------------------
+# Document Pipeline — segment, translate, reassemble
+# ---------------------------------------------------------------------------
+def translate_document(
+    session: TranslatorSession,
+    payload: str,
+    domain: str,
+    scratchpad_tier: str = "full",
+    mode_flags: list[str] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = DEFAULT_RETRIES,
+    cache: TranslationCache | None = None,
+    writer: OrderedStreamWriter | None = None,
+    carry_over: str = "chapter",
+    glossary_path: str | None = None,
+    glossary_seed: Glossary | None = None,
+) -> tuple[str, str, int]:
+    """Translate one document end to end on a shared session.
+    With a writer, the translated payload is also streamed to it in order.
+    The carry-over glossary starts from glossary_seed (or the seed stored in
+    glossary_path) and, when glossary_path is given, the merged glossary of
+    the whole document is written back there. Without a cache (whose keys
+    need the same seed as the previous run) the entries stored in
+    glossary_path are carried over too, so a resumed run keeps its terms.
+    Returns (scratchpad, translated_payload, segment_count).
+    Raises TranslationError if any segment fails after all retries.
+    """
+    # Size-aware Draft-Lock (§4.7): segment oversized payloads at section/
+    # paragraph boundaries and translate each segment in its own API call,
+    # carrying the glossary from each segment into the next (§14.1).
+    segments = segment_payload(payload)
+    if glossary_seed is None:
+        glossary_seed = Glossary.load(glossary_path) if glossary_path else Glossary()
+    glossary = glossary_seed
+    if glossary_path and cache is None:
+        glossary = glossary_seed.copy()
+        for entry in Glossary.load(glossary_path, entries=True).items():
+            glossary.add(*entry)
+    if len(segments) > 1:
+        chains = plan_carry_over(segments, carry_over).count(None)
+        print(
+            f"[INFO] Draft-Lock tier: Segmented — {len(segments)} segments, "
+            f"~{count_effective_words(payload)} effective words "
+            f"(carry-over glossary: {carry_over}, {chains} independent chain(s))",
+            file=sys.stderr,
+        )
+        if concurrency > 1:
+            print(
+                f"[INFO] Translating {len(segments)} segments "
+                f"(concurrency={min(concurrency, chains)})...",
+                file=sys.stderr,
+            )
+            if chains == 1:
+                print(
+                    f"[WARN] carry-over '{carry_over}' chains all segments; "
+                    "they run one at a time (use --carry-over=off to parallelise)",
+                    file=sys.stderr,
+                )
+
+    # Persistent cache (content-addressed): keyed on the exact prompt zone,
+    # few-shots, flags and model, so any prompt change invalidates old entries.
+    prompt_fp = ""
+    if cache is not None:
+        prompt_fp = prompt_fingerprint(
+            session.system_prompt(domain),
+            session.fewshot_messages(domain),
+            mode_flags,
+            scratchpad_tier,
+            session.model,
+        )
+
+    wall_start = time.perf_counter()
+    results = translate_segments(
+        session,
+        segments,
+        concurrency=concurrency,
+        retries=retries,
+        cache=cache,
+        prompt_fp=prompt_fp,
+        writer=writer,
+        glossary=glossary,
+        carry_over=carry_over,
+        domain=domain,
+        scratchpad_tier=scratchpad_tier,
+        mode_flags=mode_flags,
+    )
+    if len(segments) > 1:
+        print(
+            f"[INFO] {len(segments)} segments translated in "
+            f"{time.perf_counter() - wall_start:.2f}s wall-clock",
+            file=sys.stderr,
+        )
+
+    if glossary_path:
+        merged = glossary.copy()
+        for sp, _ in results:
+            merged.merge_scratchpad(sp)
+        merged.save(glossary_path, glossary_seed)
+        print(f"[INFO] Glossary ({len(merged)} entries) saved to {glossary_path}", file=sys.stderr)
+
+    scratchpad = "\n\n--- segment boundary ---\n\n".join(sp for sp, _ in results if sp)
+    translated = "\n\n".join(t for _, t in results if t is not None)
+    return scratchpad, translated, len(segments)
+
+
+# ---------------------------------------------------------------------------
+# Batch Mode — many documents through one long-lived process
+# ---------------------------------------------------------------------------
+BATCH_INPUT_SUFFIXES = (".md", ".txt")
+BATCH_OUTPUT_TAG = ".en"             # report.md -> report.en.md
+BATCH_SCRATCHPAD_TAG = ".scratchpad"  # report.md -> report.scratchpad.md
+BATCH_GLOSSARY_SUFFIX = ".glossary.json"  # report.md -> report.md.glossary.json
+BATCH_REPORT_NAME = "te10_batch_report.jsonl"
+
+
+def _batch_sibling(path: Path, tag: str) -> Path:
+    return path.with_name(f"{path.stem}{tag}{path.suffix}")
+
+
+def load_batch_jobs(source: str) -> tuple[list[dict], Path]:
+    """Expand a --batch source into jobs plus the default report path.
+
+    A directory is scanned recursively for *.md/*.txt inputs (skipping files
+    this mode itself writes). A *.jsonl manifest holds one object per line:
+        {"input": "a.md", "output": "...", "scratchpad": "...", "domain": "legal"}
+    where only "input" is required; relative paths resolve against the
+    manifest's directory. Outputs default to siblings of each input.
+    """
+    src = Path(source)
+    jobs: list[dict] = []
+    if src.is_dir():
+        base = src
+        for p in sorted(src.rglob("*")):
+            if (
+                p.is_file()
+                and p.suffix in BATCH_INPUT_SUFFIXES
+                and not p.stem.endswith((BATCH_OUTPUT_TAG, BATCH_SCRATCHPAD_TAG))
+            ):
+                jobs.append({"input": p})
+    else:
+        base = src.parent
+        for lineno, line in enumerate(src.read_text(encoding="utf-8").splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                entry["input"] = base / entry["input"]
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                print(f"[WARNING] {src}:{lineno}: bad manifest entry ({e})", file=sys.stderr)
+                continue
+            jobs.append(entry)
+    for job in jobs:
+        inp = job["input"]
+        job["output"] = base / job["output"] if job.get("output") else _batch_sibling(inp, BATCH_OUTPUT_TAG)
+        job["scratchpad"] = (
+            base / job["scratchpad"] if job.get("scratchpad")
+            else _batch_sibling(inp, BATCH_SCRATCHPAD_TAG)
+        )
+        # Keeps the extension, so a.md and a.txt get separate glossaries
+        job["glossary"] = inp.with_name(inp.name + BATCH_GLOSSARY_SUFFIX)
+    return jobs, base / BATCH_REPORT_NAME
+
+
+def load_completed_jobs(report_path: Path) -> dict[str, str]:
+    """Map resolved input path -> source sha256 for jobs the report records as done.
+    A torn last line (crash mid-write) is ignored, so resuming is safe.
+    """
+    done: dict[str, str] = {}
+    if not report_path.exists():
+        return done
+    for line in report_path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if record.get("status") == "ok":
+            done[record["input"]] = record.get("sha256", "")
+    return done
+
+
+def run_batch(
+    source: str,
+    session: TranslatorSession,
+    explicit_domain: str | None,
+    scratchpad_tier: str = "full",
+    mode_flags: list[str] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = DEFAULT_RETRIES,
+    cache: TranslationCache | None = None,
+    report_path: str | None = None,
+    carry_over: str = "chapter",
+    glossary_seed: Glossary | None = None,
+    classify_window: int = CLASSIFY_WINDOW,
+) -> int:
+    """Translate every job in a directory or manifest on one shared session.
+    Each finished document appends one JSONL record (domain, segments, token
+    estimates, timings, status) to the run report, flushed and fsync'd so a
+    crashed run can be resumed: inputs recorded "ok" (by resolved path, so
+    any working directory resumes) with an unchanged hash and an existing
+    output are skipped. Only one document is held in memory at a time: the
+    pre-pass keeps each job's hash and domain, and the text is read again
+    when it is translated. Each document's merged carry-over glossary is
+    saved next to it. Returns the number of failed jobs.
+    """
+    jobs, default_report = load_batch_jobs(source)
+    report = Path(report_path) if report_path else default_report
+    completed = load_completed_jobs(report)
+
+    # Bulk pre-pass: hash and classify everything up front, then assemble
+    # each domain's prompt once before any API traffic starts.
+    classify_start = time.perf_counter()
+    pending: list[tuple[dict, str, str, float]] = []
+    skipped = 0
+    for job in jobs:
+        job["key"] = str(job["input"].resolve())
+        try:
+            payload = job["input"].read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"[WARNING] Skipping {job['input']}: {e}", file=sys.stderr)
+            continue
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        if completed.get(job["key"]) == digest and job["output"].exists():
+            skipped += 1
+            continue
+        if not payload.strip():
+            continue
+        domain, confidence = classify_domain_scored(
+            payload, job.get("domain") or explicit_domain, classify_window
+        )
+        pending.append((job, digest, domain, confidence))
+    for domain in sorted({p[2] for p in pending}):
+        session.system_prompt(domain)
+        session.fewshot_messages(domain)
+    print(
+        f"[INFO] Batch: {len(pending)} to translate, {skipped} already done "
+        f"(classified in {time.perf_counter() - classify_start:.2f}s)",
+        file=sys.stderr,
+    )
+
+    failures = 0
+    with report.open("a", encoding="utf-8") as report_file:
+        for n, (job, digest, domain, confidence) in enumerate(pending, 1):
+            print(f"[INFO] [{n}/{len(pending)}] {job['input']} (domain: {domain})", file=sys.stderr)
+            record = {
+                "input": job["key"],
+                "output": str(job["output"]),
+                "sha256": digest,
+                "domain": domain,
+                "domain_confidence": round(confidence, 3),
+            }
+            start = time.perf_counter()
+            try:
+                payload = job["input"].read_text(encoding="utf-8")
+                # Record the text actually translated if it changed meanwhile
+                record["sha256"] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+                stats = TextStats(payload)
+                record.update(
+                    effective_words=stats.effective_words,
+                    estimated_input_tokens=stats.estimated_tokens,
+                )
+                scratchpad, translated, segment_count = translate_document(
+                    session, payload, domain,
+                    scratchpad_tier=scratchpad_tier,
+                    mode_flags=mode_flags,
+                    concurrency=concurrency,
+                    retries=retries,
+                    cache=cache,
+                    carry_over=carry_over,
+                    glossary_path=str(job["glossary"]),
+                    glossary_seed=glossary_seed,
+                )
+                job["output"].write_text(translated + "\n", encoding="utf-8")
+                if scratchpad:
+                    job["scratchpad"].write_text(scratchpad, encoding="utf-8")
+                record.update(
+                    status="ok",
+                    segments=segment_count,
+                    estimated_output_tokens=estimate_tokens(translated),
+                )
+            except (TranslationError, OSError, UnicodeDecodeError) as e:
+                failures += 1
+                print(f"[ERROR] {job['input']}: {e}", file=sys.stderr)
+                record.update(status="error", error=str(e))
+            record["seconds"] = round(time.perf_counter() - start, 3)
+            report_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            report_file.flush()
+            os.fsync(report_file.fileno())
+
+    print(
+        f"[INFO] Batch done: {len(pending) - failures} ok, {failures} failed. "
+        f"Report: {report}",
+        file=sys.stderr,
+    )
+    return failures
+
+
 # ---------------------------------------------------------------------------
 # CLI Entry Point
 # ---------------------------------------------------------------------------
@@ -499,6 +1880,13 @@ def main():
         default=None,
         help="Force domain pack (default: auto-detect from payload)",
     )
+    parser.add_argument(
+        "--classify-chars",
+        type=int,
+        default=CLASSIFY_WINDOW,
+        help=f"Characters scored by domain auto-detection; 0 = whole document "
+        f"(default: {CLASSIFY_WINDOW})",
+    )
     parser.add_argument(
         "--scratchpad",
         choices=["full", "light", "none"],
@@ -520,6 +1908,74 @@ def main():
         default=None,
         help="Path to save scratchpad for audit",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Segments translated in parallel (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help=f"Retries per failed segment, with exponential backoff (default: {DEFAULT_RETRIES})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the persistent translation cache",
+    )
+    parser.add_argument(
+        "--cache-path",
+        default=CACHE_PATH,
+        help=f"Translation cache database (default: {CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=CACHE_MAX_AGE_DAYS,
+        help=f"Evict cache entries older than N days (default: {CACHE_MAX_AGE_DAYS})",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=CACHE_MAX_MB,
+        help=f"Cache size budget in MB, LRU-evicted (default: {CACHE_MAX_MB})",
+    )
+    parser.add_argument(
+        "--carry-over",
+        choices=CARRY_OVER_MODES,
+        default="chapter",
+        help="Carry-over glossary between segments (§14.1): chapter = H1/H2 sections "
+        "in parallel, glossary chained within each; chain = fully sequential; "
+        "off = independent segments (default: chapter)",
+    )
+    parser.add_argument(
+        "--glossary",
+        default=None,
+        help="Glossary JSON: its seed (plus its stored entries under --no-cache) is "
+        "loaded into every segment and the merged document glossary is written "
+        "back (batch: seed only; per-document "
+        f"glossaries go to <input file>{BATCH_GLOSSARY_SUFFIX})",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream translated text to stdout as it is generated",
+    )
+    parser.add_argument(
+        "--batch",
+        default=None,
+        metavar="DIR|MANIFEST.jsonl",
+        help="Translate a directory or JSONL manifest of inputs in one process; "
+        "outputs and scratchpads are written next to each input",
+    )
+    parser.add_argument(
+        "--report",
+        default=None,
+        help=f"Batch run report, JSONL, resumable (default: {BATCH_REPORT_NAME} "
+        "in the batch directory)",
+    )
     parser.add_argument(
         "input",
         nargs="?",
@@ -527,66 +1983,92 @@ def main():
         help="Input file (default: stdin)",
     )
     args = parser.parse_args()
-
-    # Read payload
-    if args.input == "-":
-        payload = sys.stdin.read()
-    else:
-        payload = Path(args.input).read_text(encoding="utf-8")
-
-    if not payload.strip():
-        print("[NOTICE] Empty payload. No translation emitted.")
-        sys.exit(0)
-
-    # Domain classification
-    domain = classify_domain(payload, args.domain)
-    print(f"[INFO] Domain: {domain}", file=sys.stderr)
+    if args.stream and args.batch:
+        parser.error("--stream writes to stdout and cannot be combined with --batch")
 
     # Mode flags
     mode_flags = []
     if args.scratchpad != "full":
         mode_flags.append(f"--scratchpad={args.scratchpad}")
 
-    # Size-aware Draft-Lock (§4.7): segment oversized payloads at section/
-    # paragraph boundaries and translate each segment in its own API call,
-    # concatenating results. NOTE: §4.7's carry-over glossary state machine
-    # is NOT yet implemented — segments are translated independently.
-    segments = segment_payload(payload)
-    if len(segments) > 1:
-        print(
-            f"[INFO] Draft-Lock tier: Segmented — {len(segments)} segments, "
-            f"~{count_effective_words(payload)} effective words "
-            f"(carry-over glossary NOT yet implemented; segments translated independently)",
-            file=sys.stderr,
-        )
-
-    scratchpad_parts = []
-    translated_parts = []
-    for i, segment in enumerate(segments, 1):
-        if len(segments) > 1:
-            print(f"[INFO] Translating segment {i}/{len(segments)}...", file=sys.stderr)
-        sp, translated = translate(
-            payload=segment,
-            domain=domain,
-            scratchpad_tier=args.scratchpad,
-            mode_flags=mode_flags,
-            model=args.model,
-            api_base=args.api_base,
-        )
-        if sp:
-            scratchpad_parts.append(sp)
-        translated_parts.append(translated)
+    # One session for the whole run: the API client, its connection pool and
+    # the assembled prompt/few-shots are built once and shared by all segments
+    # (and, in --batch mode, all documents).
+    session = TranslatorSession(
+        model=args.model, api_base=args.api_base, prefix_state_path=PREFIX_STATE_PATH
+    )
+    cache = None
+    if not args.no_cache:
+        cache = TranslationCache(args.cache_path, args.cache_max_age, args.cache_max_mb)
 
-    scratchpad = "\n\n--- segment boundary ---\n\n".join(s for s in scratchpad_parts if s)
-    translated = "\n\n".join(t for t in translated_parts if t is not None)
+    try:
+        if args.batch:
+            failures = run_batch(
+                args.batch,
+                session,
+                args.domain,
+                scratchpad_tier=args.scratchpad,
+                mode_flags=mode_flags,
+                concurrency=args.concurrency,
+                retries=args.retries,
+                cache=cache,
+                report_path=args.report,
+                carry_over=args.carry_over,
+                glossary_seed=Glossary.load(args.glossary) if args.glossary else None,
+                classify_window=args.classify_chars,
+            )
+            sys.exit(1 if failures else 0)
+
+        # Read payload
+        if args.input == "-":
+            payload = sys.stdin.read()
+        else:
+            payload = Path(args.input).read_text(encoding="utf-8")
+
+        if not payload.strip():
+            print("[NOTICE] Empty payload. No translation emitted.")
+            sys.exit(0)
+
+        # Domain classification
+        domain, confidence = classify_domain_scored(payload, args.domain, args.classify_chars)
+        print(f"[INFO] Domain: {domain} (confidence {confidence:.2f})", file=sys.stderr)
+
+        writer = OrderedStreamWriter(sys.stdout) if args.stream else None
+        try:
+            scratchpad, translated, _ = translate_document(
+                session,
+                payload,
+                domain,
+                scratchpad_tier=args.scratchpad,
+                mode_flags=mode_flags,
+                concurrency=args.concurrency,
+                retries=args.retries,
+                cache=cache,
+                writer=writer,
+                carry_over=args.carry_over,
+                glossary_path=args.glossary,
+            )
+        except TranslationError as e:
+            print(f"[ERROR] {e}", file=sys.stderr)
+            sys.exit(1)
+    finally:
+        if session.usage["calls"]:
+            print(f"[INFO] {session.usage_summary()}", file=sys.stderr)
+        session.close()
+        if cache is not None:
+            print(f"[INFO] Cache: {cache.stats()}", file=sys.stderr)
+            cache.close()
 
     # Save scratchpad if requested
     if args.save_scratchpad and scratchpad:
         Path(args.save_scratchpad).write_text(scratchpad, encoding="utf-8")
         print(f"[INFO] Scratchpad saved to {args.save_scratchpad}", file=sys.stderr)
 
-    # Output translated payload only (§3.2)
-    print(translated)
+    # Output translated payload only (§3.2); already written when streaming.
+    if args.stream:
+        print()
+    else:
+        print(translated)
 
 
 if __name__ == "__main__":
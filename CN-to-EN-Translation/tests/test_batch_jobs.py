@@ -0,0 +1,31 @@
+"""
+Tests for load_batch_jobs in TE10_wrapper_minimal.py
+
+Run with: pytest tests/test_batch_jobs.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import the module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import TE10_wrapper_minimal as te
+
+
+class TestLoadBatchJobs:
+    """Per-document files written next to each input."""
+
+    def test_same_stem_gets_separate_files(self, tmp_path):
+        (tmp_path / "a.md").write_text("甲", encoding="utf-8")
+        (tmp_path / "a.txt").write_text("乙", encoding="utf-8")
+
+        jobs, report = te.load_batch_jobs(str(tmp_path))
+
+        assert [job["input"].name for job in jobs] == ["a.md", "a.txt"]
+        assert [job["output"].name for job in jobs] == ["a.en.md", "a.en.txt"]
+        assert [job["glossary"].name for job in jobs] == [
+            "a.md.glossary.json",
+            "a.txt.glossary.json",
+        ]
+        assert report == tmp_path / te.BATCH_REPORT_NAME
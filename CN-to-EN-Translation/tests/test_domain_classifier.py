@@ -0,0 +1,42 @@
+"""
+Tests for DomainClassifier in TE10_wrapper_minimal.py
+
+Run with: pytest tests/test_domain_classifier.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import the module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import TE10_wrapper_minimal as te
+
+PACK_DIR = str(Path(__file__).parent.parent)
+
+
+class TestDomainClassifier:
+    """Keyword matching and the classification thresholds."""
+
+    def setup_method(self):
+        self.classifier = te.DomainClassifier.from_config(PACK_DIR)
+        self.fallback = te.DomainClassifier(self.classifier.weights)
+        self.fallback._automaton = None
+
+    def test_latin_keywords_start_a_word(self):
+        text = "industrial illegal biomedical papers"
+        assert self.classifier.matches(text) == {"paper": 1}
+        assert self.fallback.matches(text) == {"paper": 1}
+
+    def test_collocation_alternatives_split(self):
+        assert {"桌面拒稿", "秒拒"} <= set(self.classifier.weights)
+
+    def test_overlapping_counts_agree(self):
+        text = "审稿审稿 他引他引他引 legal legal"
+        assert self.classifier.matches(text) == self.fallback.matches(text)
+
+    def test_repeated_keyword_does_not_classify(self):
+        domain, _, _ = self.classifier.classify("manuscript manuscript manuscript")
+        assert domain == "engineering"
+        domain, _, _ = self.classifier.classify("manuscript and peer review")
+        assert domain == "academic"
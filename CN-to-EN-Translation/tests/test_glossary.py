@@ -0,0 +1,34 @@
+"""
+Tests for the carry-over Glossary in TE10_wrapper_minimal.py
+
+Run with: pytest tests/test_glossary.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import the module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import TE10_wrapper_minimal as te
+
+
+class TestGlossaryRender:
+    """The block pasted into a segment lists only the terms it uses."""
+
+    def test_render_filters_by_text(self):
+        glossary = te.Glossary([("端点", "endpoint", "locked-context"), ("延迟", "latency", "candidate")])
+
+        assert glossary.render("延迟很高") == "[Carry-over glossary (§14.1)]\n- 延迟 → latency (candidate)"
+        assert glossary.render("没有术语") == ""
+        assert glossary.render().count("\n") == 2
+
+    def test_unrelated_terms_keep_the_cache_key(self):
+        segment = "端点返回错误。"
+        before = te.Glossary([("端点", "endpoint", "locked-context")])
+        after = before.copy()
+        after.add("延迟", "latency")
+
+        assert te.segment_cache_key("fp", segment, before.render(segment)) == te.segment_cache_key(
+            "fp", segment, after.render(segment)
+        )
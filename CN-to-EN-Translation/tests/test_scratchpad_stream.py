@@ -0,0 +1,70 @@
+"""
+Tests for ScratchpadStreamParser in TE10_wrapper_minimal.py
+
+Run with: pytest tests/test_scratchpad_stream.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import the module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from TE10_wrapper_minimal import ScratchpadStreamParser, strip_scratchpad
+
+PIECES = [
+    "<engine_logs>", "</engine_logs>", "<", "engine", "_logs", ">", "</", "---",
+    "\n", " ", "\t", "a", "b c", "\n\n", "-",
+]
+
+
+def stream(raw, deltas):
+    """Feed raw to a parser in the given delta sizes; return everything emitted."""
+    parser = ScratchpadStreamParser()
+    out, i = [], 0
+    for size in deltas:
+        out.append(parser.feed(raw[i : i + size]))
+        i += size
+    out.append(parser.feed(raw[i:]))
+    out.append(parser.finish(strip_scratchpad(raw)[1]))
+    return "".join(out)
+
+
+class TestScratchpadStreamParser:
+    """Streamed output matches strip_scratchpad() on the whole output."""
+
+    def test_token_sized_deltas(self):
+        deltas = ["<", "engine", "_logs", ">", "Phase 1", "\n", "</", "engine_logs", ">", "\n", "Hello", " world"]
+        parser = ScratchpadStreamParser()
+        emitted = "".join(parser.feed(d) for d in deltas)
+        raw = "".join(deltas)
+        assert emitted == "Hello world"
+        assert emitted + parser.finish(strip_scratchpad(raw)[1]) == strip_scratchpad(raw)[1]
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "\ta \n<engine_logs> ---\na</engine_logs>a\n",
+            "<engine_logs>x</engine_logs>\n---\n\nbody",
+            "no scratchpad at all",
+            "<engine_logs>unclosed",
+        ],
+    )
+    def test_examples(self, raw):
+        for size in (1, 2, 3, len(raw)):
+            assert stream(raw, [size] * (len(raw) // size)) == strip_scratchpad(raw)[1]
+
+    def test_random_outputs(self):
+        rng = random.Random(0)
+        for _ in range(5000):
+            pieces = [rng.choice(PIECES) for _ in range(rng.randrange(12))]
+            raw = "".join(pieces)
+            # Half token-sized deltas, half arbitrary splits
+            if rng.random() < 0.5:
+                deltas = [len(piece) for piece in pieces]
+            else:
+                deltas = [rng.randrange(1, 8) for _ in range(len(raw))]
+            assert stream(raw, deltas) == strip_scratchpad(raw)[1], repr(raw)
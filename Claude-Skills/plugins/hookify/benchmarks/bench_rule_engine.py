@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Benchmark compiled RuleIndex evaluation against per-rule evaluation.
+
+Generates a synthetic rule set (1,000 rules by default) spread across
+events, tool matchers, fields and operators, checks that the compiled index
+returns exactly the same matches as the per-rule path on randomized inputs,
+then times both.
+
+Usage:
+    python3 benchmarks/bench_rule_engine.py [--rules N] [--calls N] [--seed N]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+
+PLUGIN_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PLUGIN_ROOT not in sys.path:
+    sys.path.insert(0, PLUGIN_ROOT)
+
+from core.config_loader import Rule, Condition
+from core.rule_engine import RuleEngine, RuleIndex, compile_regex, field_extractor
+
+WORDS = ['deploy', 'secret', 'token', 'rm', 'sudo', 'curl', 'drop', 'table', 'console',
+         'debug', 'password', 'chmod', 'force', 'push', 'prod', 'reset', 'eval', 'exec']
+# Ordinary text that rules do not target; most tool calls match nothing
+FILLER = ['the', 'value', 'return', 'import', 'self', 'config', 'user', 'list', 'def',
+          'result', 'path', 'update', 'item', 'test', 'data', 'for', 'in', 'if', 'None']
+TOOLS = ['Bash', 'Edit', 'Write', 'MultiEdit', 'Read', 'mcp__db__query']
+EVENTS = ['bash', 'file', 'all']
+OPERATORS = ['regex_match'] * 6 + ['contains', 'not_contains', 'starts_with', 'equals']
+
+
+def _pattern(rng: random.Random, operator: str) -> str:
+    a, b = rng.sample(WORDS, 2)
+    if operator != 'regex_match':
+        return a
+    return rng.choice([
+        rf'{a}\s+-{b[0]}',
+        rf'\b{a}\b.*{b}',
+        rf'({a}|{b})\d+',
+        rf'{a}[_-]?{b}',
+        rf'^{a}',
+    ])
+
+
+def synthetic_rules(count: int, rng: random.Random) -> list:
+    """Build count rules with a realistic spread of matchers and conditions."""
+    rules = []
+    for i in range(count):
+        event = rng.choice(EVENTS)
+        if event == 'bash':
+            fields = ['command']
+        elif event == 'file':
+            fields = ['new_text', 'file_path', 'content']
+        else:
+            fields = ['command', 'new_text', 'file_path']
+        conditions = []
+        for _ in range(rng.choice([1, 1, 2])):
+            operator = rng.choice(OPERATORS)
+            conditions.append(Condition(field=rng.choice(fields), operator=operator,
+                                        pattern=_pattern(rng, operator)))
+        rules.append(Rule(
+            name=f'rule-{i}',
+            enabled=True,
+            event=event,
+            conditions=conditions,
+            action=rng.choice(['warn', 'warn', 'block']),
+            tool_matcher=rng.choice([None, None, '*', 'Bash', 'Edit|Write', 'mcp__db__query']),
+            message=f'Rule {i} matched',
+        ))
+    return rules
+
+
+def synthetic_input(rng: random.Random) -> dict:
+    """One hook input for a random tool, mostly filler with rare rule words."""
+    words = []
+    for _ in range(rng.randint(3, 40)):
+        if rng.random() < 0.03:
+            words.append(rng.choice(WORDS) + rng.choice(['', '1', ' -f', '_']))
+        else:
+            words.append(rng.choice(FILLER))
+    text = ' '.join(words)
+    tool = rng.choice(TOOLS)
+    if tool == 'Bash':
+        tool_input = {'command': text}
+    elif tool == 'MultiEdit':
+        tool_input = {'file_path': f'src/{rng.choice(WORDS)}.py',
+                      'edits': [{'old_string': 'x', 'new_string': text}]}
+    elif tool in ('Edit', 'Write'):
+        tool_input = {'file_path': f'src/{rng.choice(WORDS)}.py', 'new_string': text, 'content': text}
+    else:
+        tool_input = {'query': text}
+    return {'hook_event_name': 'PreToolUse', 'tool_name': tool, 'tool_input': tool_input}
+
+
+def _event_for(tool_name: str):
+    # Same mapping as hooks/pretooluse.py
+    if tool_name == 'Bash':
+        return 'bash'
+    if tool_name in ['Edit', 'Write', 'MultiEdit']:
+        return 'file'
+    return None
+
+
+def reference_rule_matches(rule: Rule, input_data: dict) -> bool:
+    """The previous RuleEngine._rule_matches(), kept here as the baseline."""
+    tool_name = input_data.get('tool_name', '')
+    tool_input = input_data.get('tool_input', {})
+    if rule.tool_matcher and rule.tool_matcher != '*':
+        if tool_name not in rule.tool_matcher.split('|'):
+            return False
+    if not rule.conditions:
+        return False
+    for condition in rule.conditions:
+        field_value = field_extractor(condition.field)(tool_name, tool_input, input_data)
+        if field_value is None:
+            return False
+        operator, pattern = condition.operator, condition.pattern
+        if operator == 'regex_match':
+            try:
+                matched = bool(compile_regex(pattern).search(field_value))
+            except re.error:
+                matched = False
+        elif operator == 'contains':
+            matched = pattern in field_value
+        elif operator == 'equals':
+            matched = pattern == field_value
+        elif operator == 'not_contains':
+            matched = pattern not in field_value
+        elif operator == 'starts_with':
+            matched = field_value.startswith(pattern)
+        elif operator == 'ends_with':
+            matched = field_value.endswith(pattern)
+        else:
+            matched = False
+        if not matched:
+            return False
+    return True
+
+
+def per_rule_matches(rules: list, event, input_data: dict) -> list:
+    """Reference path: filter by event, then test every rule in order."""
+    return [r.name for r in rules
+            if (event is None or r.event in ('all', event)) and reference_rule_matches(r, input_data)]
+
+
+def indexed_matches(index: RuleIndex, event, input_data: dict) -> list:
+    tool_name = input_data.get('tool_name', '')
+    bucket = index.bucket(event, tool_name)
+    return [r.name for r in bucket.matching_rules(tool_name, input_data.get('tool_input', {}), input_data)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rules', type=int, default=1000)
+    parser.add_argument('--calls', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rules = synthetic_rules(args.rules, rng)
+    inputs = [synthetic_input(rng) for _ in range(args.calls)]
+    events = [_event_for(d['tool_name']) for d in inputs]
+    engine = RuleEngine()
+
+    start = time.perf_counter()
+    index = RuleIndex(rules)
+    for event, data in zip(events, inputs):
+        index.bucket(event, data['tool_name'])
+    compile_time = time.perf_counter() - start
+
+    # Parity check
+    total_matches = 0
+    for event, data in zip(events, inputs):
+        expected = per_rule_matches(rules, event, data)
+        actual = indexed_matches(index, event, data)
+        if expected != actual:
+            print(f"MISMATCH for {data}:\n  per-rule: {expected}\n  indexed:  {actual}")
+            return 1
+        total_matches += len(actual)
+    print(f"Parity OK: {args.calls} inputs, {total_matches} rule matches")
+
+    start = time.perf_counter()
+    for event, data in zip(events, inputs):
+        per_rule_matches(rules, event, data)
+    per_rule_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for event, data in zip(events, inputs):
+        engine.evaluate_rules(index, data, event=event)
+    indexed_time = time.perf_counter() - start
+
+    print(f"{args.rules} rules, {args.calls} calls")
+    print(f"  compile (all buckets): {compile_time * 1000:8.1f} ms")
+    print(f"  per-rule evaluation:   {per_rule_time / args.calls * 1e6:8.1f} us/call")
+    print(f"  indexed evaluation:    {indexed_time / args.calls * 1e6:8.1f} us/call"
+          f"  ({per_rule_time / indexed_time:.1f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
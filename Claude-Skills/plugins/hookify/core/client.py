@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Hook-side client for the resident hookify daemon.
+
+Hook scripts call evaluate() with the event type and hook input. When a
+daemon is listening on the hookify socket the input is forwarded to it and
+its response is returned; otherwise rules are loaded and evaluated in this
+process, exactly as before. A daemon is only used if its socket belongs to
+this user and is not accessible to others. Only stdlib modules that the interpreter has
+already loaded are imported up front, so the daemon path stays cheap.
+"""
+
+import os
+import sys
+import json
+import stat
+import socket
+from typing import Dict, Any, Optional
+
+# Seconds to wait for a daemon reply before evaluating in-process instead
+DAEMON_TIMEOUT = 5.0
+
+
+def socket_path() -> str:
+    """Return the daemon socket path (HOOKIFY_SOCKET overrides the default)."""
+    path = os.environ.get('HOOKIFY_SOCKET')
+    if path:
+        return path
+    base = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+    return os.path.join(base, f'hookify-{os.getuid()}.sock')
+
+
+def socket_trusted(path: str) -> bool:
+    """Check that path is a socket owned by this user and private to it.
+
+    The default path may be in a shared directory such as /tmp, where
+    another user could create it first and answer hooks in our name.
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+            and not st.st_mode & 0o077)
+
+
+def check_peer(sock: socket.socket) -> None:
+    """Raise OSError unless the connected daemon runs as this user.
+
+    Covers a socket replaced between socket_trusted() and connect(); only
+    possible where the platform reports peer credentials (Linux).
+    """
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return
+    # struct ucred: pid, uid, gid as C ints
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, 12)
+    uid = int.from_bytes(creds[4:8], sys.byteorder)
+    if uid != os.getuid():
+        raise OSError(f"hookify daemon socket is served by uid {uid}")
+
+
+def send_request(path: str, request: Dict[str, Any],
+                 timeout: float = DAEMON_TIMEOUT) -> Dict[str, Any]:
+    """Send one JSON request to the daemon and return its JSON reply.
+
+    Raises:
+        OSError: If the daemon is not reachable, runs as another user or
+            does not answer in time
+        ValueError: If the reply is not valid JSON
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        check_peer(sock)
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        sock.shutdown(socket.SHUT_WR)
+
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    return json.loads(b''.join(chunks).decode('utf-8'))
+
+
+def daemon_alive(path: str) -> bool:
+    """Check whether a daemon is accepting connections on path."""
+    if not os.path.exists(path):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(path)
+        return True
+    except OSError:
+        return False
+
+
+def spawn_daemon(path: str) -> None:
+    """Start the daemon in the background, detached from this hook."""
+    import subprocess
+
+    daemon = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'daemon.py')
+    try:
+        subprocess.Popen(
+            [sys.executable, daemon, '--socket', path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+    except OSError as e:
+        print(f"Warning: Failed to start hookify daemon: {e}", file=sys.stderr)
+
+
+def evaluate_via_daemon(event: Optional[str], input_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Evaluate rules in the resident daemon.
+
+    Returns:
+        The hook response dict, or None if no daemon answered (the caller
+        should then evaluate in-process). With HOOKIFY_DAEMON=1, a daemon is
+        started in the background for subsequent calls.
+    """
+    path = socket_path()
+    # Only talk to a daemon of our own: anyone else's answers are ignored
+    if socket_trusted(path):
+        try:
+            reply = send_request(path, {
+                'event': event,
+                'cwd': os.getcwd(),
+                'input': input_data,
+            })
+        except (OSError, ValueError):
+            reply = None
+
+        if isinstance(reply, dict) and 'result' in reply:
+            if reply.get('stderr'):
+                sys.stderr.write(reply['stderr'])
+            return reply['result']
+
+    if os.environ.get('HOOKIFY_DAEMON') == '1' and not daemon_alive(path):
+        spawn_daemon(path)
+    return None
+
+
+def evaluate(event: Optional[str], input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Evaluate hookify rules for one hook invocation.
+
+    Args:
+        event: Event filter for load_rules ("bash", "file", "stop", "prompt")
+        input_data: Hook input JSON
+
+    Returns:
+        Response dict for the hook to print (empty if no rules match).
+    """
+    result = evaluate_via_daemon(event, input_data)
+    if result is not None:
+        return result
+
+    from core.config_loader import load_rules
+    from core.rule_engine import RuleEngine
+
+    rules = load_rules(event=event)
+    engine = RuleEngine()
+    return engine.evaluate_rules(rules, input_data)
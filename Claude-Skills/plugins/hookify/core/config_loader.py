@@ -8,9 +8,14 @@ import os
 import sys
 import glob
 import re
-from typing import List, Optional, Dict, Any
+import pickle
+import hashlib
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 
+# Bump when Rule/Condition change shape so stale snapshots are rebuilt
+SNAPSHOT_VERSION = 1
+
 
 @dataclass
 class Condition:
@@ -195,49 +200,148 @@ def extract_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
     return frontmatter, message
 
 
-def load_rules(event: Optional[str] = None) -> List[Rule]:
-    """Load all hookify rules from .claude directory.
+def rule_files(root: Optional[str] = None) -> List[str]:
+    """Return the hookify.*.local.md rule files under root/.claude, sorted."""
+    return sorted(glob.glob(os.path.join(root or '', '.claude', 'hookify.*.local.md')))
 
-    Args:
-        event: Optional event filter ("bash", "file", "stop", etc.)
 
-    Returns:
-        List of enabled Rule objects matching the event.
+def rule_files_signature(files: List[str]) -> tuple:
+    """Name, mtime and size of each rule file; changes whenever a rule
+    file is added, removed or edited."""
+    signature = []
+    for file_path in files:
+        try:
+            st = os.stat(file_path)
+            signature.append((os.path.basename(file_path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((os.path.basename(file_path), None, None))
+    return tuple(signature)
+
+
+def cache_dir() -> Optional[str]:
+    """Directory for hookify's caches, or None if caching is disabled.
+
+    $HOOKIFY_CACHE_DIR, defaulting to $XDG_CACHE_HOME/hookify or
+    ~/.cache/hookify. HOOKIFY_CACHE_DIR=off disables caching.
     """
-    rules = []
+    path = os.environ.get('HOOKIFY_CACHE_DIR')
+    if path == 'off':
+        return None
+    if not path:
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        path = os.path.join(cache_home, 'hookify')
+    return path
 
-    # Find all hookify.*.local.md files
-    pattern = os.path.join('.claude', 'hookify.*.local.md')
-    files = glob.glob(pattern)
 
-    for file_path in files:
-        try:
-            rule = load_rule_file(file_path)
-            if not rule:
-                continue
+def snapshot_path(root: Optional[str] = None) -> Optional[str]:
+    """Path of the parsed-rule snapshot for a project directory."""
+    base = cache_dir()
+    if not base:
+        return None
+    key = hashlib.sha1(os.path.abspath(root or '.').encode('utf-8')).hexdigest()[:16]
+    return os.path.join(base, f'rules-{key}.pickle')
 
-            # Filter by event if specified
-            if event:
-                if rule.event != 'all' and rule.event != event:
-                    continue
 
-            # Only include enabled rules
-            if rule.enabled:
-                rules.append(rule)
+def _read_snapshot(path: str, signature: tuple) -> Optional[List[Tuple[str, Optional[Rule]]]]:
+    """Return the snapshot's parsed rules if it matches signature."""
+    try:
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+    except Exception:
+        # Missing, truncated or from an incompatible version: rebuild
+        return None
+    if (not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION
+            or data.get('signature') != signature):
+        return None
+    return data['rules']
 
+
+def _write_snapshot(path: str, signature: tuple, parsed: List[Tuple[str, Optional[Rule]]]) -> None:
+    """Write the snapshot atomically; failures only cost the next parse."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': SNAPSHOT_VERSION, 'signature': signature, 'rules': parsed},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def _parse_rule_files(files: List[str]) -> List[Tuple[str, Optional[Rule]]]:
+    """Parse every rule file, reporting failures; invalid files map to None."""
+    parsed = []
+
+    for file_path in files:
+        try:
+            rule = load_rule_file(file_path)
         except (IOError, OSError, PermissionError) as e:
             # File I/O errors - log and continue
             print(f"Warning: Failed to read {file_path}: {e}", file=sys.stderr)
-            continue
+            rule = None
         except (ValueError, KeyError, AttributeError, TypeError) as e:
             # Parsing errors - log and continue
             print(f"Warning: Failed to parse {file_path}: {e}", file=sys.stderr)
-            continue
+            rule = None
         except Exception as e:
             # Unexpected errors - log with type details
             print(f"Warning: Unexpected error loading {file_path} ({type(e).__name__}): {e}", file=sys.stderr)
+            rule = None
+        parsed.append((file_path, rule))
+
+    return parsed
+
+
+def load_rule_set(root: Optional[str] = None) -> List[Tuple[str, Optional[Rule]]]:
+    """Return (file_path, Rule or None) for every rule file under root.
+
+    Served from the snapshot when the rule files' names, mtimes and sizes
+    are unchanged; otherwise every file is re-parsed (reporting parse
+    errors once) and the snapshot is rewritten.
+    """
+    files = rule_files(root)
+    if not files:
+        return []
+
+    signature = rule_files_signature(files)
+    path = snapshot_path(root)
+    if path:
+        parsed = _read_snapshot(path, signature)
+        if parsed is not None:
+            return parsed
+
+    parsed = _parse_rule_files(files)
+    if path:
+        _write_snapshot(path, signature, parsed)
+    return parsed
+
+
+def load_rules(event: Optional[str] = None, root: Optional[str] = None) -> List[Rule]:
+    """Load all hookify rules from .claude directory.
+
+    Args:
+        event: Optional event filter ("bash", "file", "stop", etc.)
+        root: Project directory containing .claude (default: current directory)
+
+    Returns:
+        List of enabled Rule objects matching the event.
+    """
+    rules = []
+
+    for file_path, rule in load_rule_set(root):
+        if not rule:
             continue
 
+        # Filter by event if specified
+        if event:
+            if rule.event != 'all' and rule.event != event:
+                continue
+
+        # Only include enabled rules
+        if rule.enabled:
+            rules.append(rule)
+
     return rules
 
 
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Resident hookify daemon.
+
+Serves hook evaluations over a Unix socket so that a tool call costs one
+socket round trip instead of a fresh interpreter, a rule-file glob and a
+full re-parse of every rule. Parsed rules are kept in memory per project
+directory and reloaded only when a rule file is added, removed or changed.
+
+Usage:
+    python3 ${CLAUDE_PLUGIN_ROOT}/core/daemon.py [--socket PATH] [--idle-timeout SECONDS]
+    python3 ${CLAUDE_PLUGIN_ROOT}/core/daemon.py --stop
+
+Setting HOOKIFY_DAEMON=1 makes the hooks start it on first use instead.
+
+Protocol: one newline-terminated JSON request per connection,
+{"event": ..., "cwd": ..., "input": {...}}, answered with
+{"result": {...}, "stderr": "..."}. {"command": "shutdown"} stops the daemon.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import socketserver
+from contextlib import redirect_stderr
+from typing import Dict, Any, Optional, Tuple
+
+if __name__ == '__main__':
+    # Running as a script: make the plugin root importable
+    PLUGIN_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if PLUGIN_ROOT not in sys.path:
+        sys.path.insert(0, PLUGIN_ROOT)
+
+from core.client import socket_path, send_request, daemon_alive
+from core.config_loader import load_rules, rule_files, rule_files_signature
+from core.rule_engine import RuleEngine, RuleIndex
+
+# Exit after this many seconds without a request (0 = never)
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+
+
+class RuleSetCache:
+    """Compiled rules per project directory, reloaded when rule files change."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[tuple, RuleIndex]] = {}
+
+    def get(self, root: str) -> Tuple[RuleIndex, str]:
+        """Return (index of enabled rules, load warnings) for root.
+
+        Warnings are only returned when the rules were (re)loaded, so a
+        broken rule file is reported once per change rather than per call.
+        """
+        signature = rule_files_signature(rule_files(root))
+        entry = self._entries.get(root)
+        if entry is not None and entry[0] == signature:
+            return entry[1], ''
+
+        warnings = io.StringIO()
+        with redirect_stderr(warnings):
+            rules = load_rules(root=root)
+        index = RuleIndex(rules)
+        self._entries[root] = (signature, index)
+        return index, warnings.getvalue()
+
+
+class HookRequestHandler(socketserver.StreamRequestHandler):
+    """Handles a single hook request on an accepted connection."""
+
+    def handle(self):
+        server = self.server
+        server.last_request = time.monotonic()
+
+        try:
+            request = json.loads(self.rfile.readline().decode('utf-8'))
+            if request.get('command') == 'shutdown':
+                server.stopping = True
+                reply = {}
+            else:
+                reply = server.evaluate(request.get('event'), request.get('cwd') or '.',
+                                        request.get('input') or {})
+        except Exception as e:
+            # Same contract as the hook scripts: never block on our own errors
+            reply = {"result": {"systemMessage": f"Hookify error: {str(e)}"}}
+
+        self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+
+
+class HookifyServer(socketserver.UnixStreamServer):
+    """Single-threaded Unix socket server holding rules and the engine."""
+
+    def __init__(self, path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.rule_cache = RuleSetCache()
+        self.engine = RuleEngine()
+        self.idle_timeout = idle_timeout
+        self.last_request = time.monotonic()
+        self.stopping = False
+
+        # Socket is private to this user from the moment it is created
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(path, HookRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def evaluate(self, event: Optional[str], root: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluate rules for one hook call, mirroring load_rules(event=...)."""
+        index, warnings = self.rule_cache.get(root)
+
+        output = io.StringIO()
+        with redirect_stderr(output):
+            result = self.engine.evaluate_rules(index, input_data, event=event or None)
+        return {"result": result, "stderr": warnings + output.getvalue()}
+
+    def idle(self) -> bool:
+        if self.idle_timeout <= 0:
+            return False
+        return time.monotonic() - self.last_request > self.idle_timeout
+
+
+def serve(path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> int:
+    """Run the daemon until shut down, signalled or idle. Returns exit code."""
+    if daemon_alive(path):
+        print(f"hookify daemon already running on {path}", file=sys.stderr)
+        return 1
+    if os.path.exists(path):
+        # Stale socket left by a daemon that did not shut down cleanly
+        os.unlink(path)
+
+    try:
+        server = HookifyServer(path, idle_timeout)
+    except OSError as e:
+        print(f"Error: Cannot listen on {path}: {e}", file=sys.stderr)
+        return 1
+
+    def _terminate(signum, frame):
+        server.stopping = True
+
+    signal.signal(signal.SIGTERM, _terminate)
+    signal.signal(signal.SIGINT, _terminate)
+
+    server.timeout = 1.0
+    try:
+        while not server.stopping and not server.idle():
+            server.handle_request()
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resident hookify rule server")
+    parser.add_argument('--socket', default=socket_path(),
+                        help="Unix socket path (default: $HOOKIFY_SOCKET or "
+                             "$XDG_RUNTIME_DIR/hookify-<uid>.sock)")
+    parser.add_argument('--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Exit after this many idle seconds, 0 to run until stopped")
+    parser.add_argument('--stop', action='store_true', help="Stop a running daemon")
+    args = parser.parse_args()
+
+    if args.stop:
+        try:
+            send_request(args.socket, {'command': 'shutdown'})
+        except (OSError, ValueError):
+            print(f"No hookify daemon running on {args.socket}", file=sys.stderr)
+            return 1
+        return 0
+
+    return serve(args.socket, args.idle_timeout)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,13 +1,26 @@
 #!/usr/bin/env python3
-"""Rule evaluation engine for hookify plugin."""
+"""Rule evaluation engine for hookify plugin.
+
+Rules are compiled once into a RuleIndex: rules are bucketed by event and
+tool name, each condition becomes a prebuilt field extractor plus operator
+test, and all regex_match patterns on the same field are scanned together
+through an index of the literals they require, reporting which rules
+matched. Per-call cost therefore depends on the rules relevant to the
+call, not on the total rule count.
+"""
 
 import re
 import sys
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
 from functools import lru_cache
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Tuple, Set, Union
 
 # Import from local module
-from core.config_loader import Rule, Condition
+from core.config_loader import Rule
+from core.transcript import TranscriptScanner
 
 
 # Cache compiled regexes (max 128 patterns)
@@ -24,38 +37,437 @@ def compile_regex(pattern: str) -> re.Pattern:
     return re.compile(pattern, re.IGNORECASE)
 
 
+def _read_transcript(input_data: Dict[str, Any]) -> Optional[str]:
+    """Read the transcript file named by input_data, '' on read errors."""
+    transcript_path = input_data.get('transcript_path')
+    if not transcript_path:
+        return None
+    try:
+        with open(transcript_path, 'r') as f:
+            return f.read()
+    except FileNotFoundError:
+        print(f"Warning: Transcript file not found: {transcript_path}", file=sys.stderr)
+        return ''
+    except PermissionError:
+        print(f"Warning: Permission denied reading transcript: {transcript_path}", file=sys.stderr)
+        return ''
+    except (IOError, OSError) as e:
+        print(f"Warning: Error reading transcript {transcript_path}: {e}", file=sys.stderr)
+        return ''
+    except UnicodeDecodeError as e:
+        print(f"Warning: Encoding error in transcript {transcript_path}: {e}", file=sys.stderr)
+        return ''
+
+
+def _multiedit_new_text(tool_input: Dict[str, Any]) -> str:
+    # Concatenate all edits
+    edits = tool_input.get('edits', [])
+    return ' '.join(e.get('new_string', '') for e in edits)
+
+
+# Hook-input fields (Stop, UserPromptSubmit, ...) read from input_data
+_INPUT_FIELDS: Dict[str, Callable[[Dict[str, Any]], Optional[str]]] = {
+    'reason': lambda d: d.get('reason', ''),
+    'transcript': _read_transcript,
+    'user_prompt': lambda d: d.get('user_prompt', ''),
+}
+
+# Tool-specific field aliases: field -> {tool_name: getter(tool_input)}
+_TOOL_FIELDS: Dict[str, Dict[str, Callable[[Dict[str, Any]], str]]] = {
+    'command': {
+        'Bash': lambda t: t.get('command', ''),
+    },
+    'content': {
+        # Write uses 'content', Edit has 'new_string'
+        'Write': lambda t: t.get('content') or t.get('new_string', ''),
+        'Edit': lambda t: t.get('content') or t.get('new_string', ''),
+        'MultiEdit': _multiedit_new_text,
+    },
+    'new_text': {
+        'Write': lambda t: t.get('new_string', ''),
+        'Edit': lambda t: t.get('new_string', ''),
+        'MultiEdit': _multiedit_new_text,
+    },
+    'new_string': {
+        'Write': lambda t: t.get('new_string', ''),
+        'Edit': lambda t: t.get('new_string', ''),
+    },
+    'old_text': {
+        'Write': lambda t: t.get('old_string', ''),
+        'Edit': lambda t: t.get('old_string', ''),
+    },
+    'old_string': {
+        'Write': lambda t: t.get('old_string', ''),
+        'Edit': lambda t: t.get('old_string', ''),
+    },
+    'file_path': {
+        'Write': lambda t: t.get('file_path', ''),
+        'Edit': lambda t: t.get('file_path', ''),
+        'MultiEdit': lambda t: t.get('file_path', ''),
+    },
+}
+
+FieldExtractor = Callable[[str, Dict[str, Any], Optional[Dict[str, Any]]], Optional[str]]
+
+
+@lru_cache(maxsize=None)
+def field_extractor(field: str) -> FieldExtractor:
+    """Build the extractor for a condition field.
+
+    The extractor takes (tool_name, tool_input, input_data) and returns the
+    field value as a string, or None if the field does not apply. Lookup
+    order: tool_input keys, hook-input fields, then tool-specific aliases.
+    """
+    input_getter = _INPUT_FIELDS.get(field)
+    tool_getters = _TOOL_FIELDS.get(field, {})
+
+    def extract(tool_name: str, tool_input: Dict[str, Any],
+                input_data: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        # Direct tool_input fields
+        if field in tool_input:
+            value = tool_input[field]
+            if isinstance(value, str):
+                return value
+            return str(value)
+
+        # For Stop events and other non-tool events, check input_data
+        if input_data and input_getter is not None:
+            value = input_getter(input_data)
+            if value is not None:
+                return value
+
+        # Handle special cases by tool type
+        getter = tool_getters.get(tool_name)
+        if getter is not None:
+            return getter(tool_input)
+        return None
+
+    return extract
+
+
+# Operators other than regex_match, which is handled by RegexGroup
+_OPERATORS: Dict[str, Callable[[str, str], bool]] = {
+    'contains': lambda pattern, value: pattern in value,
+    'equals': lambda pattern, value: pattern == value,
+    'not_contains': lambda pattern, value: pattern not in value,
+    'starts_with': lambda pattern, value: value.startswith(pattern),
+    'ends_with': lambda pattern, value: value.endswith(pattern),
+}
+
+def _literal_requirement(subpattern) -> Optional[Tuple[str, ...]]:
+    """Best requirement for a parsed (sub)pattern: literals, one of which
+    must occur in any match, or None if no literal is guaranteed."""
+    best: Optional[Tuple[str, ...]] = None
+    run: List[str] = []
+
+    def consider(candidate: Optional[Tuple[str, ...]]):
+        nonlocal best
+        if not candidate or not all(candidate):
+            return
+        # Prefer the longest shortest-alternative, then fewer alternatives
+        if best is None or (min(map(len, candidate)), -len(candidate)) > (min(map(len, best)), -len(best)):
+            best = candidate
+
+    for op, av in subpattern:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        consider((''.join(run),))
+        run = []
+        if op is sre_parse.SUBPATTERN:
+            consider(_literal_requirement(av[-1]))
+        elif op is sre_parse.BRANCH:
+            alternatives = [_literal_requirement(branch) for branch in av[1]]
+            if all(alternatives):
+                consider(tuple(sorted({lit for alt in alternatives for lit in alt})))
+        elif op in _REPEATS and av[0] >= 1:
+            consider(_literal_requirement(av[2]))
+    consider((''.join(run),))
+    return best
+
+
+_REPEATS = tuple(getattr(sre_parse, name) for name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+                 if hasattr(sre_parse, name))
+
+
+def required_literals(pattern: str) -> Optional[Tuple[str, ...]]:
+    """Lowercased ASCII literals, one of which occurs in any text that the
+    case-insensitive pattern matches; None if the pattern guarantees none.
+
+    Examples: rm\\s+-rf -> ('-rf',), (npm|yarn) test -> (' test',),
+    (npm|yarn)\\b -> ('npm', 'yarn').
+    """
+    try:
+        requirement = _literal_requirement(sre_parse.parse(pattern))
+    except Exception:
+        return None
+    if requirement is None or not all(lit.isascii() for lit in requirement):
+        return None
+    return tuple(sorted({lit.lower() for lit in requirement}))
+
+
+class RegexGroup:
+    """All regex_match patterns applied to one field, scanned together.
+
+    Patterns are indexed by their required literals. A scan checks each
+    distinct literal once with a substring test and searches only patterns
+    whose literal is present (plus those without one), returning the slots
+    of every pattern that matches. Non-ASCII text, where case folding could
+    disagree with re.IGNORECASE, falls back to searching every pattern.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = patterns
+        self._regexes: List[Optional[re.Pattern]] = []
+        self._by_literal: Dict[str, List[int]] = {}
+        self._unindexed: List[int] = []
+
+        for slot, pattern in enumerate(patterns):
+            try:
+                regex = compile_regex(pattern)
+            except re.error as e:
+                print(f"Invalid regex pattern '{pattern}': {e}", file=sys.stderr)
+                self._regexes.append(None)
+                continue
+            self._regexes.append(regex)
+
+            literals = required_literals(pattern)
+            if literals is None:
+                self._unindexed.append(slot)
+            else:
+                for literal in literals:
+                    self._by_literal.setdefault(literal, []).append(slot)
+
+        self._all_slots = [slot for slot, regex in enumerate(self._regexes) if regex is not None]
+
+    def scan(self, text: str) -> Set[int]:
+        """Return the slots of every pattern that matches text."""
+        if text.isascii():
+            folded = text.lower()
+            candidates = set(self._unindexed)
+            for literal, slots in self._by_literal.items():
+                if literal in folded:
+                    candidates.update(slots)
+        else:
+            candidates = self._all_slots
+
+        return {slot for slot in candidates if self._regexes[slot].search(text)}
+
+
+_STRING_ANCHORS = (sre_parse.AT_BEGINNING, sre_parse.AT_BEGINNING_STRING,
+                   sre_parse.AT_END, sre_parse.AT_END_STRING)
+
+
+def _anchored(subpattern) -> bool:
+    """True if a parsed pattern uses ^, $, \\A or \\Z anywhere."""
+    for op, av in subpattern:
+        if op is sre_parse.AT:
+            if av in _STRING_ANCHORS:
+                return True
+            continue
+        for arg in av if isinstance(av, (tuple, list)) else ():
+            nested = arg if isinstance(arg, list) else [arg]
+            if any(isinstance(p, sre_parse.SubPattern) and _anchored(p) for p in nested):
+                return True
+    return False
+
+
+def _transcript_needle(operator: str, pattern: str) -> Optional[Tuple[str, Callable[[str], bool]]]:
+    """(key, predicate) for a transcript condition that can be evaluated
+    chunk by chunk, or None if it needs the whole transcript at once
+    (equals/starts_with/ends_with, or a regex anchored to the string ends).
+    """
+    if operator in ('contains', 'not_contains'):
+        return f'in:{pattern}', lambda text: pattern in text
+    if operator != 'regex_match':
+        return None
+    try:
+        if _anchored(sre_parse.parse(pattern)):
+            return None
+        regex = compile_regex(pattern)
+    except re.error as e:
+        print(f"Invalid regex pattern '{pattern}': {e}", file=sys.stderr)
+        return f're:{pattern}', lambda text: False
+    return f're:{pattern}', lambda text: regex.search(text) is not None
+
+
+# A compiled condition: (field, regex slot or -1, operator test or None,
+# (transcript needle key, negate) or None)
+CompiledCondition = Tuple[str, int, Optional[Callable[[str], bool]], Optional[Tuple[str, bool]]]
+
+# Marks the transcript as not yet scanned during one evaluation
+_UNSCANNED = object()
+
+
+class RuleBucket:
+    """The rules that apply to one (event, tool name), compiled for evaluation."""
+
+    def __init__(self, rules: List[Rule]):
+        self.rules: List[Tuple[Rule, List[CompiledCondition]]] = []
+        self.transcript_needles: Dict[str, Callable[[str], bool]] = {}
+        patterns: Dict[str, Dict[str, int]] = {}
+
+        for rule in rules:
+            compiled = []
+            for condition in rule.conditions:
+                stream = None
+                if condition.field == 'transcript':
+                    needle = _transcript_needle(condition.operator, condition.pattern)
+                    if needle is not None:
+                        self.transcript_needles[needle[0]] = needle[1]
+                        stream = (needle[0], condition.operator == 'not_contains')
+
+                if condition.operator == 'regex_match':
+                    slots = patterns.setdefault(condition.field, {})
+                    slot = slots.setdefault(condition.pattern, len(slots))
+                    compiled.append((condition.field, slot, None, stream))
+                elif condition.operator in _OPERATORS:
+                    op = _OPERATORS[condition.operator]
+                    compiled.append((condition.field, -1,
+                                     lambda value, op=op, pattern=condition.pattern: op(pattern, value),
+                                     stream))
+                else:
+                    # Unknown operator never matches
+                    compiled.append((condition.field, -1, lambda value: False, None))
+            self.rules.append((rule, compiled))
+
+        self.regex_groups: Dict[str, RegexGroup] = {
+            field: RegexGroup(list(slots)) for field, slots in patterns.items()
+        }
+
+    def matching_rules(self, tool_name: str, tool_input: Dict[str, Any],
+                       input_data: Dict[str, Any]) -> List[Rule]:
+        """Return the rules whose conditions all match, in rule order.
+
+        Each field is extracted at most once and each field's regex group is
+        scanned at most once per call. Transcript conditions are evaluated
+        together in one bounded streaming pass over transcript_path.
+        """
+        values: Dict[str, Optional[str]] = {}
+        hits: Dict[str, Set[int]] = {}
+        transcript_hits = _UNSCANNED
+        matched = []
+
+        for rule, conditions in self.rules:
+            for field, slot, test, stream in conditions:
+                if stream is not None:
+                    if transcript_hits is _UNSCANNED:
+                        transcript_hits = self._scan_transcript(tool_input, input_data)
+                    if transcript_hits is not None:
+                        key, negate = stream
+                        if (key in transcript_hits) == negate:
+                            break
+                        continue
+
+                if field in values:
+                    value = values[field]
+                else:
+                    value = values[field] = field_extractor(field)(tool_name, tool_input, input_data)
+                if value is None:
+                    break
+                if test is not None:
+                    if not test(value):
+                        break
+                else:
+                    field_hits = hits.get(field)
+                    if field_hits is None:
+                        field_hits = hits[field] = self.regex_groups[field].scan(value)
+                    if slot not in field_hits:
+                        break
+            else:
+                matched.append(rule)
+
+        return matched
+
+    def _scan_transcript(self, tool_input: Dict[str, Any],
+                         input_data: Dict[str, Any]) -> Optional[Set[str]]:
+        """Needle keys found in the transcript file, or None if the field
+        does not come from transcript_path for this call."""
+        if 'transcript' in tool_input or not input_data:
+            return None
+        transcript_path = input_data.get('transcript_path')
+        if not transcript_path:
+            return None
+        return TranscriptScanner(transcript_path).scan(self.transcript_needles)
+
+
+class RuleIndex:
+    """Rules compiled once and bucketed by event and tool name.
+
+    Buckets are built lazily for each (event, tool_name) seen and reused by
+    every later call with the same key. Rules without conditions are dropped
+    at compile time since they can never match.
+    """
+
+    def __init__(self, rules: List[Rule]):
+        self.rules = rules
+        self._entries: List[Tuple[Rule, Optional[Set[str]]]] = []
+        for rule in rules:
+            if not rule.conditions:
+                continue
+            tools = None
+            if rule.tool_matcher and rule.tool_matcher != '*':
+                tools = set(rule.tool_matcher.split('|'))
+            self._entries.append((rule, tools))
+        self._buckets: Dict[Tuple[Optional[str], str], RuleBucket] = {}
+
+    def bucket(self, event: Optional[str], tool_name: str) -> RuleBucket:
+        """Return the compiled bucket for an event (None = any) and tool."""
+        key = (event, tool_name)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = RuleBucket([
+                rule for rule, tools in self._entries
+                if (event is None or rule.event == 'all' or rule.event == event)
+                and (tools is None or tool_name in tools)
+            ])
+            self._buckets[key] = bucket
+        return bucket
+
+
 class RuleEngine:
     """Evaluates rules against hook input data."""
 
     def __init__(self):
         """Initialize rule engine."""
-        # No need for instance cache anymore - using global lru_cache
-        pass
+        # Most recently compiled rule list and its index
+        self._compiled: Optional[Tuple[List[Rule], RuleIndex]] = None
+
+    def compile(self, rules: List[Rule]) -> RuleIndex:
+        """Compile rules into an index, reusing it for the same list object."""
+        if self._compiled is None or self._compiled[0] is not rules:
+            self._compiled = (rules, RuleIndex(rules))
+        return self._compiled[1]
 
-    def evaluate_rules(self, rules: List[Rule], input_data: Dict[str, Any]) -> Dict[str, Any]:
+    def evaluate_rules(self, rules: Union[List[Rule], RuleIndex], input_data: Dict[str, Any],
+                       event: Optional[str] = None) -> Dict[str, Any]:
         """Evaluate all rules and return combined results.
 
         Checks all rules and accumulates matches. Blocking rules take priority
         over warning rules. All matching rule messages are combined.
 
         Args:
-            rules: List of Rule objects to evaluate
+            rules: List of Rule objects, or a RuleIndex compiled from them
             input_data: Hook input JSON (tool_name, tool_input, etc.)
+            event: Optional event filter ("bash", "file", ...) for rule
+                lists that were not already filtered by load_rules()
 
         Returns:
             Response dict with systemMessage, hookSpecificOutput, etc.
             Empty dict {} if no rules match.
         """
+        index = rules if isinstance(rules, RuleIndex) else self.compile(rules)
         hook_event = input_data.get('hook_event_name', '')
+        tool_name = input_data.get('tool_name', '')
+        tool_input = input_data.get('tool_input', {})
         blocking_rules = []
         warning_rules = []
 
-        for rule in rules:
-            if self._rule_matches(rule, input_data):
-                if rule.action == 'block':
-                    blocking_rules.append(rule)
-                else:
-                    warning_rules.append(rule)
+        for rule in index.bucket(event, tool_name).matching_rules(tool_name, tool_input, input_data):
+            if rule.action == 'block':
+                blocking_rules.append(rule)
+            else:
+                warning_rules.append(rule)
 
         # If any blocking rules matched, block the operation
         if blocking_rules:
@@ -93,185 +505,6 @@ class RuleEngine:
         # No matches - allow operation
         return {}
 
-    def _rule_matches(self, rule: Rule, input_data: Dict[str, Any]) -> bool:
-        """Check if rule matches input data.
-
-        Args:
-            rule: Rule to evaluate
-            input_data: Hook input data
-
-        Returns:
-            True if rule matches, False otherwise
-        """
-        # Extract tool information
-        tool_name = input_data.get('tool_name', '')
-        tool_input = input_data.get('tool_input', {})
-
-        # Check tool matcher if specified
-        if rule.tool_matcher:
-            if not self._matches_tool(rule.tool_matcher, tool_name):
-                return False
-
-        # If no conditions, don't match
-        # (Rules must have at least one condition to be valid)
-        if not rule.conditions:
-            return False
-
-        # All conditions must match
-        for condition in rule.conditions:
-            if not self._check_condition(condition, tool_name, tool_input, input_data):
-                return False
-
-        return True
-
-    def _matches_tool(self, matcher: str, tool_name: str) -> bool:
-        """Check if tool_name matches the matcher pattern.
-
-        Args:
-            matcher: Pattern like "Bash", "Edit|Write", "*"
-            tool_name: Actual tool name
-
-        Returns:
-            True if matches
-        """
-        if matcher == '*':
-            return True
-
-        # Split on | for OR matching
-        patterns = matcher.split('|')
-        return tool_name in patterns
-
-    def _check_condition(self, condition: Condition, tool_name: str,
-                        tool_input: Dict[str, Any], input_data: Dict[str, Any] = None) -> bool:
-        """Check if a single condition matches.
-
-        Args:
-            condition: Condition to check
-            tool_name: Tool being used
-            tool_input: Tool input dict
-            input_data: Full hook input data (for Stop events, etc.)
-
-        Returns:
-            True if condition matches
-        """
-        # Extract the field value to check
-        field_value = self._extract_field(condition.field, tool_name, tool_input, input_data)
-        if field_value is None:
-            return False
-
-        # Apply operator
-        operator = condition.operator
-        pattern = condition.pattern
-
-        if operator == 'regex_match':
-            return self._regex_match(pattern, field_value)
-        elif operator == 'contains':
-            return pattern in field_value
-        elif operator == 'equals':
-            return pattern == field_value
-        elif operator == 'not_contains':
-            return pattern not in field_value
-        elif operator == 'starts_with':
-            return field_value.startswith(pattern)
-        elif operator == 'ends_with':
-            return field_value.endswith(pattern)
-        else:
-            # Unknown operator
-            return False
-
-    def _extract_field(self, field: str, tool_name: str,
-                      tool_input: Dict[str, Any], input_data: Dict[str, Any] = None) -> Optional[str]:
-        """Extract field value from tool input or hook input data.
-
-        Args:
-            field: Field name like "command", "new_text", "file_path", "reason", "transcript"
-            tool_name: Tool being used (may be empty for Stop events)
-            tool_input: Tool input dict
-            input_data: Full hook input (for accessing transcript_path, reason, etc.)
-
-        Returns:
-            Field value as string, or None if not found
-        """
-        # Direct tool_input fields
-        if field in tool_input:
-            value = tool_input[field]
-            if isinstance(value, str):
-                return value
-            return str(value)
-
-        # For Stop events and other non-tool events, check input_data
-        if input_data:
-            # Stop event specific fields
-            if field == 'reason':
-                return input_data.get('reason', '')
-            elif field == 'transcript':
-                # Read transcript file if path provided
-                transcript_path = input_data.get('transcript_path')
-                if transcript_path:
-                    try:
-                        with open(transcript_path, 'r') as f:
-                            return f.read()
-                    except FileNotFoundError:
-                        print(f"Warning: Transcript file not found: {transcript_path}", file=sys.stderr)
-                        return ''
-                    except PermissionError:
-                        print(f"Warning: Permission denied reading transcript: {transcript_path}", file=sys.stderr)
-                        return ''
-                    except (IOError, OSError) as e:
-                        print(f"Warning: Error reading transcript {transcript_path}: {e}", file=sys.stderr)
-                        return ''
-                    except UnicodeDecodeError as e:
-                        print(f"Warning: Encoding error in transcript {transcript_path}: {e}", file=sys.stderr)
-                        return ''
-            elif field == 'user_prompt':
-                # For UserPromptSubmit events
-                return input_data.get('user_prompt', '')
-
-        # Handle special cases by tool type
-        if tool_name == 'Bash':
-            if field == 'command':
-                return tool_input.get('command', '')
-
-        elif tool_name in ['Write', 'Edit']:
-            if field == 'content':
-                # Write uses 'content', Edit has 'new_string'
-                return tool_input.get('content') or tool_input.get('new_string', '')
-            elif field == 'new_text' or field == 'new_string':
-                return tool_input.get('new_string', '')
-            elif field == 'old_text' or field == 'old_string':
-                return tool_input.get('old_string', '')
-            elif field == 'file_path':
-                return tool_input.get('file_path', '')
-
-        elif tool_name == 'MultiEdit':
-            if field == 'file_path':
-                return tool_input.get('file_path', '')
-            elif field in ['new_text', 'content']:
-                # Concatenate all edits
-                edits = tool_input.get('edits', [])
-                return ' '.join(e.get('new_string', '') for e in edits)
-
-        return None
-
-    def _regex_match(self, pattern: str, text: str) -> bool:
-        """Check if pattern matches text using regex.
-
-        Args:
-            pattern: Regex pattern
-            text: Text to match against
-
-        Returns:
-            True if pattern matches
-        """
-        try:
-            # Use cached compiled regex (LRU cache with max 128 patterns)
-            regex = compile_regex(pattern)
-            return bool(regex.search(text))
-
-        except re.error as e:
-            print(f"Invalid regex pattern '{pattern}': {e}", file=sys.stderr)
-            return False
-
 
 # For testing
 if __name__ == '__main__':
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Bounded streaming scans over JSONL session transcripts.
+
+Stop-event rules test the "transcript" field, which can grow to tens of
+megabytes. Instead of reading the whole file for every condition, the
+transcript is streamed in line-aligned chunks, each searched together with
+an overlap window carried over from the previous chunk, and the scan stops
+as soon as every condition has matched.
+
+Transcripts only grow, so the result per condition is remembered in a
+small state file: a condition that matched stays matched, and one that did
+not is only checked against the bytes appended since the last Stop event.
+State files not updated for TRANSCRIPT_STATE_MAX_AGE_DAYS are deleted
+whenever a new transcript gets one.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+from typing import Callable, Dict, Optional, Set
+
+from core.config_loader import cache_dir
+
+# Bytes read per chunk (extended to the next line break)
+TRANSCRIPT_CHUNK = 1024 * 1024
+# Characters of the previous chunk searched again with the next one, so
+# matches spanning a chunk boundary are found if no longer than this
+TRANSCRIPT_OVERLAP = 64 * 1024
+
+# Offset recorded for a condition that has already matched
+MATCHED = -1
+
+# State files of transcripts without a Stop event for this long are deleted
+TRANSCRIPT_STATE_MAX_AGE_DAYS = 30
+
+
+def transcript_state_path(transcript_path: str) -> Optional[str]:
+    """State file for a transcript, or None if caching is disabled."""
+    base = cache_dir()
+    if not base:
+        return None
+    key = hashlib.sha1(os.path.abspath(transcript_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(base, 'transcripts', f'{key}.json')
+
+
+def prune_transcript_states(state_dir: str) -> None:
+    """Delete state files in state_dir not updated for TRANSCRIPT_STATE_MAX_AGE_DAYS."""
+    cutoff = time.time() - TRANSCRIPT_STATE_MAX_AGE_DAYS * 24 * 60 * 60
+    try:
+        entries = list(os.scandir(state_dir))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+class TranscriptScanner:
+    """Streams one transcript file against a set of named predicates."""
+
+    def __init__(self, path: str, state_path: Optional[str] = None):
+        self.path = path
+        self.state_path = state_path if state_path is not None else transcript_state_path(path)
+
+    def _load_state(self, st: os.stat_result) -> Dict[str, int]:
+        """Per-key scanned offsets, discarded if the file was replaced or shrank."""
+        if not self.state_path:
+            return {}
+        try:
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        offsets = state.get('offsets')
+        if (state.get('path') != os.path.abspath(self.path) or state.get('inode') != st.st_ino
+                or not isinstance(offsets, dict)
+                or any(offset > st.st_size for offset in offsets.values())):
+            return {}
+        return offsets
+
+    def _save_state(self, st: os.stat_result, offsets: Dict[str, int]) -> None:
+        if not self.state_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            new = not os.path.exists(self.state_path)
+            tmp_path = f'{self.state_path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({'path': os.path.abspath(self.path), 'inode': st.st_ino, 'offsets': offsets}, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError:
+            return
+        # Once per transcript, so the directory does not grow without bound
+        if new:
+            prune_transcript_states(os.path.dirname(self.state_path))
+
+    def scan(self, needles: Dict[str, Callable[[str], bool]]) -> Set[str]:
+        """Return the keys of needles whose predicate matches the transcript.
+
+        Read errors are reported and treated as an empty transcript, as when
+        the whole file was read at once.
+        """
+        try:
+            st = os.stat(self.path)
+            offsets = self._load_state(st)
+            found = {key for key in needles if offsets.get(key) == MATCHED}
+            pending = {key: offsets.get(key, 0) for key in needles if key not in found}
+            if not pending:
+                return found
+
+            scanned_to = self._stream(min(pending.values()), pending, needles, found)
+            for key in pending:
+                offsets[key] = MATCHED if key in found else scanned_to
+
+        except FileNotFoundError:
+            print(f"Warning: Transcript file not found: {self.path}", file=sys.stderr)
+            return {key for key, test in needles.items() if test('')}
+        except PermissionError:
+            print(f"Warning: Permission denied reading transcript: {self.path}", file=sys.stderr)
+            return {key for key, test in needles.items() if test('')}
+        except (IOError, OSError) as e:
+            print(f"Warning: Error reading transcript {self.path}: {e}", file=sys.stderr)
+            return {key for key, test in needles.items() if test('')}
+
+        self._save_state(st, offsets)
+        return found
+
+    def _stream(self, start: int, pending: Dict[str, int],
+                needles: Dict[str, Callable[[str], bool]], found: Set[str]) -> int:
+        """Search from byte offset start, adding matches to found.
+
+        Returns the offset just past the last complete line searched; a
+        trailing line still being written is searched again next time.
+        """
+        remaining = list(pending)
+        scanned_to = start
+
+        with open(self.path, 'rb') as f:
+            overlap = ''
+            if start > 0:
+                # Re-read the overlap window before start, from a line start
+                back = max(0, start - TRANSCRIPT_OVERLAP)
+                f.seek(back)
+                prefix = f.read(start - back)
+                if back > 0:
+                    newline = prefix.find(b'\n')
+                    prefix = prefix[newline + 1:] if newline >= 0 else b''
+                overlap = prefix.decode('utf-8', 'replace')
+
+            searched = False
+            leftover = b''
+            while remaining:
+                block = f.read(TRANSCRIPT_CHUNK)
+                data = leftover + block
+                if block:
+                    cut = data.rfind(b'\n') + 1
+                    if not cut:
+                        if len(data) < 4 * TRANSCRIPT_CHUNK:
+                            # Inside one long line: keep reading
+                            leftover = data
+                            continue
+                        # Bound memory on pathological lines
+                        cut = len(data)
+                    complete, leftover = data[:cut], data[cut:]
+                    scanned_to += cut
+                else:
+                    # End of file: search the trailing partial line, but
+                    # leave it unscanned since it may still be written
+                    complete, leftover = data, b''
+                    if not complete and searched:
+                        break
+
+                text = overlap + complete.decode('utf-8', 'replace')
+                for key in list(remaining):
+                    if needles[key](text):
+                        found.add(key)
+                        remaining.remove(key)
+                searched = True
+                overlap = text[-TRANSCRIPT_OVERLAP:]
+                if not block:
+                    break
+
+        return scanned_to
@@ -15,8 +15,7 @@ if PLUGIN_ROOT and PLUGIN_ROOT not in sys.path:
     sys.path.insert(0, PLUGIN_ROOT)
 
 try:
-    from core.config_loader import load_rules
-    from core.rule_engine import RuleEngine
+    from core.client import evaluate
 except ImportError as e:
     # If imports fail, allow operation and log error
     error_msg = {"systemMessage": f"Hookify import error: {e}"}
@@ -40,12 +39,8 @@ def main():
         elif tool_name in ['Edit', 'Write', 'MultiEdit']:
             event = 'file'
 
-        # Load rules
-        rules = load_rules(event=event)
-
-        # Evaluate rules
-        engine = RuleEngine()
-        result = engine.evaluate_rules(rules, input_data)
+        # Evaluate rules (in the resident daemon when one is running)
+        result = evaluate(event, input_data)
 
         # Always output JSON (even if empty)
         print(json.dumps(result), file=sys.stdout)
@@ -15,8 +15,7 @@ if PLUGIN_ROOT and PLUGIN_ROOT not in sys.path:
     sys.path.insert(0, PLUGIN_ROOT)
 
 try:
-    from core.config_loader import load_rules
-    from core.rule_engine import RuleEngine
+    from core.client import evaluate
 except ImportError as e:
     error_msg = {"systemMessage": f"Hookify import error: {e}"}
     print(json.dumps(error_msg), file=sys.stdout)
@@ -29,12 +28,8 @@ def main():
         # Read input from stdin
         input_data = json.load(sys.stdin)
 
-        # Load stop rules
-        rules = load_rules(event='stop')
-
-        # Evaluate rules
-        engine = RuleEngine()
-        result = engine.evaluate_rules(rules, input_data)
+        # Evaluate rules (in the resident daemon when one is running)
+        result = evaluate('stop', input_data)
 
         # Always output JSON (even if empty)
         print(json.dumps(result), file=sys.stdout)
@@ -4,15 +4,30 @@ Security Reminder Hook for Claude Code
 This hook checks for security patterns in file edits and warns about potential vulnerabilities.
 """
 
+import hashlib
 import json
 import os
 import random
+import sqlite3
 import sys
+import time
 from datetime import datetime
 
 # Debug log file
 DEBUG_LOG_FILE = "/tmp/security-warnings-log.txt"
 
+# Shown warnings and cached content scans, shared by concurrent hook runs
+STATE_DB_FILE = "~/.claude/security_warnings.db"
+STATE_MAX_AGE_DAYS = 30
+# Per-session JSON state and scan cache files of earlier versions
+LEGACY_STATE_PREFIX = "security_warnings_state_"
+LEGACY_SCAN_CACHE_FILE = "security_scan_cache.json"
+
+# Content scan results are cached by content hash for edits at least this
+# large; smaller contents are cheaper to rescan than to look up
+SCAN_CACHE_MIN_CHARS = 64 * 1024
+SCAN_CACHE_MAX_ENTRIES = 256
+
 
 def debug_log(message):
     """Append debug message to log file with timestamp."""
@@ -25,8 +40,6 @@ def debug_log(message):
         pass
 
 
-# State file to track warnings shown (session-scoped using session ID)
-
 # Security patterns configuration
 SECURITY_PATTERNS = [
     {
@@ -126,76 +139,210 @@ Only use exec() if you absolutely need shell features and the input is guarantee
 ]
 
 
-def get_state_file(session_id):
-    """Get session-specific state file path."""
-    return os.path.expanduser(f"~/.claude/security_warnings_state_{session_id}.json")
+def build_substring_index(patterns):
+    """Map each distinct substring to the indexes of the patterns using it."""
+    index = {}
+    for i, pattern in enumerate(patterns):
+        for substring in pattern.get("substrings", ()):
+            index.setdefault(substring, []).append(i)
+    return index
 
 
-def cleanup_old_state_files():
-    """Remove state files older than 30 days."""
-    try:
-        state_dir = os.path.expanduser("~/.claude")
-        if not os.path.exists(state_dir):
-            return
-
-        current_time = datetime.now().timestamp()
-        thirty_days_ago = current_time - (30 * 24 * 60 * 60)
-
-        for filename in os.listdir(state_dir):
-            if filename.startswith("security_warnings_state_") and filename.endswith(
-                ".json"
-            ):
-                file_path = os.path.join(state_dir, filename)
-                try:
-                    file_mtime = os.path.getmtime(file_path)
-                    if file_mtime < thirty_days_ago:
-                        os.remove(file_path)
-                except (OSError, IOError):
-                    pass  # Ignore errors for individual file cleanup
-    except Exception:
-        pass  # Silently ignore cleanup errors
-
-
-def load_state(session_id):
-    """Load the state of shown warnings from file."""
-    state_file = get_state_file(session_id)
-    if os.path.exists(state_file):
-        try:
-            with open(state_file, "r") as f:
-                return set(json.load(f))
-        except (json.JSONDecodeError, IOError):
-            return set()
-    return set()
-
-
-def save_state(session_id, shown_warnings):
-    """Save the state of shown warnings to file."""
-    state_file = get_state_file(session_id)
-    try:
-        os.makedirs(os.path.dirname(state_file), exist_ok=True)
-        with open(state_file, "w") as f:
-            json.dump(list(shown_warnings), f)
-    except IOError as e:
-        debug_log(f"Failed to save state file: {e}")
-        pass  # Fail silently if we can't save state
+# Built once per process; shared substrings are scanned only once
+SUBSTRING_INDEX = build_substring_index(SECURITY_PATTERNS)
 
+# Changes whenever the content patterns change, invalidating cached scans
+PATTERNS_FINGERPRINT = hashlib.sha1(
+    json.dumps(list(SUBSTRING_INDEX.items())).encode("utf-8")
+).hexdigest()[:12]
 
-def check_patterns(file_path, content):
-    """Check if file path or content matches any security patterns."""
+
+_state_db = None
+
+
+def get_state_db():
+    """Open (once per process) the SQLite state store, or None if unavailable.
+
+    WAL mode lets several hook processes read and write concurrently. Old
+    warnings and surplus scan cache entries are expired in bulk on 10% of
+    the runs that open the store. The run that creates the store deletes
+    the JSON state files it replaces.
+    """
+    global _state_db
+    if _state_db is not None:
+        return _state_db
+    try:
+        db_file = os.path.expanduser(STATE_DB_FILE)
+        os.makedirs(os.path.dirname(db_file), exist_ok=True)
+        created = not os.path.exists(db_file)
+        conn = sqlite3.connect(db_file, timeout=5.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS shown_warnings (
+                session_id TEXT NOT NULL,
+                warning_key TEXT NOT NULL,
+                created REAL NOT NULL,
+                PRIMARY KEY (session_id, warning_key)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS shown_warnings_created ON shown_warnings (created);
+            CREATE TABLE IF NOT EXISTS scan_cache (
+                key TEXT PRIMARY KEY,
+                rules TEXT NOT NULL,
+                used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS scan_cache_used ON scan_cache (used);
+            """
+        )
+        if created:
+            remove_legacy_state_files(os.path.dirname(db_file))
+        if random.random() < 0.1:
+            expire_state(conn)
+        _state_db = conn
+    except sqlite3.Error as e:
+        debug_log(f"Failed to open state store: {e}")
+        return None
+    return _state_db
+
+
+def remove_legacy_state_files(state_dir):
+    """Delete the JSON state files earlier versions kept in state_dir."""
+    try:
+        filenames = os.listdir(state_dir)
+    except OSError:
+        return
+    for filename in filenames:
+        if filename == LEGACY_SCAN_CACHE_FILE or (
+            filename.startswith(LEGACY_STATE_PREFIX) and filename.endswith(".json")
+        ):
+            try:
+                os.remove(os.path.join(state_dir, filename))
+            except OSError:
+                pass  # Ignore errors for individual file cleanup
+
+
+def expire_state(conn):
+    """Delete warnings older than STATE_MAX_AGE_DAYS and trim the scan cache."""
+    cutoff = time.time() - STATE_MAX_AGE_DAYS * 24 * 60 * 60
+    try:
+        conn.execute("DELETE FROM shown_warnings WHERE created < ?", (cutoff,))
+        conn.execute(
+            "DELETE FROM scan_cache WHERE used < ("
+            "SELECT used FROM scan_cache ORDER BY used DESC LIMIT 1 OFFSET ?)",
+            (SCAN_CACHE_MAX_ENTRIES - 1,),
+        )
+    except sqlite3.Error as e:
+        debug_log(f"Failed to expire state: {e}")
+
+
+def record_warnings(session_id, warning_keys):
+    """Record warnings as shown for the session; return the keys that were new.
+
+    INSERT OR IGNORE makes the check-and-set atomic across concurrent hook
+    processes. If the store is unavailable every warning counts as new.
+    """
+    conn = get_state_db()
+    if conn is None:
+        return set(warning_keys)
+    new_keys = set()
+    now = time.time()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        for key in warning_keys:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO shown_warnings VALUES (?, ?, ?)",
+                (session_id, key, now),
+            )
+            if cursor.rowcount:
+                new_keys.add(key)
+        conn.execute("COMMIT")
+    except sqlite3.Error as e:
+        debug_log(f"Failed to record warnings: {e}")
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        return set(warning_keys)
+    return new_keys
+
+
+def scan_content(content):
+    """Return the indexes of all SECURITY_PATTERNS whose substrings occur in content.
+
+    Each distinct substring is searched at most once, and substrings whose
+    patterns have all matched already are skipped. (str.__contains__ runs in
+    C and measured faster than a regex alternation or an Aho-Corasick pass.)
+    """
+    hits = set()
+    if not content:
+        return hits
+    for substring, pattern_indexes in SUBSTRING_INDEX.items():
+        if hits.issuperset(pattern_indexes):
+            continue
+        if substring in content:
+            hits.update(pattern_indexes)
+    return hits
+
+
+def cached_scan_content(content):
+    """scan_content() with results for large contents cached by content hash."""
+    if len(content) < SCAN_CACHE_MIN_CHARS:
+        return scan_content(content)
+    conn = get_state_db()
+    if conn is None:
+        return scan_content(content)
+
+    key = f"{PATTERNS_FINGERPRINT}:" + hashlib.sha1(
+        content.encode("utf-8", "surrogatepass")
+    ).hexdigest()
+    try:
+        row = conn.execute("SELECT rules FROM scan_cache WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            conn.execute("UPDATE scan_cache SET used = ? WHERE key = ?", (time.time(), key))
+            names = set(json.loads(row[0]))
+            return {
+                i for i, pattern in enumerate(SECURITY_PATTERNS)
+                if pattern["ruleName"] in names
+            }
+    except (sqlite3.Error, ValueError) as e:
+        debug_log(f"Failed to read scan cache: {e}")
+
+    hits = scan_content(content)
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO scan_cache VALUES (?, ?, ?)",
+            (key, json.dumps([SECURITY_PATTERNS[i]["ruleName"] for i in sorted(hits)]), time.time()),
+        )
+    except sqlite3.Error as e:
+        debug_log(f"Failed to write scan cache: {e}")
+    return hits
+
+
+def find_security_matches(file_path, content):
+    """Return (ruleName, reminder) for every security pattern matching the
+    file path or content, in SECURITY_PATTERNS order."""
     # Normalize path by removing leading slashes
     normalized_path = file_path.lstrip("/")
+    content_hits = cached_scan_content(content) if content else set()
 
-    for pattern in SECURITY_PATTERNS:
+    matches = []
+    for i, pattern in enumerate(SECURITY_PATTERNS):
         # Check path-based patterns
         if "path_check" in pattern and pattern["path_check"](normalized_path):
-            return pattern["ruleName"], pattern["reminder"]
-
+            matches.append((pattern["ruleName"], pattern["reminder"]))
         # Check content-based patterns
-        if "substrings" in pattern and content:
-            for substring in pattern["substrings"]:
-                if substring in content:
-                    return pattern["ruleName"], pattern["reminder"]
+        elif i in content_hits:
+            matches.append((pattern["ruleName"], pattern["reminder"]))
+    return matches
+
+
+def check_patterns(file_path, content):
+    """Check if file path or content matches any security patterns.
 
+    Returns the first matching (ruleName, reminder), or (None, None).
+    """
+    matches = find_security_matches(file_path, content)
+    if matches:
+        return matches[0]
     return None, None
 
 
@@ -223,10 +370,6 @@ def main():
     if security_reminder_enabled == "0":
         sys.exit(0)
 
-    # Periodically clean up old state files (10% chance per run)
-    if random.random() < 0.1:
-        cleanup_old_state_files()
-
     # Read input from stdin
     try:
         raw_input = sys.stdin.read()
@@ -253,23 +396,22 @@ def main():
     content = extract_content_from_input(tool_name, tool_input)
 
     # Check for security patterns
-    rule_name, reminder = check_patterns(file_path, content)
-
-    if rule_name and reminder:
-        # Create unique warning key
-        warning_key = f"{file_path}-{rule_name}"
-
-        # Load existing warnings for this session
-        shown_warnings = load_state(session_id)
-
-        # Check if we've already shown this warning in this session
-        if warning_key not in shown_warnings:
-            # Add to shown warnings and save
-            shown_warnings.add(warning_key)
-            save_state(session_id, shown_warnings)
-
-            # Output the warning to stderr and block execution
-            print(reminder, file=sys.stderr)
+    matches = find_security_matches(file_path, content)
+
+    if matches:
+        # Record the warnings, keeping only those not yet shown in this session
+        new_keys = record_warnings(
+            session_id, [f"{file_path}-{rule_name}" for rule_name, _ in matches]
+        )
+        new_matches = [
+            (rule_name, reminder)
+            for rule_name, reminder in matches
+            if f"{file_path}-{rule_name}" in new_keys
+        ]
+
+        if new_matches:
+            # Output the warnings to stderr and block execution
+            print("\n\n".join(reminder for _, reminder in new_matches), file=sys.stderr)
             sys.exit(2)  # Block tool execution (exit code 2 for PreToolUse hooks)
 
     # Allow tool to proceed
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Check parity and benchmark the minidom and lxml document.xml editors.
+
+Runs the same plan of lookups and edits (get_node by attribute, text and line,
+insert_after/before, append_to, replace_node, suggest_deletion,
+revert_insertion, revert_deletion) through DocxXMLEditor and
+LxmlDocxXMLEditor, each in its own process, on copies of a large
+pretty-printed document.xml (generated, or given with --input). Every lookup
+and edit must return the same elements and text, and both saved files must
+have the same canonical form once w:date/w16du:dateUtc timestamps are masked.
+Reports parse, edit and save time and peak memory per engine; exits with
+status 1 on any difference. Small hand-written parity cases are in
+scripts/tests/test_lxml_editor.py.
+
+Usage:
+    python3 benchmarks/bench_lxml_editor.py [--paragraphs N] [--ops N] [--seed N]
+    python3 benchmarks/bench_lxml_editor.py --input unpacked/word/document.xml
+"""
+
+import argparse
+import json
+import random
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import defusedxml.minidom
+import lxml.etree
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
+NS = {"w": W_NAMESPACE, "w14": W14_NAMESPACE}
+
+WORDS = (
+    "agreement party notice term payment delivery report quarterly monthly "
+    "schedule clause section liability “services” provider customer"
+).split()
+
+
+def synthetic_document(paragraphs: int, rng: random.Random) -> bytes:
+    """A document.xml like unpack.py output: pretty-printed, ascii, with paraIds,
+    numbered paragraphs and other authors' tracked changes."""
+    body = []
+    for i in range(paragraphs):
+        runs = []
+        for j in range(rng.randint(1, 4)):
+            text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 8)))
+            text = f"{text} p{i}r{j} "
+            run = (
+                f'<w:r w:rsidR="00A1B2C3"><w:rPr><w:b/></w:rPr>'
+                f'<w:t xml:space="preserve">{text}</w:t></w:r>'
+            )
+            kind = rng.random()
+            if kind < 0.05:
+                run = f'<w:ins w:id="{i * 10 + j}" w:author="Other" w:date="2024-01-01T00:00:00Z">{run}</w:ins>'
+            elif kind < 0.08:
+                run = run.replace("w:t ", "w:delText ").replace("</w:t>", "</w:delText>")
+                run = run.replace("w:rsidR=", "w:rsidDel=")
+                run = f'<w:del w:id="{i * 10 + j}" w:author="Other" w:date="2024-01-01T00:00:00Z">{run}</w:del>'
+            runs.append(run)
+        num_pr = (
+            '<w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr>'
+            if rng.random() < 0.2
+            else ""
+        )
+        body.append(
+            f'<w:p w14:paraId="{i + 0x100000:08X}" w14:textId="77777777" w:rsidR="00A1B2C3">'
+            f'<w:pPr><w:pStyle w:val="Normal"/>{num_pr}</w:pPr>{"".join(runs)}</w:p>'
+        )
+    xml = (
+        f'<w:document xmlns:w="{W_NAMESPACE}" xmlns:w14="{W14_NAMESPACE}" '
+        'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+        'xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml" '
+        'mc:Ignorable="w14 w15"><w:body>'
+        f'{"".join(body)}<w:sectPr/></w:body></w:document>'
+    )
+    return defusedxml.minidom.parseString(xml).toprettyxml(indent="  ", encoding="ascii")
+
+
+def make_plan(xml_path: Path, count: int, rng: random.Random) -> list[dict]:
+    """Lookups and edits addressing elements of the original file."""
+    root = lxml.etree.parse(str(xml_path)).getroot()
+    para_ids = [
+        p.get(f"{{{W14_NAMESPACE}}}paraId")
+        for p in root.iterfind(".//w:p[@w14:paraId]", NS)
+    ]
+    texts = [t.text.strip() for t in root.iterfind(".//w:t", NS) if t.text and t.text.strip()]
+    ins_ids = [e.get(f"{{{W_NAMESPACE}}}id") for e in root.iterfind(".//w:body//w:ins[@w:id]", NS)]
+    del_ids = [e.get(f"{{{W_NAMESPACE}}}id") for e in root.iterfind(".//w:body//w:del[@w:id]", NS)]
+    lines = sum(1 for _ in open(xml_path, "rb"))
+
+    def para():
+        return {"tag": "w:p", "attrs": {"w14:paraId": rng.choice(para_ids)}}
+
+    def run():
+        return {"tag": "w:r", "contains": rng.choice(texts)[-14:]}
+
+    plan = []
+    for i in range(count):
+        kind = rng.random()
+        # Documents without paraIds or text (e.g. not saved by Word) skip the
+        # steps addressing them
+        if (kind < 0.2 or 0.5 <= kind < 0.66 or 0.82 <= kind < 0.88) and not para_ids:
+            continue
+        if (0.2 <= kind < 0.35 or 0.66 <= kind < 0.82) and not texts:
+            continue
+        if kind < 0.2:
+            plan.append({"op": "get", "query": para()})
+        elif kind < 0.35:
+            plan.append({"op": "get", "query": run()})
+        elif kind < 0.45:
+            line = rng.randrange(lines)
+            plan.append({"op": "get", "query": {"tag": "w:p", "line_number": [line, line + 3]}})
+        elif kind < 0.5:
+            plan.append({"op": "get", "query": {"tag": "w:t", "line_number": rng.randrange(lines)}})
+        elif kind < 0.58:
+            plan.append({"op": "insert_after", "query": para(),
+                         "xml": f"<w:p><w:r><w:t>inserted {i} &#8220;marker&#8221;</w:t></w:r></w:p>"})
+            plan.append({"op": "get", "query": {"tag": "w:p", "contains": f"inserted {i} “marker"}})
+        elif kind < 0.62:
+            plan.append({"op": "insert_before", "query": para(),
+                         "xml": f"<w:p>\n  <w:r><w:t> before {i}</w:t></w:r>\n</w:p>"})
+        elif kind < 0.66:
+            plan.append({"op": "append_to", "query": para(),
+                         "xml": f"<w:r><w:t>appended {i}</w:t></w:r><w:bookmarkStart w:id=\"{i}\"/>"})
+        elif kind < 0.74:
+            plan.append({"op": "replace_node", "query": run(),
+                         "xml": f"<w:del><w:r><w:delText>old {i}</w:delText></w:r></w:del>"
+                                f"<w:ins><w:r><w:t>repl {i}</w:t></w:r></w:ins>"})
+            plan.append({"op": "get", "query": {"tag": "w:r", "contains": f"repl {i}"}})
+        elif kind < 0.82:
+            plan.append({"op": "suggest_deletion", "query": run()})
+        elif kind < 0.88:
+            plan.append({"op": "suggest_deletion", "query": para()})
+        elif kind < 0.94 and ins_ids:
+            plan.append({"op": "revert_insertion",
+                         "query": {"tag": "w:ins", "attrs": {"w:id": rng.choice(ins_ids)}}})
+        elif del_ids:
+            plan.append({"op": "revert_deletion",
+                         "query": {"tag": "w:del", "attrs": {"w:id": rng.choice(del_ids)}}})
+    return plan
+
+
+def run_engine(engine: str, xml_path: Path, plan: list[dict], seed: int) -> dict:
+    """Parse, apply the plan and save with one engine (in a child process)."""
+    if engine == "lxml":
+        from scripts.lxml_editor import LxmlDocxXMLEditor as Editor, _prefixed_name
+
+        def describe(editor, elem):
+            return [_prefixed_name(elem), editor._get_element_text(elem)]
+    else:
+        from scripts.document import DocxXMLEditor as Editor
+
+        def describe(editor, elem):
+            return [elem.tagName, editor._get_element_text(elem)]
+
+    random.seed(seed)
+    start = time.perf_counter()
+    editor = Editor(xml_path, rsid="00AB12CD", author="Reviewer")
+    parse_time = time.perf_counter() - start
+
+    log = []
+    start = time.perf_counter()
+    for step in plan:
+        query = dict(step["query"])
+        if isinstance(query.get("line_number"), list):
+            query["line_number"] = range(*query["line_number"])
+        try:
+            elem = editor.get_node(**query)
+            op = step["op"]
+            if op == "get":
+                result = [elem]
+            elif op in ("insert_after", "insert_before", "append_to", "replace_node"):
+                result = getattr(editor, op)(elem, step["xml"])
+            elif op == "suggest_deletion":
+                result = [editor.suggest_deletion(elem)]
+            else:
+                result = getattr(editor, op)(elem)
+            # Compare elements only (minidom also returns text nodes)
+            log.append([
+                describe(editor, node) for node in result
+                if getattr(node, "nodeType", 1) == 1 and isinstance(getattr(node, "tag", ""), str)
+            ])
+        except (ValueError, AssertionError) as e:
+            log.append(["error", str(e)])
+    ops_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    editor.save()
+    save_time = time.perf_counter() - start
+
+    return {
+        "parse": parse_time,
+        "ops": ops_time,
+        "save": save_time,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "log": log,
+    }
+
+
+def canonical(xml_path: Path) -> str:
+    """C14N form of a saved file with edit timestamps masked."""
+    data = xml_path.read_bytes()
+    data = re.sub(rb'(w:date|w16du:dateUtc)="[^"]*"', rb'\1="*"', data)
+    return lxml.etree.tostring(lxml.etree.fromstring(data), method="c14n2")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input", type=Path, help="document.xml to use instead of a generated one")
+    parser.add_argument("--paragraphs", type=int, default=8000)
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--engine", choices=("minidom", "lxml"), help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.engine:
+        # Child process: one engine, results as JSON on stdout
+        plan = json.loads((args.work_dir / "plan.json").read_text())
+        result = run_engine(args.engine, args.work_dir / f"{args.engine}.xml", plan, args.seed)
+        json.dump(result, sys.stdout)
+        return
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="bench_editor_") as tmp:
+        work_dir = Path(tmp)
+        source = work_dir / "document.xml"
+        if args.input:
+            shutil.copy(args.input, source)
+        else:
+            source.write_bytes(synthetic_document(args.paragraphs, rng))
+        plan = make_plan(source, args.ops, rng)
+        (work_dir / "plan.json").write_text(json.dumps(plan))
+
+        size_mb = source.stat().st_size / 1e6
+        lines = sum(1 for _ in open(source, "rb"))
+        print(f"document.xml: {size_mb:.1f} MB, {lines} lines, {len(plan)} steps")
+
+        results = {}
+        for engine in ("minidom", "lxml"):
+            shutil.copy(source, work_dir / f"{engine}.xml")
+            output = subprocess.run(
+                [sys.executable, __file__, "--engine", engine, "--work-dir", str(work_dir),
+                 "--seed", str(args.seed)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            results[engine] = result = json.loads(output)
+            print(f"  {engine:8s} parse {result['parse']:6.2f} s   ops {result['ops']:6.2f} s   "
+                  f"save {result['save']:5.2f} s   peak RSS {result['peak_rss_mb']:6.0f} MB")
+
+        minidom, lxml_result = results["minidom"], results["lxml"]
+        for name in ("parse", "ops", "save"):
+            print(f"  {name:5s} speedup {minidom[name] / max(lxml_result[name], 1e-9):5.1f}x")
+
+        differences = [
+            (i, step, a, b)
+            for i, (step, a, b) in enumerate(zip(plan, minidom["log"], lxml_result["log"]))
+            if a != b
+        ]
+        for i, step, a, b in differences[:5]:
+            print(f"  step {i} {step['op']} {step['query']}:\n    minidom {a}\n    lxml    {b}")
+        same_output = canonical(work_dir / "minidom.xml") == canonical(work_dir / "lxml.xml")
+        errors = sum(1 for entry in minidom["log"] if entry and entry[0] == "error")
+        print(f"  parity: {len(plan) - len(differences)}/{len(plan)} steps match "
+              f"({errors} expected lookup errors), saved XML "
+              f"{'identical' if same_output else 'DIFFERS'} after canonicalization")
+        if differences or not same_output:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
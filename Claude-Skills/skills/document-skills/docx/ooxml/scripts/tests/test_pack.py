@@ -0,0 +1,59 @@
+"""
+Tests for pack.py
+
+Run with: pytest test_pack.py -v
+"""
+
+import sys
+from pathlib import Path
+from xml.parsers.expat import ExpatError
+
+import pytest
+
+# Add parent directory to path to import the module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pack import _condense_dom, condense_xml_data, pack_document
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+class TestCondenseXMLData:
+    """condense_xml_data() writes the same bytes as the minidom path."""
+
+    @pytest.mark.parametrize(
+        "xml",
+        [
+            f"<w:document {W}>\n  <w:body>\n    <w:p><w:r><w:t> a </w:t></w:r></w:p>\n  </w:body>\n</w:document>",
+            f"<w:document {W}><w:r>\t<![CDATA[]]>txt</w:r></w:document>",
+            f"<w:document {W}><w:r> <![CDATA[x]]> </w:r></w:document>",
+            f"<w:document {W}><w:t>a<!-- kept --> b</w:t><w:p><!-- dropped --></w:p></w:document>",
+            f'<!-- before --><w:document {W} w:val="a&amp;b&quot;"><?pi data?></w:document>',
+            f'<w:document {W}><a:p xmlns:a="urn:a" a:val="1"/></w:document>',
+            '<!DOCTYPE doc><doc>\n <p/>\n</doc>',
+        ],
+    )
+    def test_matches_dom(self, xml):
+        data = ('<?xml version="1.0" encoding="UTF-8"?>' + xml).encode("utf-8")
+        assert condense_xml_data(data) == _condense_dom(data)
+
+    @pytest.mark.parametrize(
+        "xml",
+        [
+            f"<w:document {W}><zz:foo/></w:document>",
+            f'<w:document {W}><w:p zz:val="1"/></w:document>',
+            f'<w:document {W}><w:p xmlns:a="{W[9:-1]}" a:val="1" w:val="2"/></w:document>',
+        ],
+    )
+    def test_namespace_errors_raise(self, xml):
+        with pytest.raises(ExpatError):
+            condense_xml_data(xml.encode("utf-8"))
+
+    def test_unbound_prefix_not_packed(self, tmp_path):
+        unpacked = tmp_path / "unpacked"
+        (unpacked / "word").mkdir(parents=True)
+        (unpacked / "word" / "document.xml").write_text(f"<w:document {W}><zz:foo/></w:document>")
+        output = tmp_path / "out.docx"
+        with pytest.raises(ExpatError):
+            pack_document(unpacked, output)
+        assert not output.exists()
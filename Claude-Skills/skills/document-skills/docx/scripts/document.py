@@ -76,7 +76,7 @@ class DocxXMLEditor(XMLEditor):
         """Get the next available change ID by checking all tracked change elements."""
         max_id = -1
         for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
+            elements = self._elements(tag)
             for elem in elements:
                 change_id = elem.getAttribute("w:id")
                 if change_id:
@@ -237,6 +237,9 @@ class DocxXMLEditor(XMLEditor):
             for elem in node.getElementsByTagName("w16cex:commentExtensible"):
                 add_comment_extensible_date(elem)
 
+        # Index the nodes again with the attributes just added
+        self._nodes_changed(nodes)
+
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
         nodes = super().replace_node(elem, new_content)
@@ -333,6 +336,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Add del wrapper back to ins
             ins_elem.appendChild(del_wrapper)
+            self._nodes_changed([ins_elem])
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -525,6 +529,7 @@ class DocxXMLEditor(XMLEditor):
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
             del_wrapper.appendChild(elem)
+            self._nodes_changed([del_wrapper])
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -583,6 +588,7 @@ class DocxXMLEditor(XMLEditor):
                 elem.removeChild(child)
                 del_wrapper.appendChild(child)
             elem.appendChild(del_wrapper)
+            self._nodes_changed([elem])
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -610,7 +616,14 @@ def _generate_rsid() -> str:
 
 
 class Document:
-    """Manages comments in unpacked Word documents."""
+    """Manages comments in unpacked Word documents.
+
+    Edits happen in a session directory (unpacked_path) holding only the parts
+    that were opened, created or added there: each part is copied from the
+    unpacked directory on first use. The original package used as validation
+    baseline is built by validate(), and save() writes back only the session's
+    parts.
+    """
 
     def __init__(
         self,
@@ -622,7 +635,7 @@ class Document:
     ):
         """
         Initialize with path to unpacked Word document directory.
-        Automatically sets up comment infrastructure (people.xml, RSIDs).
+        Comment infrastructure (people.xml, RSIDs) is set up on save().
 
         Args:
             unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory)
@@ -636,14 +649,20 @@ class Document:
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Create temporary directory for the session's parts and the baseline;
+        # parts are copied in on first use (see _working_copy)
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self.unpacked_path.mkdir()
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
+        # Original .docx for the validation baseline, packed by validate()
         self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Parts validate() copied in without them being used (see
+        # _changed_parts), and what save() changed in the unpacked directory
+        # before the baseline was packed (see _pack_original)
+        self._filled = set()
+        self._replaced_originals = Path(self.temp_dir) / "replaced"
+        self._added_parts = set()
 
         self.word_path = self.unpacked_path / "word"
 
@@ -654,6 +673,7 @@ class Document:
         # Set default author and initials
         self.author = author
         self.initials = initials
+        self.track_revisions = track_revisions
 
         # Cache for lazy-loaded editors
         self._editors = {}
@@ -664,18 +684,32 @@ class Document:
         self.comments_ids_path = self.word_path / "commentsIds.xml"
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
-        # Load existing comments and determine next ID (before setup modifies files)
-        self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
-
-        # Convenient access to document.xml editor (semi-private)
-        self._document = self["word/document.xml"]
-
-        # Setup tracked changes infrastructure
-        self._setup_tracking(track_revisions=track_revisions)
-
-        # Add author to people.xml
-        self._add_author_to_people(author)
+        # Existing comments and next ID, loaded on first use
+        self._existing_comments = None
+        self._next_comment_id = None
+
+    @property
+    def existing_comments(self):
+        """Comments by ID ({"para_id": ...}), loaded on first use to enable replies."""
+        if self._existing_comments is None:
+            self._existing_comments = self._load_existing_comments()
+        return self._existing_comments
+
+    @property
+    def next_comment_id(self):
+        """ID for the next comment, determined on first use."""
+        if self._next_comment_id is None:
+            self._next_comment_id = self._get_next_comment_id()
+        return self._next_comment_id
+
+    @next_comment_id.setter
+    def next_comment_id(self, value):
+        self._next_comment_id = value
+
+    @property
+    def _document(self):
+        """Convenient access to document.xml editor (semi-private)."""
+        return self["word/document.xml"]
 
     def __getitem__(self, xml_path: str) -> DocxXMLEditor:
         """
@@ -702,8 +736,9 @@ class Document:
         """
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
-            if not file_path.exists():
+            if not self._part_exists(file_path):
                 raise ValueError(f"XML file not found: {xml_path}")
+            self._working_copy(file_path)
             # Use DocxXMLEditor with RSID, author, and initials for all editors
             self._editors[xml_path] = DocxXMLEditor(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
@@ -842,6 +877,10 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
+        # Validators read the whole document: copy in the parts not used yet
+        self._fill_working_copy()
+        self._pack_original()
+
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
             self.unpacked_path, self.original_docx, verbose=False
@@ -861,13 +900,19 @@ class Document:
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only the session's parts are written; a new destination first gets a
+        copy of the original directory.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
+        # Set up comment infrastructure: people.xml, author and RSID
+        self._setup_tracking(track_revisions=self.track_revisions)
+        self._add_author_to_people(self.author)
+
         # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
+        if self._part_exists(self.comments_path):
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
@@ -879,15 +924,102 @@ class Document:
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Copy the session's parts to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        parts = self._changed_parts()
+        if target_path.resolve() == self.original_path.resolve():
+            self._keep_originals(parts)
+        else:
+            shutil.copytree(self.original_path, target_path, dirs_exist_ok=True)
+        for part in parts:
+            target_file = target_path / part
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(self.unpacked_path / part, target_file)
+
+    # ==================== Private: Session Parts ====================
+
+    def _part_exists(self, path):
+        """Check whether the part at path in unpacked_path exists in the session or the original."""
+        return path.exists() or (
+            self.original_path / path.relative_to(self.unpacked_path)
+        ).exists()
+
+    def _working_copy(self, path):
+        """Make the part at path in unpacked_path the session's own, copying it in if needed."""
+        part = path.relative_to(self.unpacked_path)
+        self._filled.discard(part)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(self.original_path / part, path)
+
+    def _copy_template(self, path, template):
+        """Create the part at path from a template unless the document has it."""
+        if not self._part_exists(path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(TEMPLATE_DIR / template, path)
+
+    def _fill_working_copy(self):
+        """Copy all parts missing from unpacked_path in, remembering which."""
+        for source in self.original_path.rglob("*"):
+            part = source.relative_to(self.original_path)
+            path = self.unpacked_path / part
+            if source.is_file() and not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, path)
+                self._filled.add(part)
+
+    def _changed_parts(self):
+        """Relative paths of the files in unpacked_path other than unchanged filled-in parts."""
+        parts = []
+        for path in sorted(self.unpacked_path.rglob("*")):
+            if not path.is_file():
+                continue
+            part = path.relative_to(self.unpacked_path)
+            if part in self._filled:
+                current, original = path.stat(), (self.original_path / part).stat()
+                if (current.st_size, current.st_mtime_ns) == (
+                    original.st_size,
+                    original.st_mtime_ns,
+                ):
+                    continue
+            parts.append(part)
+        return parts
+
+    def _keep_originals(self, parts):
+        """Before the original directory changes, keep what the baseline needs."""
+        if self.original_docx.exists():
+            return
+        for part in parts:
+            source = self.original_path / part
+            kept = self._replaced_originals / part
+            if part in self._added_parts or kept.exists():
+                continue
+            if source.exists():
+                kept.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, kept)
+            else:
+                self._added_parts.add(part)
+
+    def _pack_original(self):
+        """Pack the original document into original_docx for the validation baseline."""
+        if self.original_docx.exists():
+            return
+        source = self.original_path
+        if self._added_parts or self._replaced_originals.exists():
+            # save() already wrote to the original directory: restore it aside
+            source = Path(self.temp_dir) / "baseline"
+            shutil.copytree(self.original_path, source)
+            for part in self._added_parts:
+                (source / part).unlink()
+            if self._replaced_originals.exists():
+                shutil.copytree(self._replaced_originals, source, dirs_exist_ok=True)
+        pack_document(source, self.original_docx, validate=False)
 
     # ==================== Private: Initialization ====================
 
     def _get_next_comment_id(self):
         """Get the next available comment ID."""
-        if not self.comments_path.exists():
+        if not self._part_exists(self.comments_path):
             return 0
 
         editor = self["word/comments.xml"]
@@ -903,7 +1035,7 @@ class Document:
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
-        if not self.comments_path.exists():
+        if not self._part_exists(self.comments_path):
             return {}
 
         editor = self["word/comments.xml"]
@@ -953,9 +1085,7 @@ class Document:
 
     def _update_people_xml(self, path):
         """Create people.xml if it doesn't exist."""
-        if not path.exists():
-            # Copy from template
-            shutil.copy(TEMPLATE_DIR / "people.xml", path)
+        self._copy_template(path, "people.xml")
 
     def _add_content_type_for_people(self, path):
         """Add people.xml content type to [Content_Types].xml if not already present."""
@@ -1069,8 +1199,7 @@ class Document:
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
+        self._copy_template(self.comments_path, "comments.xml")
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
@@ -1090,10 +1219,7 @@ class Document:
 
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
-            )
+        self._copy_template(self.comments_extended_path, "commentsExtended.xml")
 
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
@@ -1106,8 +1232,7 @@ class Document:
 
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
+        self._copy_template(self.comments_ids_path, "commentsIds.xml")
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
@@ -1117,10 +1242,7 @@ class Document:
 
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
-            )
+        self._copy_template(self.comments_extensible_path, "commentsExtensible.xml")
 
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
@@ -1179,11 +1301,11 @@ class Document:
         return False
 
     def _add_author_to_people(self, author):
-        """Add author to people.xml (called during initialization)."""
+        """Add author to people.xml (called on save)."""
         people_path = self.word_path / "people.xml"
 
         # people.xml should already exist from _setup_tracking
-        if not people_path.exists():
+        if not self._part_exists(people_path):
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
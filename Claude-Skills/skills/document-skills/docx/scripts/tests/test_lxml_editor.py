@@ -0,0 +1,164 @@
+"""
+Tests for lxml_editor.py: parity with the minidom DocxXMLEditor
+
+Run with: pytest test_lxml_editor.py -v
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+import defusedxml.minidom
+import lxml.etree
+import pytest
+
+# Add the skill directory to path to import the scripts package
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.document import DocxXMLEditor
+from scripts.lxml_editor import LxmlDocxXMLEditor, _prefixed_name
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
+
+# Small documents and the lookups and edits run on them: (body XML, plan)
+CASES = {
+    "no paraIds": (
+        '<w:p><w:r><w:t>First &#8220;quoted&#8221; clause</w:t></w:r></w:p>'
+        '<w:p><w:r><w:t xml:space="preserve">Second </w:t></w:r>'
+        '<w:r><w:rPr><w:b/></w:rPr><w:t>clause</w:t></w:r></w:p>'
+        '<w:p><w:r><w:t>Third clause</w:t></w:r></w:p>',
+        [
+            {"op": "get", "query": {"tag": "w:p", "contains": "&#8220;quoted"}},
+            {"op": "get", "query": {"tag": "w:r", "contains": "clause"}},
+            {"op": "get", "query": {"tag": "w:p", "line_number": range(1, 8)}},
+            {"op": "get", "query": {"tag": "w:t", "line_number": 6}},
+            {"op": "insert_after", "query": {"tag": "w:p", "contains": "Third"},
+             "xml": "<w:p><w:r><w:t>Fourth clause</w:t></w:r></w:p>"},
+            {"op": "get", "query": {"tag": "w:p", "contains": "Fourth"}},
+            {"op": "replace_node", "query": {"tag": "w:r", "contains": "Second"},
+             "xml": "<w:del><w:r><w:delText>Second </w:delText></w:r></w:del>"
+                    "<w:ins><w:r><w:t>Other </w:t></w:r></w:ins>"},
+            {"op": "get", "query": {"tag": "w:p", "contains": "Second"}},
+            {"op": "suggest_deletion", "query": {"tag": "w:r", "contains": "quoted"}},
+            {"op": "suggest_deletion", "query": {"tag": "w:p", "contains": "Fourth"}},
+            {"op": "get", "query": {"tag": "w:del", "attrs": {"w:author": "Reviewer"}}},
+        ],
+    ),
+    "other authors' changes": (
+        '<w:p><w:r><w:t>Kept</w:t></w:r>'
+        '<w:ins w:id="1" w:author="Other" w:date="2024-01-01T00:00:00Z">'
+        '<w:r><w:t>added</w:t></w:r></w:ins>'
+        '<w:del w:id="2" w:author="Other" w:date="2024-01-01T00:00:00Z">'
+        '<w:r><w:delText>removed</w:delText></w:r></w:del></w:p>'
+        '<w:p><w:pPr><w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr></w:pPr>'
+        '<w:r><w:t>Item</w:t></w:r></w:p>',
+        [
+            {"op": "revert_insertion", "query": {"tag": "w:ins", "attrs": {"w:id": "1"}}},
+            {"op": "revert_deletion", "query": {"tag": "w:del", "attrs": {"w:id": "2"}}},
+            {"op": "get", "query": {"tag": "w:ins", "attrs": {"w:id": "1"}}},
+            {"op": "append_to", "query": {"tag": "w:p", "contains": "Item"},
+             "xml": '<w:r><w:t>appended</w:t></w:r><w:bookmarkStart w:id="0"/>'},
+            {"op": "insert_before", "query": {"tag": "w:p", "contains": "Itemappended"},
+             "xml": "<w:p>\n  <w:r><w:t> before</w:t></w:r>\n</w:p>"},
+            {"op": "suggest_deletion", "query": {"tag": "w:p", "contains": "Item"}},
+            {"op": "get", "query": {"tag": "w:p"}},
+        ],
+    ),
+    "whitespace between text nodes": (
+        '<w:p><w:r><w:t xml:space="preserve">a &amp; </w:t></w:r>'
+        '<w:r><w:t xml:space="preserve"> &#8220; b</w:t></w:r></w:p>'
+        '<w:p><w:r><w:t xml:space="preserve">c &#8221;</w:t></w:r></w:p>',
+        [
+            {"op": "get", "query": {"tag": "w:p", "contains": "a &amp;  &#8220; b"}},
+            {"op": "get", "query": {"tag": "w:p", "contains": "&amp;&#8220;"}},
+            {"op": "get", "query": {"tag": "w:r", "contains": "c&#8221;"}},
+            {"op": "get", "query": {"tag": "w:r", "contains": "c &#8221;"}},
+            {"op": "append_to", "query": {"tag": "w:p", "contains": "c"},
+             "xml": '<w:r><w:t xml:space="preserve">d &amp; \n e</w:t></w:r>'},
+            {"op": "get", "query": {"tag": "w:r", "contains": "d &amp; \n e"}},
+        ],
+    ),
+}
+
+
+def _document(body):
+    """A pretty-printed ascii document.xml, like unpack.py output, around body."""
+    xml = (
+        f'<w:document xmlns:w="{W_NAMESPACE}" xmlns:w14="{W14_NAMESPACE}">'
+        f"<w:body>{body}<w:sectPr/></w:body></w:document>"
+    )
+    return defusedxml.minidom.parseString(xml).toprettyxml(indent="  ", encoding="ascii")
+
+
+def _run(editor_class, describe, xml_path, plan):
+    """Apply plan with one editor; return the log of results and the saved XML."""
+    # Same change ids and rsids for both editors
+    random.seed(0)
+    editor = editor_class(xml_path, rsid="00AB12CD", author="Reviewer")
+    log = []
+    for step in plan:
+        try:
+            elem = editor.get_node(**step["query"])
+            op = step["op"]
+            if op == "get":
+                result = [elem]
+            elif op in ("insert_after", "insert_before", "append_to", "replace_node"):
+                result = getattr(editor, op)(elem, step["xml"])
+            elif op == "suggest_deletion":
+                result = [editor.suggest_deletion(elem)]
+            else:
+                result = getattr(editor, op)(elem)
+            # Compare elements only (minidom also returns text nodes)
+            entries = [describe(editor, node) for node in result]
+            log.append([entry for entry in entries if entry is not None])
+        except (ValueError, AssertionError) as e:
+            log.append(["error", str(e)])
+    editor.save()
+    data = re.sub(rb'(w:date|w16du:dateUtc)="[^"]*"', rb'\1="*"', xml_path.read_bytes())
+    return log, lxml.etree.tostring(lxml.etree.fromstring(data), method="c14n2")
+
+
+def _describe_minidom(editor, node):
+    if node.nodeType != node.ELEMENT_NODE:
+        return None
+    return [node.tagName, editor._get_element_text(node)]
+
+
+def _describe_lxml(editor, node):
+    if not isinstance(node.tag, str):
+        return None
+    return [_prefixed_name(node), editor._get_element_text(node)]
+
+
+class TestParity:
+    """LxmlDocxXMLEditor returns the same elements and saves the same XML."""
+
+    @pytest.mark.parametrize("name", CASES)
+    def test_same_results(self, name, tmp_path):
+        body, plan = CASES[name]
+        (tmp_path / "minidom.xml").write_bytes(_document(body))
+        (tmp_path / "lxml.xml").write_bytes(_document(body))
+
+        minidom_log, minidom_xml = _run(
+            DocxXMLEditor, _describe_minidom, tmp_path / "minidom.xml", plan
+        )
+        lxml_log, lxml_xml = _run(
+            LxmlDocxXMLEditor, _describe_lxml, tmp_path / "lxml.xml", plan
+        )
+
+        assert lxml_log == minidom_log
+        assert lxml_xml == minidom_xml
+
+    def test_direct_text_edit(self, tmp_path):
+        xml_path = tmp_path / "document.xml"
+        xml_path.write_bytes(_document("<w:p><w:r><w:t>alpha</w:t></w:r></w:p>"))
+        editor = LxmlDocxXMLEditor(xml_path, rsid="00AB12CD", author="Reviewer")
+        run = editor.get_node(tag="w:r", contains="alpha")
+
+        run[0].text = "beta"
+
+        assert editor.get_node(tag="w:r", contains="beta") is run
+        with pytest.raises(ValueError, match="Node not found"):
+            editor.get_node(tag="w:r", contains="alpha")
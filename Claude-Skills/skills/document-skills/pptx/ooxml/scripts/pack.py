@@ -7,14 +7,27 @@ Example usage:
 """
 
 import argparse
-import shutil
+import hashlib
+import os
+import struct
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
+import threading
+import xml.sax.handler
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import defusedxml.minidom
+import defusedxml.sax
+
+# Parts are deflated at zipfile's default level
+COMPRESS_LEVEL = zlib.Z_DEFAULT_COMPRESSION
+# Timestamp of every entry, so packing is reproducible
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
@@ -42,13 +55,21 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, workers=None, cache_dir=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    Parts are read straight from input_dir, condensed in memory and written
+    in a fixed order with fixed timestamps, so the same input always packs
+    to the same bytes.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        workers: Threads compressing parts (default: CPU count)
+        cache_dir: Directory keeping compressed parts between runs, reused
+            while a part's file is unchanged (default: $OOXML_PACK_CACHE,
+            unset = no cache)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,32 +82,120 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    workers = workers or os.cpu_count() or 1
+    cache_dir = cache_dir or os.environ.get("OOXML_PACK_CACHE")
+    cache_dir = Path(cache_dir) if cache_dir else None
+
+    # Collect parts before creating the output, which may be inside input_dir
+    parts = []
+    for f in input_dir.rglob("*"):
+        if f.is_file():
+            arcname = f.relative_to(input_dir).as_posix()
+            parts.append((arcname, f, f.name.endswith((".xml", ".rels"))))
+    # [Content_Types].xml first, as Office writes it
+    parts.sort(key=lambda part: (part[0] != "[Content_Types].xml", part[0]))
+
+    # Create final Office file as zip archive
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            compressed = pool.map(
+                lambda part: _compress_part(part[1], part[2], cache_dir), parts
+            )
+            with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+                for (arcname, _, _), (crc, size, data) in zip(parts, compressed):
+                    zinfo = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    zinfo.external_attr = 0o644 << 16
+                    zinfo.CRC = crc
+                    zinfo.file_size = size
+                    zinfo.compress_size = len(data)
+                    _write_compressed(zf, zinfo, data)
+    except BaseException:
+        # Don't leave a partial file behind, e.g. on malformed XML
+        output_file.unlink(missing_ok=True)
+        raise
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
+def _compress_part(path, condense, cache_dir):
+    """Return (CRC, size, raw deflate data) of a part, condensing XML first."""
+    cache_file = _part_cache_file(path, condense, cache_dir)
+    if cache_file is not None:
+        try:
+            cached = cache_file.read_bytes()
+            crc, size = struct.unpack_from("<LQ", cached)
+            return crc, size, cached[12:]
+        except (OSError, struct.error):
+            pass
+
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    if condense:
+        content = condense_xml_data(path.read_bytes())
+        crc, size = zlib.crc32(content), len(content)
+        data = compressor.compress(content) + compressor.flush()
+    else:
+        # Stream other parts (media, binaries) through the compressor
+        crc, size, chunks = 0, 0, []
+        with open(path, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                chunks.append(compressor.compress(chunk))
+        chunks.append(compressor.flush())
+        data = b"".join(chunks)
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_file.write_bytes(struct.pack("<LQ", crc, size) + data)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+    return crc, size, data
+
+
+def _part_cache_file(path, condense, cache_dir):
+    """Cache file for a part, keyed by its path, size and modification time."""
+    if cache_dir is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = hashlib.sha1(
+        f"{path.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}\0{stat.st_ino}\0"
+        f"{condense}\0{COMPRESS_LEVEL}".encode("utf-8")
+    ).hexdigest()
+    return cache_dir / "pack" / key[:2] / key
+
+
+def _write_compressed(zf, zinfo, data):
+    """Add an entry whose data is already deflated, as ZipFile.writestr() would.
+
+    zipfile has no public API for this, so the local header and data are
+    written directly and the entry is registered for the central directory.
+    """
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.fp.tell()
+    zf.fp.write(zinfo.FileHeader(zip64))
+    zf.fp.write(data)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+
+
 def validate_document(doc_path):
     """Validate document by converting to HTML with soffice."""
     # Determine the correct filter based on file extension
@@ -132,8 +241,33 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(condense_xml_data(xml_file.read_bytes()))
+
+
+def condense_xml_data(data):
+    """Return XML bytes without whitespace-only text and comments in elements.
+
+    Text and comments directly inside *:t elements are kept as is. The
+    document is streamed through a SAX filter that writes the same bytes as
+    condensing a minidom DOM and serializing it with toxml(); documents with
+    a DOCTYPE or namespace errors (e.g. an unbound prefix) take the DOM
+    path, which raises the same errors as before.
+    """
+    condenser = _XMLCondenser()
+    parser = defusedxml.sax.make_parser()
+    parser.setContentHandler(condenser)
+    parser.setProperty(xml.sax.handler.property_lexical_handler, condenser)
+    try:
+        parser.feed(data)
+        parser.close()
+    except _UseDOM:
+        return _condense_dom(data)
+    return condenser.getvalue()
+
+
+def _condense_dom(data):
+    dom = defusedxml.minidom.parseString(data)
 
     # Process each element to remove whitespace and comments
     for element in dom.getElementsByTagName("*"):
@@ -150,9 +284,154 @@ def condense_xml(xml_file):
             ) or child.nodeType == child.COMMENT_NODE:
                 element.removeChild(child)
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    return dom.toxml(encoding="UTF-8")
+
+
+def _escape(text):
+    # Same escaping as minidom's writer
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+_XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+
+class _UseDOM(Exception):
+    """Raised by _XMLCondenser for input it leaves to the DOM path."""
+
+
+class _XMLCondenser(xml.sax.handler.ContentHandler, xml.sax.handler.LexicalHandler):
+    """SAX handler writing the condensed document, see condense_xml_data().
+
+    The parser runs without namespace processing, which would hide the
+    prefixes written out, so prefixes are checked here instead.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._out = ['<?xml version="1.0" encoding="UTF-8"?>']
+        self._elements = []  # Tag names of open elements
+        self._scopes = []  # Prefixes declared by each open element
+        self._namespaces = {"xml": [_XML_NAMESPACE]}  # Prefix -> bound URIs
+        self._pending = False  # Innermost start tag still lacks its ">"
+        self._text = []  # Character data since the last markup
+        self._cdata = None  # Character data of an open CDATA section
+
+    def getvalue(self):
+        return "".join(self._out).encode("utf-8", "xmlcharrefreplace")
+
+    def _start_content(self):
+        """Finish the pending start tag before writing element content."""
+        if self._pending:
+            self._out.append(">")
+            self._pending = False
+
+    def _flush_text(self):
+        if not self._text:
+            return
+        text = "".join(self._text)
+        self._text = []
+        if not self._elements:
+            return  # Outside the root element
+        # Whitespace-only text is dropped except directly inside *:t
+        if text.strip() == "" and not self._elements[-1].endswith(":t"):
+            return
+        self._start_content()
+        self._out.append(_escape(text))
+
+    def startElement(self, name, attrs):
+        self._flush_text()
+        self._start_content()
+        names = attrs.getNames()
+        declared = [n for n in names if n == "xmlns" or n.startswith("xmlns:")]
+        others = [n for n in names if n != "xmlns" and not n.startswith("xmlns:")]
+        self._declare(declared, attrs)
+        self._check_names(name, others)
+        out = self._out
+        out.append("<" + name)
+        # minidom puts namespace declarations before other attributes
+        for attr in declared + others:
+            out.append(f' {attr}="{_escape(attrs[attr])}"')
+        self._elements.append(name)
+        self._pending = True
+
+    def endElement(self, name):
+        self._flush_text()
+        if self._pending:
+            self._out.append("/>")
+            self._pending = False
+        else:
+            self._out.append(f"</{name}>")
+        self._elements.pop()
+        for prefix in self._scopes.pop():
+            self._namespaces[prefix].pop()
+
+    def _declare(self, declared, attrs):
+        """Bind the prefixes an element declares, for its scope."""
+        prefixes = []
+        for attr in declared:
+            if attr == "xmlns":
+                continue  # Unprefixed names are never checked
+            prefix, uri = attr[6:], attrs[attr]
+            if not uri or prefix in ("xml", "xmlns") or ":" in prefix:
+                raise _UseDOM()
+            self._namespaces.setdefault(prefix, []).append(uri)
+            prefixes.append(prefix)
+        self._scopes.append(prefixes)
+
+    def _check_names(self, name, attr_names):
+        """Leave names expat would reject with namespaces on to the DOM path."""
+        expanded = set()
+        for qname in [name] + attr_names:
+            if ":" not in qname:
+                continue
+            prefix, _, local = qname.partition(":")
+            if not local or ":" in local or not self._namespaces.get(prefix):
+                raise _UseDOM()
+            if qname is not name:
+                expanded.add((self._namespaces[prefix][-1], local))
+        if len(expanded) < sum(":" in n for n in attr_names):
+            raise _UseDOM()  # Duplicate attribute once prefixes are expanded
+
+    def characters(self, content):
+        if self._cdata is not None:
+            self._cdata.append(content)
+        else:
+            self._text.append(content)
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        self._start_content()
+        self._out.append(f"<?{target} {data}?>")
+
+    def comment(self, content):
+        self._flush_text()
+        # Comments inside elements are removed, except directly inside *:t
+        if not self._elements:
+            self._out.append(f"<!--{content}-->")
+        elif self._elements[-1].endswith(":t"):
+            self._start_content()
+            self._out.append(f"<!--{content}-->")
+
+    def startCDATA(self):
+        self._cdata = []
+
+    def endCDATA(self):
+        data = "".join(self._cdata)
+        self._cdata = None
+        # minidom creates no node for an empty section, so the text around
+        # it stays one node
+        if data:
+            self._flush_text()
+            self._start_content()
+            self._out.append(f"<![CDATA[{data}]]>")
+
+    def startDTD(self, name, public_id, system_id):
+        raise _UseDOM()
 
 
 if __name__ == "__main__":
@@ -2,11 +2,50 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
+import hashlib
+import io
+import json
+import os
 import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+# Compiled XSD schemas by schema path, shared by all validators in this process
+_SCHEMA_CACHE = {}
+
+
+def get_schema(schema_path):
+    """Return the compiled XMLSchema for an XSD file, compiling it once per process.
+
+    A schema that fails to compile raises the same error on every call.
+    """
+    schema_path = Path(schema_path).resolve()
+    schema = _SCHEMA_CACHE.get(schema_path)
+    if schema is None:
+        try:
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(
+                    xsd_file, parser=parser, base_url=str(schema_path)
+                )
+                schema = lxml.etree.XMLSchema(xsd_doc)
+        except Exception as e:
+            schema = e
+        _SCHEMA_CACHE[schema_path] = schema
+    if isinstance(schema, Exception):
+        raise schema
+    return schema
+
+
+# XSD errors of parts in original packages, by (validator class, original
+# file identity, part name); kept for the life of the process so repeated
+# validations against the same original only compute each baseline once
+_BASELINE_CACHE = {}
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,10 +142,34 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    # Minimum number of parts before XSD validation is spread over processes
+    PARALLEL_MIN_FILES = 32
+
+    def __init__(
+        self, unpacked_dir, original_file, verbose=False, workers=None, cache_dir=None
+    ):
+        """
+        Args:
+            unpacked_dir: Path to the unpacked document
+            original_file: Path to the original .docx/.pptx/.xlsx file
+            verbose: Enable verbose output
+            workers: Processes for XSD validation (default: CPU count, 1 = serial)
+            cache_dir: Directory to persist per-part XSD results across runs
+                (default: $OOXML_VALIDATION_CACHE, unset = no persistence)
+        """
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
+        self.workers = workers or os.cpu_count() or 1
+        cache_dir = cache_dir or os.environ.get("OOXML_VALIDATION_CACHE")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+        # Parsed parts by path, shared by all checks (see _parse)
+        self._trees = {}
+        self._schemas_signature = None
+        # Original package, opened on first use (see _original_package)
+        self._original_zip = None
+        self._original_id = None
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
@@ -120,10 +183,35 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+    def __getstate__(self):
+        # Parsed trees cannot be pickled; worker processes parse their own parts
+        state = self.__dict__.copy()
+        state["_trees"] = {}
+        state["_original_zip"] = None
+        return state
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _parse(self, xml_file):
+        """Parse an XML part once and return the cached tree on later calls.
+
+        The tree is shared by all checks and must not be modified; copy it
+        first. Parse errors are cached too and raised again on every call.
+        """
+        xml_file = Path(xml_file)
+        tree = self._trees.get(xml_file)
+        if tree is None:
+            try:
+                tree = lxml.etree.parse(str(xml_file))
+            except Exception as e:
+                tree = e
+            self._trees[xml_file] = tree
+        if isinstance(tree, Exception):
+            raise tree
+        return tree
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
@@ -131,7 +219,7 @@ class BaseSchemaValidator:
         for xml_file in self.xml_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self._parse(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -159,7 +247,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -190,13 +278,18 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
                 file_ids = {}  # Track IDs that must be unique within this file
 
-                # Remove all mc:AlternateContent elements from the tree
+                # Remove all mc:AlternateContent elements from a copy of the tree
                 mc_elements = root.xpath(
                     ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
                 )
+                if mc_elements:
+                    root = copy.deepcopy(root)
+                    mc_elements = root.xpath(
+                        ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
+                    )
                 for elem in mc_elements:
                     elem.getparent().remove(elem)
 
@@ -310,7 +403,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse(rels_file).getroot()
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -411,7 +504,7 @@ class BaseSchemaValidator:
 
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse(rels_file).getroot()
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -434,7 +527,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self._parse(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -531,7 +624,7 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -593,7 +686,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._parse(xml_file).getroot().tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -653,8 +746,12 @@ class BaseSchemaValidator:
         unpacked_dir = self.unpacked_dir.resolve()
 
         # Validate current file
+        try:
+            xml_doc = self._parse(xml_file)
+        except Exception:
+            xml_doc = None  # Reported by _validate_single_file_xsd
         is_valid, current_errors = self._validate_single_file_xsd(
-            xml_file, unpacked_dir
+            xml_file, unpacked_dir, xml_doc
         )
 
         if is_valid is None:
@@ -663,7 +760,7 @@ class BaseSchemaValidator:
             return True, set()  # Valid, no errors
 
         # Get errors from original file for this specific file
-        original_errors = self._get_original_file_errors(xml_file)
+        original_errors = self._get_original_file_errors(xml_file, current_errors)
 
         # Compare with original (both are guaranteed to be sets here)
         assert current_errors is not None
@@ -692,11 +789,10 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        for xml_file, (is_valid, new_file_errors) in zip(
+            self.xml_files, self._validate_files_against_xsd(self.xml_files)
+        ):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -738,6 +834,51 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_files_against_xsd(self, xml_files):
+        """Run validate_file_against_xsd() on each file, in a process pool if worthwhile.
+
+        Returns:
+            list: (is_valid, new_errors_set) per file, in the order given
+        """
+        workers = min(self.workers, len(xml_files) // max(1, self.PARALLEL_MIN_FILES // 4))
+        if workers <= 1 or len(xml_files) < self.PARALLEL_MIN_FILES:
+            return [
+                self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in xml_files
+            ]
+
+        # Compile schemas before starting workers (forked workers inherit
+        # them), and group parts by schema so each worker needs few of them
+        schema_paths = {f: self._get_schema_path(f) for f in xml_files}
+        for schema_path in set(schema_paths.values()) - {None}:
+            try:
+                get_schema(schema_path)
+            except Exception:
+                pass  # Reported per part by _validate_single_file_xsd
+        ordered = sorted(xml_files, key=lambda f: str(schema_paths[f] or ""))
+
+        chunksize = max(1, len(ordered) // (workers * 4))
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for xml_file, (result, baseline) in zip(
+                ordered, pool.map(self._validate_part_xsd, ordered, chunksize=chunksize)
+            ):
+                results[xml_file] = result
+                if baseline is not None:
+                    # Keep baselines computed by workers for later validations
+                    _BASELINE_CACHE[self._baseline_key(xml_file)] = baseline
+        return [results[xml_file] for xml_file in xml_files]
+
+    def _validate_part_xsd(self, xml_file):
+        """Worker entry point for _validate_files_against_xsd().
+
+        Returns:
+            tuple: (validate_file_against_xsd() result, baseline errors of
+            the part if they were computed, else None)
+        """
+        result = self.validate_file_against_xsd(xml_file, verbose=False)
+        return result, _BASELINE_CACHE.get(self._baseline_key(xml_file))
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -823,34 +964,53 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, xml_file, base_path, xml_doc=None, content=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        Args:
+            xml_file: Path to the XML file
+            base_path: Package root the file belongs to
+            xml_doc: Already parsed tree of xml_file (parsed here if None)
+            content: Bytes of the part, used instead of reading xml_file
+                (for parts read from a package rather than from disk)
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
+        # Clean ignorable namespaces if needed
+        relative_path = xml_file.relative_to(base_path)
+        clean_namespaces = bool(
+            relative_path.parts and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+        )
+
+        cache_key = self._xsd_cache_key(xml_file, schema_path, clean_namespaces, content)
+        cached = self._load_xsd_result(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._run_xsd_validation(
+            xml_file, schema_path, clean_namespaces, xml_doc, content
+        )
+        self._store_xsd_result(cache_key, result)
+        return result
+
+    def _run_xsd_validation(self, xml_file, schema_path, clean_namespaces, xml_doc, content):
         try:
             # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            schema = get_schema(schema_path)
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            # Load and preprocess XML (on a copy; xml_doc may be shared)
+            if xml_doc is None and content is not None:
+                xml_doc = lxml.etree.parse(io.BytesIO(content))
+            elif xml_doc is None:
+                with open(xml_file, "r") as f:
+                    xml_doc = lxml.etree.parse(f)
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
+            if clean_namespaces:
                 xml_doc = self._clean_ignorable_namespaces(xml_doc)
 
             # Validate
@@ -866,42 +1026,123 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
-    def _get_original_file_errors(self, xml_file):
+    def _xsd_cache_key(self, xml_file, schema_path, clean_namespaces, content=None):
+        """Key for a persisted XSD result: part content, schema files and options."""
+        if self.cache_dir is None:
+            return None
+        if self._schemas_signature is None:
+            signature = hashlib.sha1()
+            for path in sorted(self.schemas_dir.rglob("*")):
+                if path.is_file():
+                    stat = path.stat()
+                    signature.update(
+                        f"{path.relative_to(self.schemas_dir)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode()
+                    )
+            self._schemas_signature = signature.hexdigest()
+
+        key = hashlib.sha1()
+        key.update(
+            f"{type(self).__name__}\n{self._schemas_signature}\n"
+            f"{schema_path.relative_to(self.schemas_dir)}\n{clean_namespaces}\n".encode()
+        )
+        if content is None:
+            try:
+                content = Path(xml_file).read_bytes()
+            except OSError:
+                return None
+        key.update(content)
+        return key.hexdigest()
+
+    def _load_xsd_result(self, cache_key):
+        if cache_key is None:
+            return None
+        try:
+            with open(self.cache_dir / "xsd" / f"{cache_key}.json", "r") as f:
+                cached = json.load(f)
+            return cached["valid"], set(cached["errors"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_xsd_result(self, cache_key, result):
+        if cache_key is None:
+            return
+        is_valid, errors = result
+        path = self.cache_dir / "xsd" / f"{cache_key}.json"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"valid": is_valid, "errors": sorted(errors or ())}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _get_original_file_errors(self, xml_file, current_errors=None):
         """Get XSD validation errors from a single file in the original document.
 
+        The part is read from the original package in memory. Results are
+        memoised per part for the life of the process and, with a cache_dir,
+        persisted with the other XSD results by part content.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
+            current_errors: Errors of xml_file itself, reused if the part is
+                unchanged from the original
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        key = self._baseline_key(xml_file)
+        errors = _BASELINE_CACHE.get(key)
+        if errors is None:
+            errors = frozenset(self._compute_original_file_errors(xml_file, current_errors))
+            _BASELINE_CACHE[key] = errors
+        return set(errors)
+
+    def _compute_original_file_errors(self, xml_file, current_errors):
+        relative_path = xml_file.relative_to(self.unpacked_dir.resolve())
+        try:
+            content = self._original_package().read(relative_path.as_posix())
+        except KeyError:
+            # File didn't exist in original, so no original errors
+            return set()
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        if current_errors is not None:
+            try:
+                if xml_file.read_bytes() == content:
+                    return current_errors
+            except OSError:
+                pass
+
+        # Validate the part as if it were at the same place in unpacked_dir,
+        # so it maps to the same schema
+        is_valid, errors = self._validate_single_file_xsd(
+            self.unpacked_dir.resolve() / relative_path,
+            self.unpacked_dir.resolve(),
+            content=content,
+        )
+        return errors if errors else set()
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+    def _original_package(self):
+        """Return the original package as an open ZipFile, opening it once."""
+        if self._original_zip is None:
+            self._original_zip = zipfile.ZipFile(self.original_file, "r")
+        return self._original_zip
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+    def _baseline_key(self, xml_file):
+        """Key of a part's baseline errors in _BASELINE_CACHE.
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        The original file is identified by path, size and modification
+        time, so a rewritten original gets new baselines.
+        """
+        if self._original_id is None:
+            original = self.original_file.resolve()
+            stat = original.stat()
+            self._original_id = (str(original), stat.st_size, stat.st_mtime_ns)
+        relative_path = Path(xml_file).resolve().relative_to(self.unpacked_dir.resolve())
+        return (type(self).__name__, self._original_id, relative_path.as_posix())
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -28,8 +28,13 @@ Example usage:
 
     # Save changes
     editor.save()
+
+Lookups are served from indexes (by tag, attribute value and line number)
+built on the first get_node() call and kept up to date by the editing
+methods, so repeated lookups do not rescan the whole document.
 """
 
+import bisect
 import html
 from pathlib import Path
 from typing import Optional, Union
@@ -50,6 +55,13 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+
+    Lookups use indexes of the elements by tag, attribute and line, and
+    check every candidate against the current DOM, including its text.
+    Removing or moving nodes and changing text directly on the DOM is safe.
+    Elements added or attributes set directly, rather than through the
+    methods below, are not indexed: a lookup finding nothing rebuilds the
+    indexes, but one that finds an indexed match does not see them.
     """
 
     def __init__(self, xml_path):
@@ -73,6 +85,9 @@ class XMLEditor:
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
 
+        # Lookup indexes, built on first use (see _get_index)
+        self._index = None
+
     def get_node(
         self,
         tag: str,
@@ -109,40 +124,19 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        matches = self._find_nodes(tag, attrs, line_number, normalized_contains)
+        if not matches and tag != "*":
+            # Elements added or attributes set by editing the DOM directly are
+            # not indexed: confirm with a full scan, rebuilding if it differs
+            matches = self._find_nodes(
+                tag, attrs, line_number, normalized_contains, scan=True
+            )
+            if matches:
+                self._index = None
 
         if not matches:
             # Build descriptive error message
@@ -180,6 +174,87 @@ class XMLEditor:
             )
         return matches[0]
 
+    def _find_nodes(self, tag, attrs, line_number, contains, scan=False):
+        """Return the elements matching all get_node() filters.
+
+        Candidates come from the indexes, or from the whole DOM if scan is
+        True.
+        """
+        if scan or tag == "*":
+            candidates = self.dom.getElementsByTagName(tag)
+        else:
+            candidates = self._get_index().candidates(tag, attrs, line_number)
+
+        matches = []
+        for elem in candidates:
+            # Check line_number filter
+            if line_number is not None:
+                parse_pos = getattr(elem, "parse_position", (None,))
+                elem_line = parse_pos[0]
+
+                # Handle both single line number and range
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                else:
+                    if elem_line != line_number:
+                        continue
+
+            # Check attrs filter
+            if attrs is not None:
+                if not all(
+                    elem.getAttribute(attr_name) == attr_value
+                    for attr_name, attr_value in attrs.items()
+                ):
+                    continue
+
+            # Check contains filter
+            if contains is not None:
+                if contains not in self._get_element_text(elem):
+                    continue
+
+            # Index entries may be stale: skip elements no longer in the document
+            if not self._in_document(elem):
+                continue
+
+            # If all applicable filters passed, this is a match
+            matches.append(elem)
+        return matches
+
+    def _get_index(self):
+        """Return the lookup indexes, building them if needed."""
+        if self._index is None:
+            self._index = _NodeIndex(self.dom)
+        return self._index
+
+    def _in_document(self, node):
+        """Check whether node is (still) attached to the document."""
+        while node.parentNode is not None:
+            node = node.parentNode
+        return node is self.dom
+
+    def _elements(self, tag):
+        """Return all elements with tag currently in the document."""
+        return [
+            elem
+            for elem in self._get_index().candidates(tag, None, None)
+            if self._in_document(elem)
+        ]
+
+    def _nodes_changed(self, nodes):
+        """Update the indexes after nodes were inserted or changed in place.
+
+        The subtrees are indexed again on the next lookup.
+
+        Args:
+            nodes: DOM nodes in the document whose subtrees are new or changed
+        """
+        if self._index is None:
+            return
+        for node in nodes:
+            if node.nodeType == node.ELEMENT_NODE:
+                self._index.add(node)
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -222,6 +297,7 @@ class XMLEditor:
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        self._nodes_changed(nodes)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -246,6 +322,7 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self._nodes_changed(nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -266,6 +343,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self._nodes_changed(nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -285,12 +363,13 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self._nodes_changed(nodes)
         return nodes
 
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
         max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
+        for rel_elem in self._elements("Relationship"):
             rel_id = rel_elem.getAttribute("Id")
             if rel_id.startswith("rId"):
                 try:
@@ -343,6 +422,91 @@ class XMLEditor:
         return nodes
 
 
+class _NodeIndex:
+    """Lookup indexes over the elements of a DOM, filled lazily.
+
+    Indexes only ever grow: elements that were removed or changed since
+    they were indexed stay listed, so every candidate must be re-checked.
+    Element text is not indexed, as direct DOM edits would leave it stale.
+    """
+
+    def __init__(self, dom):
+        self.by_tag = {}  # tag -> {element: None}, in insertion order
+        self.by_attr = {}  # (tag, attribute) -> {value: {element: None}}
+        self.by_line = {}  # tag -> (sorted start lines, elements)
+        self._pending = [dom.documentElement] if dom.documentElement else []
+
+    def add(self, root):
+        """Index the elements of a subtree on the next lookup."""
+        self._pending.append(root)
+
+    def candidates(self, tag, attrs, line_number):
+        """Return elements that may match, a superset of the real matches."""
+        self._sync()
+        elements = self.by_tag.get(tag, {})
+        best = elements
+        if attrs:
+            for attr_name, attr_value in attrs.items():
+                bucket = self._attr_index(tag, attr_name).get(attr_value, {})
+                if len(bucket) < len(best):
+                    best = bucket
+        if line_number is not None and (
+            not isinstance(line_number, range) or line_number.step == 1
+        ):
+            in_lines = self._line_range(tag, line_number)
+            if len(in_lines) < len(best):
+                best = in_lines
+        return list(best)
+
+    def _sync(self):
+        """Index elements under subtrees added since the last lookup."""
+        pending, self._pending = self._pending, []
+        for root in pending:
+            stack = [root]
+            while stack:
+                elem = stack.pop()
+                tag = elem.tagName
+                self.by_tag.setdefault(tag, {})[elem] = None
+                for (index_tag, attr_name), values in self.by_attr.items():
+                    if index_tag == tag:
+                        values.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+                stack.extend(
+                    reversed([c for c in elem.childNodes if c.nodeType == c.ELEMENT_NODE])
+                )
+
+    def _attr_index(self, tag, attr_name):
+        values = self.by_attr.get((tag, attr_name))
+        if values is None:
+            values = {}
+            for elem in self.by_tag.get(tag, {}):
+                values.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+            self.by_attr[(tag, attr_name)] = values
+        return values
+
+    def _line_range(self, tag, line_number):
+        """Elements with tag whose start line is line_number (int or range)."""
+        entry = self.by_line.get(tag)
+        if entry is None:
+            # Only parsed elements have a line; elements added later have none
+            positioned = sorted(
+                (
+                    (elem.parse_position[0], elem)
+                    for elem in self.by_tag.get(tag, {})
+                    if hasattr(elem, "parse_position")
+                ),
+                key=lambda item: item[0],
+            )
+            entry = ([line for line, _ in positioned], [elem for _, elem in positioned])
+            self.by_line[tag] = entry
+
+        lines, elements = entry
+        if isinstance(line_number, range):
+            first, last = line_number.start, line_number.stop - 1
+        else:
+            first = last = line_number
+        return elements[bisect.bisect_left(lines, first) : bisect.bisect_right(lines, last)]
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Benchmark GIFBuilder on 60-frame 480x480 clips.
+
+Compares the previous pipeline (list of frames, per-frame PIL palette
+mapping, imageio encode of re-expanded RGB frames) with the current one
+(preallocated frame array, frames streamed to the encoder as changed-region
+sub-rectangles), both with the default dithering and with dither=False
+(vectorized lookup-table palette mapping). Reports wall time, peak traced
+memory and file size for a fully animated clip and a mostly static one,
+plus deduplicate_frames() timings.
+
+Usage:
+    python3 benchmarks/bench_gif_builder.py [--frames N] [--size PX] [--repeat N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.gif_builder import GIFBuilder
+
+
+def synthetic_clip(frame_count: int, size: int) -> list[np.ndarray]:
+    """Gradient background with moving colored discs, like a typical template."""
+    yy, xx = np.mgrid[0:size, 0:size]
+    background = np.stack(
+        [xx * 255 // size, yy * 255 // size, np.full_like(xx, 160)], axis=-1
+    ).astype(np.uint8)
+    colors = [(255, 80, 80), (80, 200, 120), (250, 220, 60), (90, 120, 255)]
+
+    frames = []
+    for i in range(frame_count):
+        frame = background.copy()
+        t = i / frame_count * 2 * np.pi
+        for k, color in enumerate(colors):
+            cx = size / 2 + size * 0.3 * np.cos(t + k * np.pi / 2)
+            cy = size / 2 + size * 0.3 * np.sin(2 * t + k)
+            mask = (xx - cx) ** 2 + (yy - cy) ** 2 < (size * 0.08) ** 2
+            frame[mask] = color
+        frames.append(frame)
+    return frames
+
+
+def static_clip(frame_count: int, size: int) -> list[np.ndarray]:
+    """Mostly static scene: one small sprite moving over a fixed background."""
+    frames = synthetic_clip(1, size) * frame_count
+    yy, xx = np.mgrid[0:size, 0:size]
+    for i in range(frame_count):
+        frames[i] = frames[i].copy()
+        cx = size * (0.2 + 0.6 * i / frame_count)
+        mask = (xx - cx) ** 2 + (yy - size / 2) ** 2 < (size * 0.05) ** 2
+        frames[i][mask] = (255, 255, 255)
+    return frames
+
+
+CLIPS = {
+    "moving": synthetic_clip,
+    "static": static_clip,
+}
+
+
+def legacy_deduplicate(frames: list[np.ndarray], threshold: float = 0.9995) -> list[np.ndarray]:
+    """The previous GIFBuilder.deduplicate_frames() loop, kept as the baseline."""
+    deduplicated = [frames[0]]
+    for i in range(1, len(frames)):
+        prev_frame = np.array(deduplicated[-1], dtype=np.float32)
+        curr_frame = np.array(frames[i], dtype=np.float32)
+        similarity = 1.0 - (np.mean(np.abs(prev_frame - curr_frame)) / 255.0)
+        if similarity < threshold:
+            deduplicated.append(frames[i])
+    return deduplicated
+
+
+def legacy_save(frames: list[np.ndarray], output_path: str, fps: int, num_colors: int = 128):
+    """The previous GIFBuilder.save() path, kept here as the baseline."""
+    import imageio.v3 as imageio
+
+    frames = [np.array(f) for f in frames]
+
+    sample_size = min(5, len(frames))
+    sample_indices = [int(i * len(frames) / sample_size) for i in range(sample_size)]
+    sample_frames = [frames[i] for i in sample_indices]
+    combined = np.vstack(sample_frames)
+    combined_img = Image.fromarray(combined)
+    global_palette = combined_img.quantize(colors=num_colors, method=2)
+
+    optimized = []
+    for frame in frames:
+        quantized = Image.fromarray(frame).quantize(palette=global_palette, dither=1)
+        optimized.append(np.array(quantized.convert("RGB")))
+
+    imageio.imwrite(output_path, optimized, duration=1000 / fps, loop=0)
+
+
+def current_save(
+    frames: list[np.ndarray], output_path: str, fps: int, num_colors: int = 128, dither: bool = True
+):
+    builder = GIFBuilder(
+        width=frames[0].shape[1], height=frames[0].shape[0], fps=fps, capacity=len(frames)
+    )
+    builder.add_frames(frames)
+    with contextlib.redirect_stdout(io.StringIO()):
+        builder.save(output_path, num_colors=num_colors, dither=dither)
+
+
+def undithered_save(frames: list[np.ndarray], output_path: str, fps: int):
+    current_save(frames, output_path, fps, dither=False)
+
+
+def measure(fn, frames, output_path, fps, repeat: int) -> tuple[float, float, int]:
+    """Return (best seconds, peak traced MB, output bytes)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(frames, output_path, fps)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(frames, output_path, fps)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 1024 / 1024, os.path.getsize(output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--size", type=int, default=480)
+    parser.add_argument("--fps", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.frames} frames @ {args.size}x{args.size}, best of {args.repeat}")
+
+    candidates = [("current", current_save), ("no dither", undithered_save)]
+    try:
+        import imageio.v3  # noqa: F401
+
+        candidates.insert(0, ("legacy", legacy_save))
+    except ImportError:
+        print("  (imageio not installed, skipping legacy baseline)")
+
+    for clip_name, make_clip in CLIPS.items():
+        frames = make_clip(args.frames, args.size)
+        print(f"{clip_name} clip")
+
+        results = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, fn in candidates:
+                output_path = os.path.join(tmp, f"{name}.gif")
+                seconds, peak_mb, size = measure(fn, frames, output_path, args.fps, args.repeat)
+                results[name] = seconds
+                print(
+                    f"  {name:9s} {seconds:7.3f} s   peak {peak_mb:7.1f} MB   "
+                    f"{size / 1024:7.1f} KB"
+                )
+        if "legacy" in results:
+            print(f"  speedup  {results['legacy'] / results['current']:.1f}x")
+
+        builder = GIFBuilder(args.size, args.size, args.fps, capacity=len(frames))
+        builder.add_frames(frames)
+        start = time.perf_counter()
+        legacy_deduplicate(frames)
+        legacy_dedupe = time.perf_counter() - start
+        start = time.perf_counter()
+        builder.deduplicate_frames()
+        current_dedupe = time.perf_counter() - start
+        print(
+            f"  deduplicate_frames: legacy {legacy_dedupe * 1000:.1f} ms, "
+            f"current {current_dedupe * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark ParticleSystem at 10k particles.
+
+Runs the same burst (plain, confetti and sparkle particles) through the
+array-backed ParticleSystem and through per-particle Particle objects, the
+previous implementation, and reports update and render time per frame.
+
+Usage:
+    python3 benchmarks/bench_particles.py [--particles N] [--frames N] [--size PX]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.visual_effects import ParticleSystem
+
+
+def burst(particles: int, size: int) -> ParticleSystem:
+    """A mixed burst of particles from the middle of the frame."""
+    system = ParticleSystem()
+    third = particles // 3
+    system.emit(size // 2, size // 2, count=third, speed=8, lifetime=40, size=4)
+    system.emit_confetti(size // 2, size // 3, count=third)
+    system.emit_sparkles(size // 2, size // 2, count=particles - 2 * third)
+    return system
+
+
+def run_legacy(system: ParticleSystem, frames: int, size: int) -> tuple[float, float, Image.Image]:
+    particles = system.particles
+    update = render = 0.0
+    frame = None
+    for _ in range(frames):
+        frame = Image.new('RGB', (size, size), (255, 255, 255))
+        start = time.perf_counter()
+        for particle in particles:
+            particle.update()
+        particles = [p for p in particles if p.is_alive()]
+        update += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for particle in particles:
+            particle.render(frame)
+        render += time.perf_counter() - start
+    return update, render, frame
+
+
+def run_current(system: ParticleSystem, frames: int, size: int) -> tuple[float, float, Image.Image]:
+    update = render = 0.0
+    frame = None
+    for _ in range(frames):
+        frame = Image.new('RGB', (size, size), (255, 255, 255))
+        start = time.perf_counter()
+        system.update()
+        update += time.perf_counter() - start
+
+        start = time.perf_counter()
+        system.render(frame)
+        render += time.perf_counter() - start
+    return update, render, frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--particles', type=int, default=10000)
+    parser.add_argument('--frames', type=int, default=30)
+    parser.add_argument('--size', type=int, default=480)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    start = time.perf_counter()
+    system = burst(args.particles, args.size)
+    emit_time = time.perf_counter() - start
+    legacy_system = burst(0, args.size)
+    legacy_system.__dict__.update({k: v.copy() for k, v in system.__dict__.items()})
+
+    print(f"{args.particles} particles, {args.frames} frames @ {args.size}x{args.size}")
+    print(f"  emit:    {emit_time * 1000:8.1f} ms")
+
+    results = {}
+    for name, run, source in (('legacy', run_legacy, legacy_system),
+                              ('current', run_current, system)):
+        update, render, frame = run(source, args.frames, args.size)
+        results[name] = (update + render, frame)
+        print(f"  {name:8s} update {update / args.frames * 1000:7.2f} ms/frame   "
+              f"render {render / args.frames * 1000:7.2f} ms/frame")
+
+    speedup = results['legacy'][0] / results['current'][0]
+    differing = (np.asarray(results['legacy'][1]) != np.asarray(results['current'][1])).any(-1).sum()
+    print(f"  speedup  {speedup:.1f}x   last frame differs in {differing} pixels")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,17 +7,99 @@ generated frames, with automatic optimization for Slack's requirements.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-import imageio.v3 as imageio
 import numpy as np
-from PIL import Image
+from PIL import GifImagePlugin, Image
+
+# Bits kept per channel when indexing the nearest-colour lookup table
+# (5 bits = 32x32x32 cells, 32K entries)
+LUT_BITS = 5
+
+# Frames palette-mapped per vectorized batch while encoding
+ENCODE_BATCH = 16
+
+
+def build_palette_lut(palette: np.ndarray, bits: int = LUT_BITS) -> np.ndarray:
+    """
+    Build a lookup table mapping quantized RGB to the nearest palette index.
+
+    Args:
+        palette: (K, 3) uint8 palette colors
+        bits: Bits kept per channel (table has 2**(3*bits) entries)
+
+    Returns:
+        uint8 array of palette indices, indexed by (r >> s) << 2b | (g >> s) << b | (b >> s)
+    """
+    levels = 1 << bits
+    shift = 8 - bits
+    # Centre of each quantized cell
+    axis = (np.arange(levels, dtype=np.float32) * (1 << shift)) + (1 << shift >> 1)
+    r, g, b = np.meshgrid(axis, axis, axis, indexing="ij")
+    cells = np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1)  # (levels**3, 3)
+
+    # |cell - color|^2 up to the per-cell constant |cell|^2, as one matrix product
+    pal = palette.astype(np.float32)
+    dist = (pal**2).sum(axis=1)[None, :] - 2 * (cells @ pal.T)
+    return dist.argmin(axis=1).astype(np.uint8)
+
+
+def map_to_palette(frames: np.ndarray, lut: np.ndarray, bits: int = LUT_BITS) -> np.ndarray:
+    """
+    Map RGB frames to palette indices with a lookup table, vectorized over all frames.
+
+    Args:
+        frames: (..., 3) uint8 RGB pixels, e.g. (N, H, W, 3)
+        lut: Table from build_palette_lut()
+
+    Returns:
+        (...) uint8 palette indices
+    """
+    quantized = frames >> (8 - bits)
+    idx = quantized[..., 0].astype(np.uint16) << (2 * bits)
+    idx |= quantized[..., 1].astype(np.uint16) << bits
+    idx |= quantized[..., 2]
+    return lut[idx]
+
+
+def frame_differences(previous: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """
+    Sum of absolute channel differences between frames, in integer arithmetic.
+
+    Args:
+        previous: (N, H, W, 3) or (H, W, 3) uint8 frames
+        current: Frames of the same shape
+
+    Returns:
+        (N,) int64 sums (or a scalar for single frames)
+    """
+    # max - min stays within uint8, so no widened copies of the frames
+    diff = np.maximum(previous, current)
+    diff -= np.minimum(previous, current)
+    return diff.reshape(*diff.shape[:-3], -1).sum(axis=-1, dtype=np.int64)
+
+
+def changed_bbox(previous: np.ndarray, current: np.ndarray) -> Optional[tuple]:
+    """
+    Bounding box of the pixels that differ between two palette-index frames.
+
+    Returns:
+        (left, top, right, bottom), or None if the frames are identical
+    """
+    changed = previous != current
+    rows = np.flatnonzero(changed.any(axis=1))
+    if not len(rows):
+        return None
+    cols = np.flatnonzero(changed.any(axis=0))
+    return (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
 
 
 class GIFBuilder:
     """Builder for creating optimized GIFs from frames."""
 
-    def __init__(self, width: int = 480, height: int = 480, fps: int = 15):
+    def __init__(
+        self, width: int = 480, height: int = 480, fps: int = 15, capacity: int = 0
+    ):
         """
         Initialize GIF builder.
 
@@ -25,11 +107,44 @@ class GIFBuilder:
             width: Frame width in pixels
             height: Frame height in pixels
             fps: Frames per second
+            capacity: Expected number of frames, preallocated up front (grows as needed)
         """
         self.width = width
         self.height = height
         self.fps = fps
-        self.frames: list[np.ndarray] = []
+        # Frames live in one preallocated (capacity, H, W, 3) uint8 array
+        self._buffer = np.empty((capacity, height, width, 3), dtype=np.uint8)
+        self._count = 0
+
+    @property
+    def frames(self) -> np.ndarray:
+        """All frames as an (N, H, W, 3) uint8 array (a view, not a copy)."""
+        return self._buffer[: self._count]
+
+    @frames.setter
+    def frames(self, frames: np.ndarray | list[np.ndarray]):
+        frames = np.asarray(frames, dtype=np.uint8)
+        if frames.ndim != 4:
+            frames = frames.reshape(0, self.height, self.width, 3)
+        self._buffer = np.ascontiguousarray(frames)
+        self._count = len(frames)
+        if self._count:
+            self.height, self.width = frames.shape[1:3]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _reserve(self, count: int):
+        """Grow the frame buffer to hold at least count frames."""
+        if count <= len(self._buffer) and self._buffer.shape[1:3] == (
+            self.height,
+            self.width,
+        ):
+            return
+        capacity = max(count, len(self._buffer) * 3 // 2, 8)
+        buffer = np.empty((capacity, self.height, self.width, 3), dtype=np.uint8)
+        buffer[: self._count] = self._buffer[: self._count]
+        self._buffer = buffer
 
     def add_frame(self, frame: np.ndarray | Image.Image):
         """
@@ -38,88 +153,181 @@ class GIFBuilder:
         Args:
             frame: Frame as numpy array or PIL Image (will be converted to RGB)
         """
+        size = (self.height, self.width)
         if isinstance(frame, Image.Image):
-            frame = np.array(frame.convert("RGB"))
-
-        # Ensure frame is correct size
-        if frame.shape[:2] != (self.height, self.width):
-            pil_frame = Image.fromarray(frame)
-            pil_frame = pil_frame.resize(
-                (self.width, self.height), Image.Resampling.LANCZOS
-            )
-            frame = np.array(pil_frame)
+            if frame.mode != "RGB":
+                frame = frame.convert("RGB")
+            if frame.size != (self.width, self.height):
+                frame = frame.resize((self.width, self.height), Image.Resampling.LANCZOS)
+            frame = np.asarray(frame)
+        elif frame.shape != (*size, 3) or frame.dtype != np.uint8:
+            pil_frame = Image.fromarray(frame).convert("RGB")
+            if pil_frame.size != (self.width, self.height):
+                # Ensure frame is correct size
+                pil_frame = pil_frame.resize(
+                    (self.width, self.height), Image.Resampling.LANCZOS
+                )
+            frame = np.asarray(pil_frame)
 
-        self.frames.append(frame)
+        self._reserve(self._count + 1)
+        self._buffer[self._count] = frame
+        self._count += 1
 
     def add_frames(self, frames: list[np.ndarray | Image.Image]):
         """Add multiple frames at once."""
+        if hasattr(frames, "__len__"):
+            self._reserve(self._count + len(frames))
         for frame in frames:
             self.add_frame(frame)
 
+    def build_palette(self, num_colors: int = 128) -> np.ndarray:
+        """
+        Build one palette for all frames from a sample of up to 5 frames.
+
+        Args:
+            num_colors: Target number of colors (8-256)
+
+        Returns:
+            (K, 3) uint8 palette colors, K <= num_colors
+        """
+        frames = self.frames
+        sample_size = min(5, len(frames))
+        sample_indices = [int(i * len(frames) / sample_size) for i in range(sample_size)]
+
+        # Combine sample frames into a single image for palette generation:
+        # stacking full frames vertically keeps it a proper RGB image
+        combined_img = Image.fromarray(
+            np.ascontiguousarray(frames[sample_indices].reshape(-1, self.width, 3)),
+            mode="RGB",
+        )
+        quantized = combined_img.quantize(colors=num_colors, method=2)
+        used = int(np.asarray(quantized).max()) + 1
+        palette = np.array(quantized.getpalette()[: used * 3], dtype=np.uint8)
+        return palette.reshape(-1, 3)
+
     def optimize_colors(
-        self, num_colors: int = 128, use_global_palette: bool = True
-    ) -> list[np.ndarray]:
+        self, num_colors: int = 128, use_global_palette: bool = True, dither: bool = True
+    ) -> np.ndarray:
         """
         Reduce colors in all frames using quantization.
 
+        With a global palette and no dithering, all frames are mapped in one
+        vectorized pass through a nearest-colour lookup table.
+
         Args:
             num_colors: Target number of colors (8-256)
             use_global_palette: Use a single palette for all frames (better compression)
+            dither: Floyd-Steinberg dither each frame with PIL (per frame, slower);
+                    False bands gradients but maps frames in one pass
 
         Returns:
-            List of color-optimized frames
+            (N, H, W, 3) array of color-optimized frames
         """
-        optimized = []
-
-        if use_global_palette and len(self.frames) > 1:
-            # Create a global palette from all frames
-            # Sample frames to build palette
-            sample_size = min(5, len(self.frames))
-            sample_indices = [
-                int(i * len(self.frames) / sample_size) for i in range(sample_size)
-            ]
-            sample_frames = [self.frames[i] for i in sample_indices]
-
-            # Combine sample frames into a single image for palette generation
-            # Flatten each frame to get all pixels, then stack them
-            all_pixels = np.vstack(
-                [f.reshape(-1, 3) for f in sample_frames]
-            )  # (total_pixels, 3)
-
-            # Create a properly-shaped RGB image from the pixel data
-            # We'll make a roughly square image from all the pixels
-            total_pixels = len(all_pixels)
-            width = min(512, int(np.sqrt(total_pixels)))  # Reasonable width, max 512
-            height = (total_pixels + width - 1) // width  # Ceiling division
-
-            # Pad if necessary to fill the rectangle
-            pixels_needed = width * height
-            if pixels_needed > total_pixels:
-                padding = np.zeros((pixels_needed - total_pixels, 3), dtype=np.uint8)
-                all_pixels = np.vstack([all_pixels, padding])
-
-            # Reshape to proper RGB image format (H, W, 3)
-            img_array = (
-                all_pixels[:pixels_needed].reshape(height, width, 3).astype(np.uint8)
+        if use_global_palette and len(self) > 1:
+            palette = self.build_palette(num_colors)
+            if not dither:
+                lut = build_palette_lut(palette)
+                return palette[map_to_palette(self.frames, lut)]
+
+            global_palette = _palette_image(palette)
+            optimized = np.empty_like(self.frames)
+            for i, frame in enumerate(self.frames):
+                quantized = Image.fromarray(frame).quantize(palette=global_palette, dither=1)
+                optimized[i] = np.asarray(quantized.convert("RGB"))
+            return optimized
+
+        # Use per-frame quantization
+        optimized = np.empty_like(self.frames)
+        for i, frame in enumerate(self.frames):
+            pil_frame = Image.fromarray(frame)
+            quantized = pil_frame.quantize(
+                colors=num_colors, method=2, dither=1 if dither else 0
             )
-            combined_img = Image.fromarray(img_array, mode="RGB")
-
-            # Generate global palette
-            global_palette = combined_img.quantize(colors=num_colors, method=2)
+            optimized[i] = np.asarray(quantized.convert("RGB"))
+        return optimized
 
-            # Apply global palette to all frames
-            for frame in self.frames:
-                pil_frame = Image.fromarray(frame)
-                quantized = pil_frame.quantize(palette=global_palette, dither=1)
-                optimized.append(np.array(quantized.convert("RGB")))
-        else:
-            # Use per-frame quantization
+    def _palette_indices(self, palette: np.ndarray, dither: bool) -> Iterator[np.ndarray]:
+        """Yield (H, W) palette index frames lazily, mapping ENCODE_BATCH frames at a time."""
+        if dither:
+            global_palette = _palette_image(palette)
             for frame in self.frames:
-                pil_frame = Image.fromarray(frame)
-                quantized = pil_frame.quantize(colors=num_colors, method=2, dither=1)
-                optimized.append(np.array(quantized.convert("RGB")))
+                quantized = Image.fromarray(frame).quantize(palette=global_palette, dither=1)
+                yield np.asarray(quantized)
+            return
 
-        return optimized
+        lut = build_palette_lut(palette)
+        for start in range(0, len(self), ENCODE_BATCH):
+            yield from map_to_palette(self.frames[start:start + ENCODE_BATCH], lut)
+
+    def _write_gif(self, output_path: Path, palette: np.ndarray, dither: bool) -> int:
+        """
+        Stream frames to a GIF file as changed-region sub-rectangles.
+
+        Each frame after the first only stores the bounding box of the pixels
+        that changed since the previous frame, drawn over it (disposal 1).
+        Unchanged pixels inside the box are set to a spare transparent palette
+        entry, and frames with no changes just extend the previous frame.
+
+        Returns:
+            Number of frames written to the file
+        """
+        transparency = len(palette) if len(palette) < 256 else None
+        palette_bytes = palette.tobytes()
+        if transparency is not None:
+            palette_bytes += b"\x00\x00\x00"
+        frame_duration = 1000 / self.fps
+
+        header_image = Image.new("P", (self.width, self.height))
+        header_image.putpalette(palette_bytes)
+        header, _ = GifImagePlugin.getheader(
+            header_image, info={"loop": 0}  # Infinite loop
+        )
+
+        written = 0
+
+        def write_frame(indices, offset, duration, params):
+            nonlocal written
+            written += 1
+            image = Image.fromarray(indices)
+            image.putpalette(palette_bytes)
+            for chunk in GifImagePlugin.getdata(
+                image, offset, duration=duration, disposal=1, **params
+            ):
+                fp.write(chunk)
+
+        with open(output_path, "wb") as fp:
+            for chunk in header:
+                fp.write(chunk)
+
+            # Each frame is written once the next shows whether it changed anything
+            previous = None
+            pending = None
+            for indices in self._palette_indices(palette, dither):
+                if previous is None:
+                    pending = [indices, (0, 0), frame_duration, {}]
+                    previous = indices
+                    continue
+
+                bbox = changed_bbox(previous, indices)
+                if bbox is None:
+                    pending[2] += frame_duration
+                    continue
+
+                write_frame(*pending)
+                left, top, right, bottom = bbox
+                region = indices[top:bottom, left:right]
+                params = {}
+                if transparency is not None:
+                    unchanged = previous[top:bottom, left:right] == region
+                    if unchanged.any():
+                        region = np.where(unchanged, np.uint8(transparency), region)
+                        params["transparency"] = transparency
+                pending = [region, (left, top), frame_duration, params]
+                previous = indices
+
+            write_frame(*pending)
+            fp.write(b";")  # GIF trailer
+        return written
 
     def deduplicate_frames(self, threshold: float = 0.9995) -> int:
         """
@@ -132,29 +340,39 @@ class GIFBuilder:
         Returns:
             Number of frames removed
         """
-        if len(self.frames) < 2:
+        frames = self.frames
+        if len(frames) < 2:
             return 0
 
-        deduplicated = [self.frames[0]]
-        removed_count = 0
+        # similarity = 1 - mean(|diff|) / 255, so a frame is kept when its
+        # summed absolute difference from the last kept frame exceeds this
+        limit = (1.0 - threshold) * 255.0 * frames[0].size
 
-        for i in range(1, len(self.frames)):
-            # Compare with previous frame
-            prev_frame = np.array(deduplicated[-1], dtype=np.float32)
-            curr_frame = np.array(self.frames[i], dtype=np.float32)
+        # Differences between consecutive frames, in one vectorized pass
+        consecutive = np.empty(len(frames) - 1, dtype=np.int64)
+        for start in range(0, len(frames) - 1, ENCODE_BATCH):
+            stop = min(start + ENCODE_BATCH, len(frames) - 1)
+            consecutive[start:stop] = frame_differences(
+                frames[start:stop], frames[start + 1:stop + 1]
+            )
 
-            # Calculate similarity (normalized)
-            diff = np.abs(prev_frame - curr_frame)
-            similarity = 1.0 - (np.mean(diff) / 255.0)
+        keep = [0]
+        for i in range(1, len(frames)):
+            last = keep[-1]
+            if last == i - 1:
+                difference = consecutive[i - 1]
+            else:
+                # Previous frame was dropped: compare with the last kept frame
+                difference = frame_differences(frames[last], frames[i])
 
             # Keep frame if sufficiently different
             # High threshold (0.9995+) means only remove nearly identical frames
-            if similarity < threshold:
-                deduplicated.append(self.frames[i])
-            else:
-                removed_count += 1
+            if difference > limit:
+                keep.append(i)
 
-        self.frames = deduplicated
+        removed_count = len(frames) - len(keep)
+        if removed_count:
+            self.frames = frames[keep]
         return removed_count
 
     def save(
@@ -163,6 +381,7 @@ class GIFBuilder:
         num_colors: int = 128,
         optimize_for_emoji: bool = False,
         remove_duplicates: bool = False,
+        dither: bool = True,
     ) -> dict:
         """
         Save frames as optimized GIF for Slack.
@@ -172,11 +391,16 @@ class GIFBuilder:
             num_colors: Number of colors to use (fewer = smaller file)
             optimize_for_emoji: If True, optimize for emoji size (128x128, fewer colors)
             remove_duplicates: If True, remove duplicate consecutive frames (opt-in)
+            dither: Floyd-Steinberg dither frames (smoother gradients). False
+                    maps frames through a lookup table: faster and usually
+                    smaller files, but gradients band
 
         Returns:
-            Dictionary with file info (path, size, dimensions, frame_count)
+            Dictionary with file info (path, size, dimensions, frame_count).
+            frame_count is the number of frames in the file, which is lower
+            than len(self) when unchanged frames were merged.
         """
-        if not self.frames:
+        if not len(self):
             raise ValueError("No frames to save. Add frames with add_frame() first.")
 
         output_path = Path(output_path)
@@ -195,14 +419,12 @@ class GIFBuilder:
                 print(
                     f"  Resizing from {self.width}x{self.height} to 128x128 for emoji"
                 )
-                self.width = 128
-                self.height = 128
                 # Resize all frames
-                resized_frames = []
-                for frame in self.frames:
+                resized_frames = np.empty((len(self), 128, 128, 3), dtype=np.uint8)
+                for i, frame in enumerate(self.frames):
                     pil_frame = Image.fromarray(frame)
                     pil_frame = pil_frame.resize((128, 128), Image.Resampling.LANCZOS)
-                    resized_frames.append(np.array(pil_frame))
+                    resized_frames[i] = np.asarray(pil_frame)
                 self.frames = resized_frames
             num_colors = min(num_colors, 48)  # More aggressive color limit for emoji
 
@@ -213,23 +435,16 @@ class GIFBuilder:
                 )
                 # Keep every nth frame to get close to 12 frames
                 keep_every = max(1, len(self.frames) // 12)
-                self.frames = [
-                    self.frames[i] for i in range(0, len(self.frames), keep_every)
-                ]
+                self.frames = self.frames[::keep_every]
 
-        # Optimize colors with global palette
-        optimized_frames = self.optimize_colors(num_colors, use_global_palette=True)
-
-        # Calculate frame duration in milliseconds
-        frame_duration = 1000 / self.fps
+        # Optimize colors with a global palette; frames are palette-mapped
+        # in batches as the encoder consumes them
+        # (at most 255 colors, leaving a palette entry for transparency)
+        palette = self.build_palette(min(num_colors, 255))
 
         # Save GIF
-        imageio.imwrite(
-            output_path,
-            optimized_frames,
-            duration=frame_duration,
-            loop=0,  # Infinite loop
-        )
+        # Unchanged frames are merged into the previous one's duration
+        frame_count = self._write_gif(output_path, palette, dither)
 
         # Get file info
         file_size_kb = output_path.stat().st_size / 1024
@@ -240,9 +455,9 @@ class GIFBuilder:
             "size_kb": file_size_kb,
             "size_mb": file_size_mb,
             "dimensions": f"{self.width}x{self.height}",
-            "frame_count": len(optimized_frames),
+            "frame_count": frame_count,
             "fps": self.fps,
-            "duration_seconds": len(optimized_frames) / self.fps,
+            "duration_seconds": len(self) / self.fps,
             "colors": num_colors,
         }
 
@@ -251,7 +466,7 @@ class GIFBuilder:
         print(f"  Path: {output_path}")
         print(f"  Size: {file_size_kb:.1f} KB ({file_size_mb:.2f} MB)")
         print(f"  Dimensions: {self.width}x{self.height}")
-        print(f"  Frames: {len(optimized_frames)} @ {self.fps} fps")
+        print(f"  Frames: {frame_count} @ {self.fps} fps")
         print(f"  Duration: {info['duration_seconds']:.1f}s")
         print(f"  Colors: {num_colors}")
 
@@ -265,5 +480,16 @@ class GIFBuilder:
         return info
 
     def clear(self):
-        """Clear all frames (useful for creating multiple GIFs)."""
-        self.frames = []
+        """
+        Clear all frames (useful for creating multiple GIFs).
+
+        The frame buffer is kept for reuse by the next GIF of the same size.
+        """
+        self._count = 0
+
+
+def _palette_image(palette: np.ndarray) -> Image.Image:
+    """Wrap palette colors in a "P" image usable as Image.quantize(palette=...)."""
+    image = Image.new("P", (1, 1))
+    image.putpalette(palette.tobytes())
+    return image
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Render Farm - Batch-render many template GIFs in parallel from a manifest.
+
+A manifest lists template parameter sets (for example every color x text x
+template combination of an emoji campaign). Each job renders its frames in a
+worker process, streams them through GIFBuilder and validates the result.
+
+Usage:
+    python3 -m core.render_farm manifest.json [--out-dir DIR] [--workers N]
+
+Manifest format (JSON):
+    {
+        "defaults": {"width": 128, "height": 128, "fps": 15, "num_colors": 48},
+        "jobs": [
+            {
+                "template": "bounce",
+                "output": "bounce_{color}.gif",
+                "params": {"object_type": "circle", "num_frames": 20},
+                "vary": {"color": [[255, 0, 0], [0, 120, 255]]}
+            }
+        ]
+    }
+
+"template" names a module in templates/ and "function" its render function
+(default: create_<template>_animation). "vary" renders one GIF per
+combination of the listed values, which are merged into "params" (dotted
+keys such as "object_data.color" set nested values) and can be used in the
+output name, along with {template} and {index}. Job keys override "defaults".
+Every GIF must get its own output name; a manifest writing one file twice
+is rejected.
+"""
+
+import argparse
+import contextlib
+import copy
+import importlib
+import inspect
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+SKILL_ROOT = Path(__file__).parent.parent
+if str(SKILL_ROOT) not in sys.path:
+    sys.path.insert(0, str(SKILL_ROOT))
+
+from core.color_palettes import EMOJI_PALETTES, PALETTES, get_emoji_palette, get_palette
+from core.gif_builder import GIFBuilder
+from core.typography import TYPOGRAPHY_SCALE, get_font
+from core.validators import validate_gif
+
+# Settings a job may set besides template/function/output/params/vary
+JOB_DEFAULTS = {
+    "width": 480,
+    "height": 480,
+    "fps": 15,
+    "num_colors": 128,
+    "optimize_for_emoji": False,
+    "remove_duplicates": False,
+    "is_emoji": None,  # None = decide from dimensions (<= 128 px is an emoji)
+}
+
+
+@dataclass
+class RenderJob:
+    """One GIF to render."""
+
+    template: str
+    output: str
+    params: dict = field(default_factory=dict)
+    function: Optional[str] = None
+    width: int = 480
+    height: int = 480
+    fps: int = 15
+    num_colors: int = 128
+    optimize_for_emoji: bool = False
+    remove_duplicates: bool = False
+    is_emoji: Optional[bool] = None
+
+
+def _tuples(value: Any) -> Any:
+    """Convert JSON lists to tuples, as templates expect RGB tuples."""
+    if isinstance(value, list):
+        return tuple(_tuples(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _tuples(v) for k, v in value.items()}
+    return value
+
+
+def _set_param(params: dict, key: str, value: Any):
+    """Set params[key], where a dotted key sets a value in a nested dict."""
+    *parents, name = key.split(".")
+    for parent in parents:
+        params = params.setdefault(parent, {})
+    params[name] = value
+
+
+def _format_name(value: Any) -> str:
+    """Short file-name-safe text for a varied value."""
+    if isinstance(value, (list, tuple)):
+        return "-".join(_format_name(v) for v in value)
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in str(value))
+
+
+def expand_manifest(manifest: dict) -> list[RenderJob]:
+    """
+    Expand a manifest into individual render jobs.
+
+    Args:
+        manifest: Parsed manifest (see module docstring)
+
+    Returns:
+        List of RenderJob, one per GIF
+
+    Raises:
+        ValueError: If a job has no template or two GIFs get the same output
+    """
+    defaults = {**JOB_DEFAULTS, **manifest.get("defaults", {})}
+    jobs = []
+    outputs = {}  # normalized output path -> index of the job spec writing it
+
+    for index, spec in enumerate(manifest.get("jobs", [])):
+        if "template" not in spec:
+            raise ValueError(f"Job {index} has no 'template'")
+        spec = {**defaults, **spec}
+        vary = spec.pop("vary", {}) or {}
+        base_params = _tuples(spec.pop("params", {}) or {})
+        output = spec.pop("output", "{template}_{index}.gif")
+
+        # Dotted keys are named with underscores in the output pattern
+        output = re.sub(r"\{([\w.]+)\}", lambda m: "{" + m.group(1).replace(".", "_") + "}", output)
+
+        keys = list(vary)
+        for combo in itertools.product(*(vary[k] for k in keys)):
+            params = copy.deepcopy(base_params)
+            names = {"template": spec["template"], "index": len(jobs)}
+            for key, value in zip(keys, combo):
+                _set_param(params, key, _tuples(value))
+                names[key.replace(".", "_")] = _format_name(value)
+
+            path = output.format(**names)
+            # Workers would overwrite each other's file without any error
+            previous = outputs.get(os.path.normpath(path))
+            if previous == index:
+                raise ValueError(
+                    f"Job {index} writes '{path}' for more than one 'vary' combination: "
+                    f"use every 'vary' key or {{index}} in its 'output'"
+                )
+            if previous is not None:
+                raise ValueError(f"Jobs {previous} and {index} both write '{path}'")
+            outputs[os.path.normpath(path)] = index
+            jobs.append(RenderJob(output=path, params=params, **spec))
+
+    return jobs
+
+
+def load_manifest(path: str | Path) -> list[RenderJob]:
+    """Read a JSON manifest file and expand it into render jobs."""
+    with open(path, "r", encoding="utf-8") as f:
+        return expand_manifest(json.load(f))
+
+
+def warm_caches():
+    """
+    Load fonts and palettes once, before worker processes start.
+
+    Workers forked from a warmed parent share these caches instead of each
+    loading font files again.
+    """
+    for size in TYPOGRAPHY_SCALE.values():
+        get_font(size, bold=False)
+        get_font(size, bold=True)
+    for name in PALETTES:
+        get_palette(name)
+    for name in EMOJI_PALETTES:
+        get_emoji_palette(name)
+
+
+def _template_function(job: RenderJob):
+    module = importlib.import_module(f"templates.{job.template}")
+    name = job.function or f"create_{job.template}_animation"
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        raise ValueError(f"Template '{job.template}' has no function '{name}'") from None
+
+
+def render_job(job: RenderJob, out_dir: str | Path = ".") -> dict:
+    """
+    Render, save and validate one GIF.
+
+    Args:
+        job: Job to render
+        out_dir: Directory for the output file
+
+    Returns:
+        Result dict (output, ok, passes, frame_count, size_kb, seconds, error)
+    """
+    start = time.perf_counter()
+    output_path = Path(out_dir) / job.output
+    result = {"output": str(output_path), "template": job.template, "ok": False,
+              "passes": False, "frame_count": 0, "size_kb": 0.0, "error": None}
+
+    try:
+        render = _template_function(job)
+        params = dict(job.params)
+        # Pass the job's frame size to templates that take one
+        accepted = inspect.signature(render).parameters
+        for size_name, value in (("frame_width", job.width), ("frame_height", job.height),
+                                 ("width", job.width), ("height", job.height)):
+            if size_name in accepted:
+                params.setdefault(size_name, value)
+
+        frames = render(**params)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        builder = GIFBuilder(job.width, job.height, job.fps, capacity=len(frames))
+        builder.add_frames(frames)
+        del frames
+        with contextlib.redirect_stdout(io.StringIO()):
+            info = builder.save(
+                output_path,
+                num_colors=job.num_colors,
+                optimize_for_emoji=job.optimize_for_emoji,
+                remove_duplicates=job.remove_duplicates,
+            )
+
+        is_emoji = job.is_emoji
+        if is_emoji is None:
+            is_emoji = job.optimize_for_emoji or max(job.width, job.height) <= 128
+        passes, details = validate_gif(output_path, is_emoji=is_emoji, verbose=False)
+
+        result.update(
+            ok=True,
+            passes=passes,
+            frame_count=details.get("frame_count", info["frame_count"]),
+            size_kb=info["size_kb"],
+        )
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def render_all(
+    jobs: list[RenderJob], out_dir: str | Path = ".", workers: Optional[int] = None
+) -> Iterator[dict]:
+    """
+    Render jobs in a process pool, yielding results as they complete.
+
+    Args:
+        jobs: Jobs to render
+        out_dir: Directory for output files
+        workers: Worker processes (default: CPU count; 1 renders in-process)
+
+    Yields:
+        Result dicts from render_job(), in completion order
+    """
+    warm_caches()
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield render_job(job, out_dir)
+        return
+
+    # Fork shares the warmed caches and imported modules with the workers
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(render_job, job, out_dir) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-render template GIFs from a manifest")
+    parser.add_argument("manifest", help="JSON manifest of template parameter sets")
+    parser.add_argument("--out-dir", default=".", help="Directory for rendered GIFs")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--report", help="Write per-GIF results to this JSON file")
+    parser.add_argument("--quiet", action="store_true", help="Only print the summary")
+    args = parser.parse_args()
+
+    jobs = load_manifest(args.manifest)
+    if not jobs:
+        print("Manifest has no jobs")
+        return 1
+
+    print(f"Rendering {len(jobs)} GIFs...")
+    start = time.perf_counter()
+    results = []
+    for result in render_all(jobs, args.out_dir, args.workers):
+        results.append(result)
+        if args.quiet:
+            continue
+        if result["error"]:
+            print(f"  ✗ {result['output']}: {result['error']}")
+        else:
+            status = "✓" if result["passes"] else "!"
+            print(f"  {status} {result['output']} ({result['frame_count']} frames, "
+                  f"{result['size_kb']:.1f} KB, {result['seconds']:.2f}s)")
+    elapsed = time.perf_counter() - start
+
+    rendered = [r for r in results if r["ok"]]
+    failed = len(results) - len(rendered)
+    not_passing = sum(1 for r in rendered if not r["passes"])
+
+    print(f"\n✓ Rendered {len(rendered)}/{len(results)} GIFs in {elapsed:.1f}s "
+          f"({len(rendered) / elapsed:.1f} GIFs/sec)")
+    if not_passing:
+        print(f"  {not_passing} GIFs do not meet Slack's dimension guidelines")
+    if failed:
+        print(f"  {failed} GIFs failed to render")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"elapsed_seconds": elapsed,
+                       "gifs_per_second": len(rendered) / elapsed,
+                       "results": results}, f, indent=2)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
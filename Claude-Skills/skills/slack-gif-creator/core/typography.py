@@ -7,6 +7,7 @@ in GIFs, with outlines for readability and effects for visual impact.
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 from typing import Optional
 
 
@@ -22,16 +23,20 @@ TYPOGRAPHY_SCALE = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     """
     Get a font with fallback support.
 
+    Fonts are cached per (size, bold), so repeated text rendering does not
+    reload font files from disk.
+
     Args:
         size: Font size in pixels
         bold: Use bold variant if available
 
     Returns:
-        ImageFont object
+        ImageFont object (shared - do not modify)
     """
     # Try multiple font paths for cross-platform support
     font_paths = [
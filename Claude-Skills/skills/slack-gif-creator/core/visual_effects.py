@@ -10,8 +10,12 @@ from PIL import Image, ImageDraw, ImageFilter
 import numpy as np
 import math
 import random
+from functools import lru_cache
 from typing import Optional
 
+# Shape codes used by ParticleSystem's arrays (anything else is not drawn)
+PARTICLE_SHAPES = ('circle', 'square', 'star')
+
 
 class Particle:
     """A single particle in a particle system."""
@@ -103,12 +107,111 @@ class Particle:
             draw.line(points, fill=color, width=2)
 
 
+@lru_cache(maxsize=None)
+def _particle_stamp(shape: str, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pixel offsets covered by a particle shape, relative to its position.
+
+    Drawn once with the same ImageDraw calls as Particle.render(), so batched
+    rendering is pixel-identical (apart from PIL's rounding of wide lines
+    clipped at the top/left frame edge).
+
+    Returns:
+        (dy, dx) int arrays of offsets
+    """
+    margin = size + 2
+    canvas = Image.new('L', (2 * margin + 1, 2 * margin + 1), 0)
+    draw = ImageDraw.Draw(canvas)
+    x = y = margin
+
+    if shape == 'circle':
+        draw.ellipse([x - size, y - size, x + size, y + size], fill=255)
+    elif shape == 'square':
+        draw.rectangle([x - size, y - size, x + size, y + size], fill=255)
+    elif shape == 'star':
+        points = [
+            (x, y - size),
+            (x - size // 2, y),
+            (x, y),
+            (x, y + size),
+            (x, y),
+            (x + size // 2, y),
+        ]
+        draw.line(points, fill=255, width=2)
+
+    dy, dx = np.nonzero(np.asarray(canvas))
+    return dy - margin, dx - margin
+
+
 class ParticleSystem:
-    """Manages a collection of particles."""
+    """
+    Manages a collection of particles.
+
+    Particles are stored as parallel NumPy arrays (one entry per particle),
+    so physics updates and rendering run over all particles at once. The
+    results match updating and rendering each Particle individually.
+    """
+
+    # Per-particle arrays, in emission order
+    _FIELDS = ('x', 'y', 'vx', 'vy', 'lifetime', 'max_lifetime',
+               'color', 'size', 'shape', 'gravity', 'drag')
 
     def __init__(self):
         """Initialize particle system."""
-        self.particles: list[Particle] = []
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.vx = np.empty(0)
+        self.vy = np.empty(0)
+        self.lifetime = np.empty(0)
+        self.max_lifetime = np.empty(0)
+        self.color = np.empty((0, 3), dtype=np.uint8)
+        self.size = np.empty(0, dtype=np.int32)
+        self.shape = np.empty(0, dtype=np.int8)
+        self.gravity = np.empty(0)
+        self.drag = np.empty(0)
+
+    @property
+    def particles(self) -> list[Particle]:
+        """Snapshot of the active particles as Particle objects."""
+        particles = []
+        for i in range(self.get_particle_count()):
+            shape = int(self.shape[i])
+            particle = Particle(
+                float(self.x[i]), float(self.y[i]), float(self.vx[i]), float(self.vy[i]),
+                float(self.max_lifetime[i]), tuple(int(c) for c in self.color[i]),
+                int(self.size[i]), PARTICLE_SHAPES[shape] if shape >= 0 else 'unknown'
+            )
+            particle.lifetime = float(self.lifetime[i])
+            particle.gravity = float(self.gravity[i])
+            particle.drag = float(self.drag[i])
+            particles.append(particle)
+        return particles
+
+    def _add(self, x: float, y: float, vx: np.ndarray, vy: np.ndarray,
+             lifetime: np.ndarray, color, size, shape,
+             gravity: float = 0.5, drag: float = 0.98):
+        """Append particles; scalar arguments are shared by all of them."""
+        count = len(vx)
+        shape_codes = np.array(
+            [PARTICLE_SHAPES.index(s) if s in PARTICLE_SHAPES else -1
+             for s in np.broadcast_to(np.asarray(shape, dtype=object), count)],
+            dtype=np.int8
+        )
+        new = {
+            'x': np.full(count, x, dtype=np.float64),
+            'y': np.full(count, y, dtype=np.float64),
+            'vx': vx,
+            'vy': vy,
+            'lifetime': lifetime,
+            'max_lifetime': lifetime.copy(),
+            'color': np.broadcast_to(np.asarray(color, dtype=np.uint8), (count, 3)),
+            'size': np.broadcast_to(np.asarray(size, dtype=np.int32), count),
+            'shape': shape_codes,
+            'gravity': np.full(count, gravity, dtype=np.float64),
+            'drag': np.full(count, drag, dtype=np.float64),
+        }
+        for field in self._FIELDS:
+            setattr(self, field, np.concatenate([getattr(self, field), new[field]]))
 
     def emit(self, x: int, y: int, count: int = 10,
              spread: float = 2.0, speed: float = 5.0,
@@ -127,18 +230,17 @@ class ParticleSystem:
             size: Particle size
             shape: Particle shape
         """
-        for _ in range(count):
-            # Random angle and speed
-            angle = random.uniform(0, 2 * math.pi)
-            vel_mag = random.uniform(speed * 0.5, speed * 1.5)
-            vx = math.cos(angle) * vel_mag
-            vy = math.sin(angle) * vel_mag
+        rng = _rng()
 
-            # Random lifetime variation
-            life = random.uniform(lifetime * 0.7, lifetime * 1.3)
+        # Random angle and speed
+        angle = rng.uniform(0, 2 * math.pi, count)
+        vel_mag = rng.uniform(speed * 0.5, speed * 1.5, count)
 
-            particle = Particle(x, y, vx, vy, life, color, size, shape)
-            self.particles.append(particle)
+        # Random lifetime variation
+        life = rng.uniform(lifetime * 0.7, lifetime * 1.3, count)
+
+        self._add(x, y, np.cos(angle) * vel_mag, np.sin(angle) * vel_mag,
+                  life, color, size, shape)
 
     def emit_confetti(self, x: int, y: int, count: int = 20,
                       colors: Optional[list[tuple[int, int, int]]] = None):
@@ -156,17 +258,16 @@ class ParticleSystem:
                 (107, 185, 240), (162, 155, 254), (255, 182, 193)
             ]
 
-        for _ in range(count):
-            color = random.choice(colors)
-            vx = random.uniform(-3, 3)
-            vy = random.uniform(-8, -2)
-            shape = random.choice(['square', 'circle'])
-            size = random.randint(2, 4)
-            lifetime = random.uniform(40, 60)
+        rng = _rng()
+        color = np.asarray(colors, dtype=np.uint8)[rng.integers(0, len(colors), count)]
+        vx = rng.uniform(-3, 3, count)
+        vy = rng.uniform(-8, -2, count)
+        shape = np.array(['square', 'circle'], dtype=object)[rng.integers(0, 2, count)]
+        size = rng.integers(2, 5, count)
+        lifetime = rng.uniform(40, 60, count)
 
-            particle = Particle(x, y, vx, vy, lifetime, color, size, shape)
-            particle.gravity = 0.3  # Lighter gravity for confetti
-            self.particles.append(particle)
+        # Lighter gravity for confetti
+        self._add(x, y, vx, vy, lifetime, color, size, shape, gravity=0.3)
 
     def emit_sparkles(self, x: int, y: int, count: int = 15):
         """
@@ -178,36 +279,89 @@ class ParticleSystem:
         """
         colors = [(255, 255, 200), (255, 255, 255), (255, 255, 150)]
 
-        for _ in range(count):
-            color = random.choice(colors)
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            lifetime = random.uniform(15, 30)
+        rng = _rng()
+        color = np.asarray(colors, dtype=np.uint8)[rng.integers(0, len(colors), count)]
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(1, 3, count)
+        lifetime = rng.uniform(15, 30, count)
 
-            particle = Particle(x, y, vx, vy, lifetime, color, 2, 'star')
-            particle.gravity = 0
-            particle.drag = 0.95
-            self.particles.append(particle)
+        self._add(x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+                  lifetime, color, 2, 'star', gravity=0, drag=0.95)
 
     def update(self):
         """Update all particles."""
-        # Update alive particles
-        for particle in self.particles:
-            particle.update()
+        # Apply physics
+        self.vy += self.gravity
+        self.vx *= self.drag
+        self.vy *= self.drag
+
+        # Update position
+        self.x += self.vx
+        self.y += self.vy
+
+        # Decrease lifetime
+        self.lifetime -= 1
 
         # Remove dead particles
-        self.particles = [p for p in self.particles if p.is_alive()]
+        alive = self.lifetime > 0
+        if not alive.all():
+            for field in self._FIELDS:
+                setattr(self, field, getattr(self, field)[alive])
 
     def render(self, frame: Image.Image):
         """Render all particles to frame."""
-        for particle in self.particles:
-            particle.render(frame)
+        alive = np.flatnonzero((self.lifetime > 0) & (self.shape >= 0))
+        if not len(alive):
+            return
+        if frame.mode not in ('RGB', 'RGBA'):
+            for particle in self.particles:
+                particle.render(frame)
+            return
+
+        # Fade color and size with remaining lifetime
+        alpha = np.clip(self.lifetime[alive] / self.max_lifetime[alive], 0, 1)
+        colors = (self.color[alive] * alpha[:, None]).astype(np.uint8)
+        sizes = np.maximum(1, (self.size[alive] * alpha).astype(np.int64))
+        xs = self.x[alive].astype(np.int64)
+        ys = self.y[alive].astype(np.int64)
+        shapes = self.shape[alive]
+
+        # Collect covered pixels per (shape, size) group, then draw them all
+        # at once; where particles overlap, the last emitted stays on top
+        width, height = frame.size
+        pixel_y, pixel_x, owners = [], [], []
+        for shape, size in set(zip(shapes.tolist(), sizes.tolist())):
+            members = np.flatnonzero((shapes == shape) & (sizes == size))
+            dy, dx = _particle_stamp(PARTICLE_SHAPES[shape], size)
+            pixel_y.append((ys[members, None] + dy).ravel())
+            pixel_x.append((xs[members, None] + dx).ravel())
+            owners.append(np.repeat(members, len(dy)))
+
+        pixel_y = np.concatenate(pixel_y)
+        pixel_x = np.concatenate(pixel_x)
+        owners = np.concatenate(owners)
+        inside = (pixel_x >= 0) & (pixel_x < width) & (pixel_y >= 0) & (pixel_y < height)
+        flat = (pixel_y * width + pixel_x)[inside]
+
+        # Highest (last emitted) particle index covering each pixel
+        top = np.full(width * height, -1, dtype=np.intp)
+        np.maximum.at(top, flat, owners[inside])
+        covered = np.flatnonzero(top >= 0)
+
+        pixels = np.array(frame)
+        pixels.reshape(-1, pixels.shape[-1])[covered, :3] = colors[top[covered]]
+        if frame.mode == 'RGBA':
+            pixels.reshape(-1, 4)[covered, 3] = 255
+        frame.paste(Image.fromarray(pixels))
 
     def get_particle_count(self) -> int:
         """Get number of active particles."""
-        return len(self.particles)
+        return len(self.x)
+
+
+def _rng() -> np.random.Generator:
+    """NumPy generator seeded from the random module, so random.seed() still applies."""
+    return np.random.default_rng(random.getrandbits(64))
 
 
 def add_motion_blur(frame: Image.Image, prev_frame: Optional[Image.Image],